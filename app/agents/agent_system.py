@@ -1,15 +1,50 @@
 import abc
+import asyncio
+import concurrent.futures
+import contextvars
 import random
-import time
 import traceback
+import weakref
 
-import regex
-from typing import Dict, List, Optional, Tuple, Any, Iterator, Callable
-from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Any, Iterator, Callable, Coroutine, Union
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 from abc import ABC, abstractmethod
 from models.anthropic import AnthropicLLM
-from models.base import Message, BaseModel
+from models.base import Message, BaseModel, StreamEvent
+from models.scaffolding import ParsedResponse, parsed_response
+from agents.budget import DebateBudget, charge_usage, conversation_depth, conversation_scope, current_budget
+from agents.registry import AgentRegistry, CustomData
+from telemetry.tracing import Tracer, current_tracer, reset_tracer, use_tracer
+
+
+def _rng_state(rng) -> list:
+    """State of a random.Random instance (or the `random` module) as JSON-friendly lists."""
+    version, internal_state, gauss_next = rng.getstate()
+    return [version, list(internal_state), gauss_next]
+
+
+def _set_rng_state(rng, state: list):
+    version, internal_state, gauss_next = state
+    rng.setstate((version, tuple(internal_state), gauss_next))
+
+
+def run_coroutine_sync(coroutine: Coroutine) -> Any:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Uses asyncio.run() when no event loop is running in this thread. When called from
+    inside a running loop (e.g. a synchronous watcher that starts a nested debate), the
+    coroutine runs on a fresh loop in a worker thread so the caller's loop is not re-entered.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        # Carry context variables (e.g. the current tracer) over to the worker thread
+        return executor.submit(contextvars.copy_context().run, asyncio.run, coroutine).result()
 
 
 class AgentType(Enum):
@@ -60,20 +95,113 @@ class ValidityChecker(ABC):
         """Check if message is valid."""
         pass
 
+    def check_partial(self, parsed: ParsedResponse, config: Any, participant_state: Any) -> RejectionResult:
+        """
+        Check a message that is still being generated, given the tags written inside its
+        <Content> so far. Only report violations that no further output can fix (so the
+        finished message is sure to fail check()); used to stop streaming generation early.
+        """
+        return RejectionResult.valid()
+
 
 @dataclass
 class AgentState:
-    """Tracks the state of each agent."""
+    """Tracks the state of each agent. Changes are reported to the AgentRegistry holding it."""
     persona: Persona
     has_withdrawn: bool = False
     message_count: int = 0
     custom_data: Dict[str, Any] = field(default_factory=dict)
 
+    def __setattr__(self, name: str, value: Any):
+        if name == "custom_data" and not isinstance(value, CustomData):
+            value = CustomData(value, self)
+        super().__setattr__(name, value)
+        registry = self.__dict__.get("_registry")
+        if registry is not None:
+            registry._refresh(self)
+
 
 class AgentOrchestrator:
     pass
 
 
+class SpeakerPolicy(ABC):
+    """
+    Chooses which participant speaks next. The orchestrator decides when the coordinator
+    intervenes (see AgentOrchestrator.generate_next_speaker); the policy picks among the
+    active participants the rest of the time. Built-in policies beyond the default are
+    in agents.scheduling.
+    """
+
+    @abstractmethod
+    def choose(self, orchestrator: AgentOrchestrator, last_speaker: Optional[str]) -> Optional[str]:
+        """
+        Pick the next participant.
+
+        Args:
+            orchestrator: The conversation (agents, messages, rng, ...)
+            last_speaker: Speaker of the previous turn (may be "coordinator")
+
+        Returns:
+            An active participant's name, or None when no participant is active
+        """
+        pass
+
+    def state_dict(self) -> Dict[str, Any]:
+        """JSON-serializable policy state, saved with the conversation."""
+        return {}
+
+    def load_state_dict(self, state: Dict[str, Any]):
+        pass
+
+
+class WeightedRandomPolicy(SpeakerPolicy):
+    """
+    The default policy: whisper targets usually answer (80%), the last speaker does not
+    speak twice in a row, and the others are drawn with weights favoring whoever has
+    spoken least (AgentOrchestrator.speaker_weight), tripled for a whisper target.
+    """
+
+    @staticmethod
+    def whisper_target(orchestrator: AgentOrchestrator) -> Optional[str]:
+        """The active participant the last message was whispered to, if any."""
+        if not orchestrator.messages:
+            return None
+        last_msg = orchestrator.messages[-1]
+        if not last_msg.is_whisper or not last_msg.speaking_to:
+            return None
+        target = last_msg.speaking_to.lower()
+        return target if orchestrator.agents.is_active(target) else None
+
+    def choose(self, orchestrator: AgentOrchestrator, last_speaker: Optional[str]) -> Optional[str]:
+        agents = orchestrator.agents
+        if not agents.active_count():
+            return None
+
+        last_message_was_whisper = bool(orchestrator.messages) and orchestrator.messages[-1].is_whisper
+        whisper_target = self.whisper_target(orchestrator)
+
+        # If last message was a whisper, heavily favor the whisper target responding
+        if whisper_target:
+            # 80% chance the whisper target responds
+            if orchestrator.rng.random() < 0.8:
+                return whisper_target
+
+        # Weighted draw over the active agents (see speaker_weight), adjusted for this turn
+        overrides = {}
+
+        # Remove last speaker to avoid back-and-forth (unless it was a whisper, or they are the only one left)
+        if (last_speaker and agents.is_active(last_speaker.lower()) and not last_message_was_whisper
+                and agents.active_count() > 1):
+            overrides[last_speaker.lower()] = 0
+
+        # If this was a whisper target, give them extra weight
+        if whisper_target:
+            overrides[whisper_target] = agents.speaking_weight(whisper_target) * 3
+
+        return agents.sample(orchestrator.rng, overrides)
+
+
 class AgentOrchestratorAPI:
     pass
 
@@ -110,15 +238,41 @@ class DebateWatcher(abc.ABC):
     def __call__(self, current_speaker, orchestrator_api: AgentOrchestratorAPI):
         pass
 
+    async def acall(self, current_speaker, orchestrator_api: AgentOrchestratorAPI):
+        """Async tick used by run_conversation_async. Override when the watcher does its own I/O."""
+        self(current_speaker, orchestrator_api)
+
+    def state_dict(self) -> Dict[str, Any]:
+        """JSON-serializable progress of the watcher, saved in debate journals. Override if the watcher keeps state."""
+        return {}
+
+    def load_state_dict(self, state: Dict[str, Any]):
+        """Restore progress saved by state_dict() when a debate is resumed."""
+        pass
+
+    async def aclose(self):
+        """Called when the conversation ends. Override to stop work the watcher runs in the background."""
+        pass
+
 
 class CoordinatorConfig:
-    """Configuration for Coordinator behavior."""
+    """
+    Configuration for Coordinator behavior.
+
+    Args:
+        intervention_interval: Messages between coordinator interventions
+        escalation_thresholds: Message counts at which urgency rises a level
+        budget_thresholds: Remaining budget shares (e.g. [0.5, 0.25, 0.1]) at which urgency
+            rises a level instead, whenever a DebateBudget applies to the conversation
+    """
 
     def __init__(self,
                  intervention_interval: int = 4,
-                 escalation_thresholds: List[int] = None):
+                 escalation_thresholds: List[int] = None,
+                 budget_thresholds: List[float] = None):
         self.intervention_interval = intervention_interval
         self.escalation_thresholds = escalation_thresholds or [20, 35, 50]
+        self.budget_thresholds = budget_thresholds
 
 
 class AgentOrchestrator:
@@ -133,7 +287,8 @@ class AgentOrchestrator:
                  coordinator_config: CoordinatorConfig = None,
                  validity_checkers: List[ValidityChecker] = None,
                  goals: List[Goal] = None,
-                 watchers: List[DebateWatcher] = None):
+                 watchers: List[DebateWatcher] = None,
+                 budget: Optional[DebateBudget] = None):
         self.llm = llm
         self.messages: List[Message] = []
         self.conversation_topic = conversation_topic
@@ -146,7 +301,38 @@ class AgentOrchestrator:
         self.conversation_active = True
         self.message_count = 0
         self.max_messages = 100
-        self.agents: Dict[str, AgentState] = {}
+        self.turn_delay = 0.5
+        # Picks the participant of each turn between coordinator interventions (agents.scheduling
+        # has more policies than the default)
+        self.speaker_policy: SpeakerPolicy = WeightedRandomPolicy()
+        # Source of randomness for speaker selection. Defaults to the global `random` module;
+        # assign random.Random(seed) to make this conversation reproducible on its own
+        self.rng = random
+        # Tracing/metrics sink (telemetry.tracing.MetricsTracer). None reports to the tracer of
+        # the enclosing conversation, if any, and otherwise disables tracing
+        self.tracer: Optional[Tracer] = None
+        # Token, cost, time and nesting limits shared with every nested meta-debate
+        # (agents.budget.DebateBudget). None uses the budget of the enclosing conversation, if any
+        self.budget: Optional[DebateBudget] = budget
+        # Whether the last run ended because the budget ran out
+        self.stopped_on_budget = False
+        # Let every active participant respond to the same transcript at once, one round per turn
+        # (see _run_round), instead of one speaker per turn
+        self.simultaneous_rounds = False
+        # Stream participant responses (partial-message events, early cutoff on violations)
+        self.stream_responses = False
+        self.stream_listener: Optional[Callable[[StreamEvent], None]] = None
+        # Append-only checkpoint log (agents.journal.DebateJournal) written before every turn
+        self.journal = None
+        # Replaces old history with per-viewer rolling summaries (agents.compaction.HistoryCompactor)
+        self.history_compactor = None
+        # Incremented whenever earlier history stops applying as-is (ChainOfDebate: on every goal
+        # transition). Messages keep their raw content; older epochs are masked when shown to agents
+        self.epoch = 0
+        self._masked_views = weakref.WeakKeyDictionary()
+        # Agent states by lowercase name, indexed so that turns never scan every agent
+        self.agents = AgentRegistry(lambda state: state.persona.agent_type == AgentType.PARTICIPANT,
+                                    self.speaker_weight)
 
         # Coordinator tracking
         self.last_intervention = 0
@@ -185,6 +371,19 @@ class AgentOrchestrator:
 
         return RejectionResult.valid()
 
+    def validate_partial(self, parsed: ParsedResponse, agent_name: str) -> RejectionResult:
+        """Run the partial checks on a message that is still being generated."""
+        agent_state = self.agents[agent_name.lower()]
+        if agent_state.persona.agent_type == AgentType.COORDINATOR:
+            return RejectionResult.valid()
+
+        for checker in self.validity_checkers:
+            result = checker.check_partial(parsed, self.get_validation_config(), agent_state)
+            if not result.is_valid:
+                return result
+
+        return RejectionResult.valid()
+
     def get_validation_config(self) -> Any:
         """Override this to provide configuration for validators."""
         return None
@@ -208,20 +407,21 @@ Please resubmit following the proper format."""
 
     def parse_response_fields(self, message: Message) -> Tuple[Dict[str, Any], List[str]]:
         """Parse custom fields and achieved goals from message."""
-        full_response = message.to_prompt()
+        parsed = parsed_response(message)
 
-        # Extract achieved goals using regex
-        achieved_goals = []
-        goal_matches = regex.findall(r"<GoalAchieved>(?:\s|\n)*([^<]+?)(?:\s|\n)*</GoalAchieved>", full_response)
-        achieved_goals.extend([goal.strip() for goal in goal_matches])
+        # Achieved goals come from the message's <GoalAchieved> tags
+        achieved_goals = list(parsed.goals_achieved)
 
         # Override this for custom field parsing
-        custom_fields = self.parse_custom_fields(full_response)
+        custom_fields = self.parse_custom_fields(parsed)
 
         return custom_fields, achieved_goals
 
-    def parse_custom_fields(self, full_response: str) -> Dict[str, Any]:
-        """Override this to parse domain-specific fields."""
+    def parse_custom_fields(self, full_response: Union[str, ParsedResponse]) -> Dict[str, Any]:
+        """
+        Override this to parse domain-specific fields. Receives the message's ParsedResponse;
+        use parse_scaffolding() if you also accept raw response text.
+        """
         return {}
 
     def update_achieved_goals(self, achieved_goal_names: List[str], message_content: str):
@@ -235,15 +435,33 @@ Please resubmit following the proper format."""
 
     def get_active_agents(self) -> List[str]:
         """Get list of agents who haven't withdrawn (excludes Coordinator)."""
-        return [name for name, state in self.agents.items()
-                if not state.has_withdrawn and state.persona.agent_type == AgentType.PARTICIPANT]
+        return self.agents.active()
 
     def should_coordinator_intervene(self) -> bool:
         """Determine if Coordinator should intervene."""
         return self.message_count - self.last_intervention >= self.coordinator_config.intervention_interval
 
+    def effective_budget(self) -> Optional[DebateBudget]:
+        """The budget this conversation spends: its own, or else the enclosing conversation's."""
+        return self.budget or current_budget()
+
+    def budget_escalation_level(self) -> Optional[int]:
+        """
+        Escalation level (0 to 3) from the remaining budget, or None when the coordinator
+        escalates on message counts (no budget_thresholds, or no budget applies).
+        """
+        thresholds = getattr(self.coordinator_config, "budget_thresholds", None)
+        budget = self.effective_budget()
+        if not thresholds or budget is None:
+            return None
+        remaining = budget.remaining()
+        return sum(remaining <= threshold for threshold in thresholds)
+
     def get_coordinator_urgency_level(self) -> str:
         """Determine the urgency level for Coordinator interventions."""
+        level = self.budget_escalation_level()
+        if level is not None:
+            return ["normal", "elevated", "urgent", "critical"][level]
         thresholds = self.coordinator_config.escalation_thresholds
 
         if self.message_count >= thresholds[2]:
@@ -274,51 +492,19 @@ Please ensure proper formatting in responses."""
             return f"""📋 Process reminder - Message {self.message_count}"""
 
     def generate_next_speaker(self, last_speaker: str) -> Optional[str]:
-        """Determine who should speak next."""
+        """Determine who should speak next: the coordinator when due, otherwise the speaker policy's pick."""
         # Check if Coordinator should intervene
         if self.should_coordinator_intervene() and last_speaker != "coordinator":
             return "coordinator"
+        return self.speaker_policy.choose(self, last_speaker)
 
-        active_agents = self.get_active_agents()
-        if not active_agents:
-            return None
-
-        # Check if last message was a whisper
-        last_message_was_whisper = False
-        whisper_target = None
-        if self.messages:
-            last_msg = self.messages[-1]
-            last_message_was_whisper = last_msg.is_whisper
-            whisper_target = last_msg.speaking_to if last_message_was_whisper else None
-
-        # If last message was a whisper, heavily favor the whisper target responding
-        if last_message_was_whisper and whisper_target:
-            whisper_target_lower = whisper_target.lower()
-            if whisper_target_lower in active_agents:
-                # 80% chance the whisper target responds
-                if random.random() < 0.8:
-                    return whisper_target_lower
-
-        # Remove last speaker to avoid back-and-forth (unless it was a whisper)
-        if last_speaker and last_speaker.lower() in active_agents and not last_message_was_whisper:
-            active_agents.remove(last_speaker.lower())
-
-        if not active_agents:
-            active_agents = self.get_active_agents()
-
-        # Weight by message count (less = more likely to speak)
-        weights = []
-        for agent_name in active_agents:
-            agent_state = self.agents[agent_name]
-            weight = max(1, 10 - agent_state.message_count)
-
-            # If this was a whisper target, give them extra weight
-            if last_message_was_whisper and whisper_target and agent_name == whisper_target.lower():
-                weight *= 3  # Triple their likelihood
-
-            weights.append(weight)
-
-        return random.choices(active_agents, weights=weights)[0]
+    def speaker_weight(self, state: AgentState) -> int:
+        """
+        Base weight of an active participant in next-speaker sampling, by message count
+        (less = more likely to speak). Recomputed whenever the agent's state changes, so it
+        should only depend on the state.
+        """
+        return max(1, 10 - state.message_count)
 
     def determine_speaking_to(self, speaker: str, last_speaker: str) -> Optional[str]:
         """Determine who the speaker might be addressing."""
@@ -327,14 +513,13 @@ Please ensure proper formatting in responses."""
         if speaker_state.persona.agent_type == AgentType.COORDINATOR:
             return None  # Coordinator addresses the group
 
-        if last_speaker and random.random() < 0.3:
+        if last_speaker and self.rng.random() < 0.3:
             return last_speaker
         return None
 
     def all_agents_withdrawn(self) -> bool:
         """Check if all agents (excluding Coordinator) have withdrawn."""
-        return all(state.has_withdrawn for name, state in self.agents.items()
-                   if state.persona.agent_type == AgentType.PARTICIPANT)
+        return not self.agents.active_count()
 
     def get_shared_system_prompt(self) -> str:
         """Generate the shared system prompt for all agents. Override for customization."""
@@ -351,7 +536,59 @@ Please ensure proper formatting in responses."""
             content=system_prompt,
             speaker="system"
         )
-        return [system_msg] + self.messages
+        history = self.history_view()
+        if self.history_compactor is not None:
+            return [system_msg] + self.history_compactor.compact(speaker, history)
+        return [system_msg] + history
+
+    def mask_content(self, message: Message) -> str:
+        """
+        Content of a message from an earlier epoch as shown to the agents. Override to hide
+        what no longer applies; the message itself must not be modified.
+        """
+        return message.content
+
+    def _masked_view(self, message: Message) -> Message:
+        cached = self._masked_views.get(message)
+        if cached is not None and cached[0] == message.revision:
+            return cached[1]
+        content = self.mask_content(message)
+        if cached is None:
+            view = Message(message.id, content, message.speaker, message.timestamp, message.artifacts,
+                           message.speaking_to, message.is_whisper, message.thoughts, message.private_predictions)
+            view.epoch = message.epoch
+        else:
+            # The message was edited: update the view the transcript caches hold, bumping its revision
+            view = cached[1]
+            for name in Message.RENDERED_FIELDS:
+                value = content if name == "content" else getattr(message, name)
+                if getattr(view, name) != value:
+                    setattr(view, name, value)
+        self._masked_views[message] = (message.revision, view)
+        return view
+
+    def history_view(self, start: int = 0) -> List[Message]:
+        """
+        The conversation as the agents see it: messages from earlier epochs are replaced by
+        views with their mask_content(). Views are built once per message (and again only if the
+        message is edited), so the raw messages and every cache keyed on them stay intact.
+
+        Args:
+            start: Position of the first message to include
+        """
+        messages = self.messages[start:] if start else self.messages
+        if not self.epoch:
+            return messages
+        return [self._masked_view(message) if message.epoch < self.epoch else message
+                for message in messages]
+
+    def _append_message(self, message: Message, insert_at: Optional[int] = None):
+        """Add a message to the conversation, tagged with the current epoch."""
+        message.epoch = self.epoch
+        if insert_at is None:
+            self.messages.append(message)
+        else:
+            self.messages.insert(insert_at, message)
 
     def print_message(self, message: Message, custom_fields: Dict[str, Any], achieved_goals: List[str]):
         """Print a message with custom information."""
@@ -431,8 +668,251 @@ Please ensure proper formatting in responses."""
                 if goal.achieved and goal.achievement_message:
                     print(f"      Context: {goal.achievement_message[:100]}...")
 
+    async def generate_response(self, speaker: str, messages: List[Message]) -> Message:
+        """Generate a participant response without blocking the event loop."""
+        if isinstance(self.llm, BaseModel):
+            if self.stream_responses:
+                return await self.llm.astream(
+                    speaker=speaker, messages=messages, stop_sequences=["</Message>"],
+                    on_event=self.stream_listener,
+                    should_abort=lambda parsed: not self.validate_partial(parsed, speaker).is_valid
+                )
+            return await self.llm.acall(speaker=speaker, messages=messages, stop_sequences=["</Message>"])
+
+        # Plain callables (e.g. test doubles) only implement the synchronous contract
+        return await asyncio.to_thread(self.llm, speaker=speaker, messages=messages, stop_sequences=["</Message>"])
+
+    async def notify_watchers(self, current_speaker: str):
+        """Tick every watcher once, in order."""
+        api = AgentOrchestratorAPI(self)
+        tracer = current_tracer()
+        for watcher in self.watchers:
+            watcher_name = type(watcher).__name__
+            tracer.count("watcher_calls", watcher=watcher_name)
+            with tracer.span("watcher", watcher=watcher_name):
+                # calls the watchers one at a time
+                if isinstance(watcher, DebateWatcher):
+                    await watcher.acall(current_speaker, api)
+                else:
+                    watcher(current_speaker, api)
+
+    def _record_usage(self, tracer: Tracer, speaker: str, message: Message):
+        """Count the API token usage attached to a generated message, and charge it to the budget."""
+        charge_usage(message)
+        usage = getattr(message, "usage", None)
+        if not tracer.enabled or not isinstance(usage, dict):
+            return
+        for kind, tokens in usage.items():
+            tracer.count("tokens", tokens, speaker=speaker, kind=kind)
+
+    def state_dict(self) -> Dict[str, Any]:
+        """
+        JSON-serializable conversation state apart from the messages: counters, agent states,
+        goals, the speaker-selection RNG, watcher progress and the spend of the debate's own
+        budget. Saved by debate journals.
+        """
+        state = {
+            "message_count": self.message_count,
+            "epoch": self.epoch,
+            "rejection_count": self.rejection_count,
+            "last_intervention": self.last_intervention,
+            "conversation_active": self.conversation_active,
+            "agents": {name: {"has_withdrawn": state.has_withdrawn, "message_count": state.message_count,
+                              "custom_data": state.custom_data}
+                       for name, state in self.agents.items()},
+            "goals": [asdict(goal) for goal in self.goals],
+            "rng": _rng_state(self.rng),
+            "speaker_policy": self.speaker_policy.state_dict(),
+            "watchers": [watcher.state_dict() if isinstance(watcher, DebateWatcher) else None
+                         for watcher in self.watchers],
+        }
+        if self.budget is not None:
+            state["budget"] = self.budget.state_dict()
+        return state
+
+    def load_state_dict(self, state: Dict[str, Any]):
+        """Restore state saved by state_dict(). Agents must already be set up with the same personas."""
+        unknown = set(state["agents"]) - set(self.agents)
+        if unknown:
+            raise ValueError(f"Saved state has agents that are not set up: {', '.join(sorted(unknown))}")
+        self.message_count = state["message_count"]
+        self.epoch = state.get("epoch", 0)
+        self.rejection_count = state["rejection_count"]
+        self.last_intervention = state["last_intervention"]
+        self.conversation_active = state["conversation_active"]
+        for name, agent_state in state["agents"].items():
+            self.agents[name].has_withdrawn = agent_state["has_withdrawn"]
+            self.agents[name].message_count = agent_state["message_count"]
+            self.agents[name].custom_data = dict(agent_state["custom_data"])
+        self.goals = [Goal(**goal) for goal in state["goals"]]
+        _set_rng_state(self.rng, state["rng"])
+        self.speaker_policy.load_state_dict(state.get("speaker_policy", {}))
+        for watcher, watcher_state in zip(self.watchers, state["watchers"]):
+            if isinstance(watcher, DebateWatcher) and watcher_state is not None:
+                watcher.load_state_dict(watcher_state)
+        if self.budget is not None and "budget" in state:
+            self.budget.load_state_dict(state["budget"])
+
+    def archived_transcripts(self) -> List[List[Message]]:
+        """
+        Transcripts moved out of `messages`, oldest first. Journals save each one once, when
+        it first appears, instead of with every checkpoint. Conversations archive nothing by default.
+        """
+        return []
+
+    def restore_archived_transcripts(self, archives: List[List[Message]]):
+        """Restore transcripts saved from archived_transcripts() when a debate is resumed."""
+        pass
+
     def run_conversation(self):
-        """Run the automated conversation."""
+        """Run the automated conversation. Thin wrapper around run_conversation_async()."""
+        return run_coroutine_sync(self.run_conversation_async())
+
+    async def run_conversation_async(self, first_speaker: str = "coordinator"):
+        """
+        Run the automated conversation on the current event loop.
+
+        Args:
+            first_speaker: Agent taking the first turn (resumed debates continue with the saved next speaker)
+        """
+        # Debates without their own tracer (e.g. meta-debates run by a watcher) report to the enclosing one
+        tracer = self.tracer or current_tracer()
+        token = use_tracer(tracer)
+        try:
+            with tracer.span("conversation", topic=self.conversation_topic), \
+                    conversation_scope(self.budget or current_budget()):
+                return await self._run_conversation_loop(tracer, first_speaker)
+        finally:
+            for watcher in self.watchers:
+                if isinstance(watcher, DebateWatcher):
+                    await watcher.aclose()
+            if self.history_compactor is not None:
+                await self.history_compactor.aclose()
+            reset_tracer(token)
+
+    async def _accept_response(self, tracer: Tracer, speaker: str, response_msg: Message) -> bool:
+        """
+        Validate a generated message and, if it passes, record it: agent state, goals,
+        transcript, output and watchers. A rejected participant message is answered by
+        the coordinator instead.
+
+        Returns:
+            Whether the message was accepted
+        """
+        agent_state = self.agents[speaker]
+
+        # Validate message for regular participants
+        if agent_state.persona.agent_type == AgentType.PARTICIPANT:
+            with tracer.span("validation"):
+                validation_result = self.validate_message(response_msg, speaker)
+            if not validation_result.is_valid:
+                print(f"❌ Message rejected: {validation_result.rejection_reason}")
+
+                # Coordinator intervenes with rejection response
+                rejection_response = self.create_rejection_response(speaker, validation_result.rejection_reason)
+                self._append_message(rejection_response)
+                self.message_count += 1
+                self.rejection_count += 1
+                tracer.count("rejections", speaker=speaker)
+
+                # Print rejection message
+                print(f"\n[{self.message_count}] ❌ Coordinator → {self.agents[speaker.lower()].persona.name}:")
+                print(f"    {rejection_response.content}")
+                return False
+
+        # Parse response fields
+        with tracer.span("parse_fields"):
+            custom_fields, achieved_goals = self.parse_response_fields(response_msg)
+
+        # Update agent state
+        agent_state.message_count += 1
+        self.update_agent_state(speaker, custom_fields)
+
+        # Update achieved goals
+        if achieved_goals:
+            self.update_achieved_goals(achieved_goals, response_msg.content)
+
+        # Update Coordinator tracking
+        if speaker == "coordinator":
+            self.last_intervention = self.message_count
+
+        # Add to conversation
+        self._append_message(response_msg)
+        self.message_count += 1
+
+        # Print the message
+        with tracer.span("print"):
+            self.print_message(response_msg, custom_fields, achieved_goals)
+        tracer.count("turns", speaker=speaker)
+
+        with tracer.span("watchers"):
+            await self.notify_watchers(speaker)
+        return True
+
+    async def _run_round(self, tracer: Tracer, last_speaker: str) -> Optional[str]:
+        """
+        One simultaneous round: every active participant generates against the same
+        transcript snapshot concurrently, then the responses are validated and appended
+        in agent order (not in order of arrival), so a seeded round is reproducible.
+
+        Each prompt is built for its own speaker, so whispers stay visible only to their
+        participants; a whisper sent during the round is first seen in the next one.
+        Participants that have withdrawn sit rounds out. A rejected participant gets the
+        coordinator's rejection and tries again in the next round. Responses left over
+        when the round reaches `max_messages`, ends the conversation or completes the
+        goal are dropped.
+
+        Returns:
+            The next speaker ("coordinator" when it should intervene; any participant
+            starts another round), or None when the conversation is over
+        """
+        speakers = self.get_active_agents()
+        if not speakers:
+            print(f"\n🏁 All participants have withdrawn!")
+            self.conversation_active = False
+            return None
+
+        print(f"\n🤔 {', '.join(self.agents[speaker].persona.name for speaker in speakers)} "
+              f"are considering their responses...")
+        with tracer.span("system_prompt"):
+            prompts = [self.add_system_message(speaker) for speaker in speakers]
+
+        async def generate(speaker: str, messages: List[Message]) -> Message:
+            with tracer.span("generate", speaker=speaker):
+                return await self.generate_response(speaker, messages)
+
+        responses = await asyncio.gather(*(generate(speaker, messages) for speaker, messages in zip(speakers, prompts)),
+                                         return_exceptions=True)
+        for speaker, response_msg in zip(speakers, responses):
+            if isinstance(response_msg, BaseException):
+                raise response_msg
+            self._record_usage(tracer, speaker, response_msg)
+        tracer.count("rounds")
+
+        epoch = self.epoch
+        for position, (speaker, response_msg) in enumerate(zip(speakers, responses)):
+            if not self.conversation_active or self.message_count >= self.max_messages or self.epoch != epoch:
+                print(f"\n⏭️  Dropped {len(speakers) - position} responses of the round: the conversation moved on")
+                break
+            await self._accept_response(tracer, speaker, response_msg)
+            last_speaker = speaker
+
+        if not self.conversation_active:
+            return None
+        next_speaker = self.generate_next_speaker(last_speaker)
+        if not next_speaker:
+            print(f"\n🏁 No active participants remaining!")
+            self.conversation_active = False
+        return next_speaker
+
+    def _checkpoint(self, next_speaker: str):
+        """Journal the state between two turns, if this conversation is journaled."""
+        if self.journal is not None:
+            with current_tracer().span("journal"):
+                self.journal.record(self, next_speaker)
+
+    async def _run_conversation_loop(self, tracer: Tracer, first_speaker: str = "coordinator"):
+        """The turn loop of run_conversation_async(), reporting each phase to `tracer`."""
         print(f"🏛️  AGENT CONVERSATION STARTING")
         print(f"Topic: {self.conversation_topic}")
         print(
@@ -441,96 +921,70 @@ Please ensure proper formatting in responses."""
             print(f"Goals: {', '.join([goal.name for goal in self.goals])}")
         print("=" * 70)
 
-        # Start with a random participant
-        current_speaker = "coordinator"
+        current_speaker = first_speaker
 
         while self.conversation_active and self.message_count < self.max_messages:
+            budget = current_budget()
+            if budget is not None and (conversation_depth() > 1 or budget.stop_debate) and budget.exhausted():
+                # Nested conversations always end with the budget; the primary debate unless opted out
+                kind = "nested conversation" if conversation_depth() > 1 else "debate"
+                print(f"\n💸 Budget exhausted, ending {kind} ({budget.summary()})")
+                self.stopped_on_budget = True
+                break
+            self._checkpoint(current_speaker)
             try:
-                if self.all_agents_withdrawn():
-                    print(f"\n🏁 All participants have withdrawn!")
-                    self.conversation_active = False
-                    break
-
-                # Get messages with system prompt
-                messages_with_system = self.add_system_message(current_speaker)
-
-                # Determine speaking target
-                agent_state = self.agents[current_speaker]
-                print(f"\n🤔 {agent_state.persona.name} is considering their response...")
-
-                if current_speaker == "coordinator":
-                    # Coordinator message
-                    urgency_level = self.get_coordinator_urgency_level()
-                    coordinator_content = self.get_coordinator_message_content(urgency_level)
-                    response_msg = Message.make(
-                        content=coordinator_content,
-                        speaker=current_speaker
-                    )
-                else:
-                    # Generate response for regular participants
-                    response_msg = self.llm(
-                        speaker=current_speaker,
-                        messages=messages_with_system,
-                        stop_sequences=["</Message>"]
-                    )
-
-                # Validate message for regular participants
-                if agent_state.persona.agent_type == AgentType.PARTICIPANT:
-                    validation_result = self.validate_message(response_msg, current_speaker)
-                    if not validation_result.is_valid:
-                        print(f"❌ Message rejected: {validation_result.rejection_reason}")
-
-                        # Coordinator intervenes with rejection response
-                        rejection_response = self.create_rejection_response(current_speaker,
-                                                                            validation_result.rejection_reason)
-                        self.messages.append(rejection_response)
-                        self.message_count += 1
-                        self.rejection_count += 1
-
-                        # Print rejection message
-                        print(
-                            f"\n[{self.message_count}] ❌ Coordinator → {self.agents[current_speaker.lower()].persona.name}:")
-                        print(f"    {rejection_response.content}")
-
+                if self.simultaneous_rounds and current_speaker != "coordinator":
+                    with tracer.span("round"):
+                        current_speaker = await self._run_round(tracer, current_speaker)
+                    if current_speaker is None:
+                        break
+                    with tracer.span("turn_delay"):
+                        await asyncio.sleep(self.turn_delay)
+                    continue
+
+                with tracer.span("turn", speaker=current_speaker):
+                    if self.all_agents_withdrawn():
+                        print(f"\n🏁 All participants have withdrawn!")
+                        self.conversation_active = False
+                        break
+
+                    # Get messages with system prompt
+                    with tracer.span("system_prompt"):
+                        messages_with_system = self.add_system_message(current_speaker)
+
+                    # Determine speaking target
+                    agent_state = self.agents[current_speaker]
+                    print(f"\n🤔 {agent_state.persona.name} is considering their response...")
+
+                    if current_speaker == "coordinator":
+                        # Coordinator message
+                        urgency_level = self.get_coordinator_urgency_level()
+                        coordinator_content = self.get_coordinator_message_content(urgency_level)
+                        response_msg = Message.make(
+                            content=coordinator_content,
+                            speaker=current_speaker
+                        )
+                    else:
+                        # Generate response for regular participants
+                        with tracer.span("generate", speaker=current_speaker):
+                            response_msg = await self.generate_response(current_speaker, messages_with_system)
+                        self._record_usage(tracer, current_speaker, response_msg)
+
+                    if not await self._accept_response(tracer, current_speaker, response_msg):
                         # Give same participant another chance
                         continue
 
-                # Parse response fields
-                custom_fields, achieved_goals = self.parse_response_fields(response_msg)
-
-                # Update agent state
-                agent_state.message_count += 1
-                self.update_agent_state(current_speaker, custom_fields)
+                    # Determine next speaker
+                    with tracer.span("next_speaker"):
+                        next_speaker = self.generate_next_speaker(current_speaker)
+                    if not next_speaker:
+                        print(f"\n🏁 No active participants remaining!")
+                        self.conversation_active = False
+                        break
 
-                # Update achieved goals
-                if achieved_goals:
-                    self.update_achieved_goals(achieved_goals, response_msg.content)
-
-                # Update Coordinator tracking
-                if current_speaker == "coordinator":
-                    self.last_intervention = self.message_count
-
-                # Add to conversation
-                self.messages.append(response_msg)
-                self.message_count += 1
-
-                # Print the message
-                self.print_message(response_msg, custom_fields, achieved_goals)
-
-                api = AgentOrchestratorAPI(self)
-                for watcher in self.watchers:
-                    # calls the watchers one at a time
-                    watcher(current_speaker, api)
-
-                # Determine next speaker
-                next_speaker = self.generate_next_speaker(current_speaker)
-                if not next_speaker:
-                    print(f"\n🏁 No active participants remaining!")
-                    self.conversation_active = False
-                    break
-
-                current_speaker = next_speaker
-                time.sleep(0.5)
+                    current_speaker = next_speaker
+                    with tracer.span("turn_delay"):
+                        await asyncio.sleep(self.turn_delay)
 
             except Exception as e:
                 traceback.print_exc()
@@ -538,6 +992,8 @@ Please ensure proper formatting in responses."""
                 print(f"Current speaker: {current_speaker}")
                 break
 
+        self._checkpoint(current_speaker)
+
         # Print final results
         self.print_final_results()
 
@@ -546,12 +1002,24 @@ Please ensure proper formatting in responses."""
         print(f"   Message rejections: {self.rejection_count}")
         print(f"   Active participants: {len(self.get_active_agents())}")
         print(f"   Coordinator interventions: {self.agents['coordinator'].message_count}")
-
-        return {
+        if tracer.enabled and self.tracer is tracer:
+            print(f"\n⏱️  TIME BREAKDOWN:")
+            for phase, stats in tracer.breakdown():
+                print(f"   {phase}: {stats.total_seconds:.3f}s over {stats.count} calls")
+        if self.budget is not None:
+            print(f"   Budget: {self.budget.summary()}")
+
+        results = {
             'goals_achieved': [goal.name for goal in self.goals if goal.achieved],
             'message_count': self.message_count,
             'rejections': self.rejection_count
         }
+        if self.budget is not None:
+            results['budget'] = {'tokens': self.budget.tokens_used, 'input_tokens': self.budget.input_tokens_used,
+                                 'output_tokens': self.budget.output_tokens_used, 'cost': self.budget.cost,
+                                 'calls': self.budget.calls, 'remaining': self.budget.remaining(),
+                                 'stopped_debate': self.stopped_on_budget}
+        return results
 
     def update_agent_state(self, agent_name: str, custom_fields: Dict[str, Any]):
         """Update agent state with custom fields. Override for domain-specific behavior."""
@@ -566,10 +1034,7 @@ Please ensure proper formatting in responses."""
 
         message = Message.make(content, speaker)
 
-        if insert_at is None:
-            self.messages.append(message)
-        else:
-            self.messages.insert(insert_at, message)
+        self._append_message(message, insert_at)
 
         if increment_count:
             self.message_count += 1
@@ -582,13 +1047,32 @@ class AgentOrchestratorAPI:
         self._orchestrator = orchestrator
 
     def messages(self) -> Iterator[Message]:
-        """(read-only) message list from the orchestrator."""
-        for message in self._orchestrator.messages:
+        """(read-only) message list from the orchestrator, as the agents see it (see history_view)."""
+        for message in self._orchestrator.history_view():
             yield message
 
+    def messages_since(self, position: int) -> List[Message]:
+        """(read-only) messages from list position `position` on, as the agents see them."""
+        return self._orchestrator.history_view(position)
+
     def debate_messages_count(self) -> int:
         return self._orchestrator.message_count
 
+    def rejection_count(self) -> int:
+        """Number of responses rejected by the validity checkers so far."""
+        return self._orchestrator.rejection_count
+
+    def topic(self) -> str:
+        return self._orchestrator.conversation_topic
+
+    def context(self) -> str:
+        """The material under discussion."""
+        return self._orchestrator.context_content
+
+    def epoch(self) -> int:
+        """History epoch of the conversation (ChainOfDebate: the number of goal transitions so far)."""
+        return self._orchestrator.epoch
+
     def goals(self) -> Iterator[Goal]:
         """(read-only) goal list from the orchestrator."""
         for goal in self._orchestrator.goals:
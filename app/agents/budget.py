@@ -0,0 +1,207 @@
+import contextlib
+import contextvars
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+# Dollars per million tokens (Claude Sonnet list prices)
+DEFAULT_PRICES = {"input_tokens": 3.0, "output_tokens": 15.0,
+                  "cache_read_input_tokens": 0.30, "cache_creation_input_tokens": 3.75}
+
+
+@dataclass
+class DebateBudget:
+    """
+    Spending limits shared by a debate and every conversation nested under it: the
+    moderation meta-debates its watchers run, the meta-debates their own meta_watchers
+    run, and so on down the chain.
+
+    Assign it to the primary debate (`debate.budget = DebateBudget(...)`); nested
+    conversations find it in their context the way they find the enclosing tracer.
+    The token usage the API reports for every generated message and moderator vote is
+    charged against it. Moderators consult plan() before each review and degrade as the
+    budget runs low instead of overspending, and every conversation, the primary debate
+    included, stops once it is exhausted (`stop_debate=False` lets the primary debate run on
+    with only its moderation limited). The coordinator can also escalate on the remaining
+    share (CoordinatorConfig.budget_thresholds).
+
+    Attributes:
+        max_depth: Deepest conversation nesting allowed (1: the primary debate only, so its
+            moderators can only vote; 2: plus moderation meta-debates; ...). None for no limit
+        max_tokens: Tokens (input, output and cache) all conversations may spend together
+        max_input_tokens: Prompt tokens, cache reads and writes included
+        max_output_tokens: Generated tokens
+        max_cost: Spend in dollars, priced with `prices`
+        max_seconds: Wall time from the start of the primary debate
+        deadline: Wall-clock time (time.time()) by which the debate must be done
+        prices: Dollars per million tokens for each usage counter (input_tokens,
+            output_tokens, cache_read_input_tokens, cache_creation_input_tokens)
+        stop_debate: End the primary debate too once the budget is exhausted; False limits
+            only the nested conversations and moderator votes
+        shorten_below: Remaining share of the budget under which meta-debates are
+            shortened to their minimum length, without meta-watchers
+        vote_below: Remaining share under which moderators vote instead of debating
+    """
+    max_depth: Optional[int] = None
+    max_tokens: Optional[int] = None
+    max_input_tokens: Optional[int] = None
+    max_output_tokens: Optional[int] = None
+    max_cost: Optional[float] = None
+    max_seconds: Optional[float] = None
+    deadline: Optional[float] = None
+    prices: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_PRICES))
+    stop_debate: bool = True
+    shorten_below: float = 0.5
+    vote_below: float = 0.2
+    tokens_used: int = 0
+    input_tokens_used: int = 0
+    output_tokens_used: int = 0
+    cost: float = 0.0
+    calls: int = 0
+    started: Optional[float] = None
+    # time.time() when the clock started, the reference for the deadline's share
+    started_at: Optional[float] = None
+    # Degraded reviews by plan ("short", "vote", "skip")
+    degraded: Dict[str, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def start(self):
+        """Start the wall clock, unless it is already running."""
+        if self.started is None:
+            self.started = time.monotonic()
+            self.started_at = time.time()
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started if self.started is not None else 0.0
+
+    def charge(self, usage: dict):
+        """Charge the token usage reported for one API call."""
+        counts = {name: int(value) for name, value in usage.items() if isinstance(value, (int, float))}
+        output_tokens = counts.get("output_tokens", 0)
+        cost = sum(count * self.prices.get(name, 0.0) for name, count in counts.items()) / 1_000_000
+        with self._lock:
+            self.tokens_used += sum(counts.values())
+            self.input_tokens_used += sum(counts.values()) - output_tokens
+            self.output_tokens_used += output_tokens
+            self.cost += cost
+            self.calls += 1
+
+    def remaining_shares(self) -> Dict[str, float]:
+        """Share left of each configured limit."""
+        used = {"tokens": (self.tokens_used, self.max_tokens),
+                "input_tokens": (self.input_tokens_used, self.max_input_tokens),
+                "output_tokens": (self.output_tokens_used, self.max_output_tokens),
+                "cost": (self.cost, self.max_cost),
+                "seconds": (self.elapsed, self.max_seconds)}
+        if self.deadline is not None:
+            now = time.time()
+            allowed = self.deadline - (self.started_at if self.started_at is not None else now)
+            used["deadline"] = (now - self.started_at if self.started_at is not None else 0.0, allowed)
+        return {name: max(0.0, 1.0 - spent / limit) if limit > 0 else 0.0
+                for name, (spent, limit) in used.items() if limit is not None}
+
+    def remaining(self) -> float:
+        """Share of the budget left: the smallest share of any limit (1.0 when unlimited)."""
+        return min(self.remaining_shares().values(), default=1.0)
+
+    def exhausted(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def plan(self, depth: int) -> str:
+        """
+        How a review started by a conversation at nesting level `depth` may run.
+
+        Returns:
+            "full" for the configured review, "short" for a minimal meta-debate without
+            meta-watchers, "vote" for a single vote round (which nests no conversation),
+            or "skip" once the budget is spent
+        """
+        remaining = self.remaining()
+        if remaining <= 0.0:
+            return "skip"
+        if remaining < self.vote_below or (self.max_depth is not None and depth >= self.max_depth):
+            return "vote"
+        if remaining < self.shorten_below:
+            return "short"
+        return "full"
+
+    def state_dict(self) -> Dict[str, object]:
+        """
+        JSON-serializable spend so far, saved in debate journals. The clock is saved as the
+        time run so far plus its wall-clock start: a resumed debate's max_seconds counts only
+        the time it ran, while the deadline stays absolute.
+        """
+        with self._lock:
+            return {"tokens_used": self.tokens_used, "input_tokens_used": self.input_tokens_used,
+                    "output_tokens_used": self.output_tokens_used, "cost": self.cost, "calls": self.calls,
+                    "elapsed": self.elapsed if self.started is not None else None,
+                    "started_at": self.started_at, "degraded": dict(self.degraded)}
+
+    def load_state_dict(self, state: Dict[str, object]):
+        """Restore spend saved by state_dict(), continuing the clock where it stopped."""
+        with self._lock:
+            self.tokens_used = state["tokens_used"]
+            self.input_tokens_used = state["input_tokens_used"]
+            self.output_tokens_used = state["output_tokens_used"]
+            self.cost = state["cost"]
+            self.calls = state["calls"]
+            self.started = time.monotonic() - state["elapsed"] if state["elapsed"] is not None else None
+            self.started_at = state["started_at"]
+            self.degraded = dict(state["degraded"])
+
+    def record_degraded(self, plan: str):
+        """Count a review that ran as `plan` instead of in full."""
+        with self._lock:
+            self.degraded[plan] = self.degraded.get(plan, 0) + 1
+
+    def summary(self) -> str:
+        limits = [f"{self.tokens_used} tokens" + (f" of {self.max_tokens}" if self.max_tokens is not None else ""),
+                  f"{self.input_tokens_used} in" + (f" of {self.max_input_tokens}" if self.max_input_tokens is not None else ""),
+                  f"{self.output_tokens_used} out" + (f" of {self.max_output_tokens}" if self.max_output_tokens is not None else ""),
+                  f"${self.cost:.4f}" + (f" of ${self.max_cost:g}" if self.max_cost is not None else ""),
+                  f"{self.elapsed:.1f}s" + (f" of {self.max_seconds:g}s" if self.max_seconds is not None else ""),
+                  f"{self.calls} calls"]
+        if self.deadline is not None:
+            limits.append(f"deadline in {self.deadline - time.time():.0f}s")
+        degraded = ", ".join(f"{count} {plan}" for plan, count in sorted(self.degraded.items())) or "none"
+        return f"{', '.join(limits)}; degraded reviews: {degraded}"
+
+
+_current_budget: contextvars.ContextVar[Optional[DebateBudget]] = contextvars.ContextVar("current_budget",
+                                                                                       default=None)
+_conversation_depth: contextvars.ContextVar[int] = contextvars.ContextVar("conversation_depth", default=0)
+
+
+def current_budget() -> Optional[DebateBudget]:
+    """The budget of the conversation running in this context (None when it has none)."""
+    return _current_budget.get()
+
+
+def conversation_depth() -> int:
+    """Nesting level of the conversation running in this context (0 outside any, 1 in a primary debate)."""
+    return _conversation_depth.get()
+
+
+@contextlib.contextmanager
+def conversation_scope(budget: Optional[DebateBudget]):
+    """Run one conversation level deeper, with `budget` (if any) as the current budget."""
+    if budget is not None:
+        budget.start()
+    budget_token = _current_budget.set(budget)
+    depth_token = _conversation_depth.set(_conversation_depth.get() + 1)
+    try:
+        yield
+    finally:
+        _conversation_depth.reset(depth_token)
+        _current_budget.reset(budget_token)
+
+
+def charge_usage(message) -> None:
+    """Charge the API usage attached to a generated message to the current budget, if any."""
+    budget = _current_budget.get()
+    usage = getattr(message, "usage", None)
+    if budget is not None and isinstance(usage, dict):
+        budget.charge(usage)
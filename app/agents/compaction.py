@@ -0,0 +1,282 @@
+import asyncio
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+
+from agents.budget import charge_usage
+from models.base import BaseModel, Message
+from telemetry.tracing import current_tracer
+
+
+TAG_PATTERN = re.compile(r"<[^>]+>")
+SENTENCE_END_PATTERN = re.compile(r"(?<=[.!?])\s")
+
+
+class Summarizer(ABC):
+    """Condenses a stretch of debate history into text for one viewer."""
+
+    @abstractmethod
+    async def summarize(self, viewer: str, previous_summary: Optional[str], messages: List[Message]) -> str:
+        """
+        Extend a running summary with more messages.
+
+        Args:
+            viewer: Agent the summary is written for (messages are already filtered to what it can see)
+            previous_summary: Summary of everything before `messages`, or None
+            messages: Messages to fold into the summary, oldest first
+
+        Returns:
+            Summary of the previous summary's span plus `messages`
+        """
+        pass
+
+
+class ExtractiveSummarizer(Summarizer):
+    """
+    Summarizer without model calls: one line per message with its speaker, addressee
+    and opening sentence. Keeps at most `max_lines` lines, dropping the oldest first.
+
+    Args:
+        max_chars: Maximum length of a message's gist
+        max_lines: Maximum number of lines in the summary
+    """
+
+    def __init__(self, max_chars: int = 160, max_lines: int = 60):
+        self.max_chars = max_chars
+        self.max_lines = max_lines
+
+    def gist(self, message: Message) -> str:
+        text = " ".join(TAG_PATTERN.sub(" ", message.content).split())
+        sentence = SENTENCE_END_PATTERN.split(text, maxsplit=1)[0]
+        if len(sentence) > self.max_chars:
+            sentence = sentence[:self.max_chars - 3].rstrip() + "..."
+        target = message.speaking_to or "All"
+        whisper = " (whisper)" if message.is_whisper else ""
+        return f"- {message.speaker} → {target}{whisper}: {sentence}"
+
+    async def summarize(self, viewer: str, previous_summary: Optional[str], messages: List[Message]) -> str:
+        lines = previous_summary.splitlines() if previous_summary else []
+        lines.extend(self.gist(message) for message in messages)
+        return "\n".join(lines[-self.max_lines:])
+
+
+class LLMSummarizer(Summarizer):
+    """
+    Summarizer that asks a model to update the running summary.
+
+    Args:
+        llm: Model used for summaries (a cheaper model than the debate's is a good fit)
+        max_words: Target summary length
+    """
+
+    def __init__(self, llm: BaseModel, max_words: int = 250):
+        self.llm = llm
+        self.max_words = max_words
+
+    async def summarize(self, viewer: str, previous_summary: Optional[str], messages: List[Message]) -> str:
+        instructions = Message.make(
+            f"You maintain the running summary of a multi-agent debate for {viewer}. Merge the "
+            f"previous summary and the new messages into one summary of at most {self.max_words} "
+            f"words. Keep each participant's positions, verdicts, open questions and commitments; "
+            f"drop pleasantries and repetition. Reply with the summary as your message content.",
+            "system"
+        )
+        transcript = "\n".join(f"[{m.speaker} → {m.speaking_to or 'All'}]: {m.content}" for m in messages)
+        request = Message.make(
+            f"PREVIOUS SUMMARY:\n{previous_summary or '(none)'}\n\nNEW MESSAGES:\n{transcript}",
+            "coordinator"
+        )
+        response = await self.llm.acall(speaker="summarizer", messages=[instructions, request],
+                                        stop_sequences=["</Message>"])
+        # Summaries are spent by the conversation they run in, like its own messages
+        charge_usage(response)
+        tracer = current_tracer()
+        if tracer.enabled and isinstance(response.usage, dict):
+            for kind, tokens in response.usage.items():
+                tracer.count("tokens", tokens, speaker="summarizer", kind=kind)
+        return response.content.strip()
+
+
+@dataclass
+class CompactionStats:
+    """Counters of a HistoryCompactor."""
+    summaries: int = 0
+    failures: int = 0
+    resets: int = 0
+    messages_summarized: int = 0
+
+
+class _SummaryChain:
+    """Rolling summary of one viewer's history, covering the first `covered` messages."""
+
+    def __init__(self):
+        self.covered = 0
+        # Messages covered once the summary being built is done (`covered` when idle)
+        self.target = 0
+        self.summary: Optional[str] = None
+        self.message: Optional[Message] = None
+        self.task: Optional[asyncio.Task] = None
+        # Set when messages this chain covers (or is summarizing) changed; reset on next use
+        self.dirty = False
+
+
+class HistoryCompactor:
+    """
+    Bounds prompt size by replacing old history with a rolling summary per viewer.
+
+    Every viewer sees the most recent `keep_recent` messages verbatim. Older messages are
+    folded, `block_size` at a time, into a summary of what that viewer could see (so
+    whispers never leak into another agent's summary), which is shown as a single
+    coordinator message in their place. Summaries are built in background tasks: a turn
+    never waits for one, it shows the older messages verbatim until the summary is ready.
+    A summary is rebuilt if the messages it covers are edited or reordered.
+
+    The compactor tracks the history it has already seen, so a turn only looks at the
+    messages added since the previous one: the other viewers' summaries are revisited
+    only when a new block becomes eligible or their messages changed, and the seen
+    messages are only rescanned when some message was edited.
+
+    Args:
+        summarizer: Produces the summaries (ExtractiveSummarizer, LLMSummarizer, ...)
+        keep_recent: Number of latest messages always shown verbatim
+        block_size: Number of messages folded into the summary at once
+    """
+
+    def __init__(self, summarizer: Summarizer, keep_recent: int = 20, block_size: int = 10):
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+        self.summarizer = summarizer
+        self.keep_recent = keep_recent
+        self.block_size = block_size
+        self.stats = CompactionStats()
+        self._chains: Dict[str, _SummaryChain] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        # The history as of the previous compact() call, with each message's revision then
+        self._seen: List[Message] = []
+        self._revisions: List[int] = []
+        self._mutation_count = Message.mutation_count
+        # Messages eligible for summaries, and the viewers whose chains are behind it or dirty
+        self._eligible = 0
+        self._pending: Set[str] = set()
+
+    def _first_change(self, messages: List[Message]) -> Optional[int]:
+        """
+        Catch up with `messages`. Returns the position of the first seen message that was
+        replaced, moved or edited since the previous call, or None if they are all unchanged.
+        """
+        seen = len(self._seen)
+        first_change = None
+        if len(messages) < seen or (seen and messages[seen - 1] is not self._seen[-1]):
+            first_change = 0
+            while first_change < min(len(messages), seen) and messages[first_change] is self._seen[first_change]:
+                first_change += 1
+            del self._seen[first_change:], self._revisions[first_change:]
+        if self._mutation_count != Message.mutation_count:
+            # Some message changed somewhere; only then are the seen ones compared
+            edited = next((i for i, (message, revision) in enumerate(zip(self._seen, self._revisions))
+                           if message.revision != revision), None)
+            if edited is not None:
+                first_change = edited if first_change is None else min(first_change, edited)
+                self._revisions[edited:] = [message.revision for message in self._seen[edited:]]
+            self._mutation_count = Message.mutation_count
+        new = messages[len(self._seen):]
+        self._seen.extend(new)
+        self._revisions.extend(message.revision for message in new)
+        return first_change
+
+    def _chain(self, viewer: str) -> _SummaryChain:
+        chain = self._chains.get(viewer)
+        if chain is None:
+            chain = self._chains[viewer] = _SummaryChain()
+        elif chain.dirty:
+            # The summarized messages moved or were edited: start over
+            if chain.task is not None:
+                chain.task.cancel()
+            self.stats.resets += 1
+            chain = self._chains[viewer] = _SummaryChain()
+        return chain
+
+    def _schedule(self, viewer: str, chain: _SummaryChain, messages: List[Message]):
+        if chain.task is not None or self._eligible <= chain.covered:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # synchronous callers get the uncompacted history
+
+        chain.target = self._eligible
+        chain.task = loop.create_task(self._extend(viewer, chain, messages[chain.covered:self._eligible]))
+        self._tasks.add(chain.task)
+        chain.task.add_done_callback(self._tasks.discard)
+
+    async def _extend(self, viewer: str, chain: _SummaryChain, target: List[Message]):
+        visible = [message for message in target if message.can_be_seen_by(viewer)]
+        try:
+            summary = (await self.summarizer.summarize(viewer, chain.summary, visible)
+                       if visible else chain.summary)
+        except Exception as e:
+            self.stats.failures += 1
+            print(f"⚠️ History summary for {viewer} failed, keeping full history: {e}")
+            chain.target = chain.covered
+            self._pending.add(viewer)
+            return
+        finally:
+            chain.task = None
+
+        if self._chains.get(viewer) is not chain:
+            return  # reset while summarizing
+        covered = chain.target
+        chain.summary = summary
+        chain.covered = covered
+        chain.message = Message.make(
+            f"📜 SUMMARY OF EARLIER DISCUSSION (messages 1-{covered}, condensed):\n{summary or '(nothing visible)'}",
+            "coordinator"
+        )
+        self.stats.summaries += 1
+        self.stats.messages_summarized += len(target)
+
+    def compact(self, viewer: str, messages: List[Message]) -> List[Message]:
+        """
+        The history `viewer` should be prompted with: the latest summary followed by the
+        messages it does not cover. Also starts summarizing newly eligible messages.
+
+        Args:
+            viewer: Agent whose prompt is being built
+            messages: Full conversation history
+        """
+        first_change = self._first_change(messages)
+        if first_change is not None:
+            for other, other_chain in self._chains.items():
+                if other_chain.target > first_change:
+                    other_chain.dirty = True
+                    self._pending.add(other)
+        eligible = max(0, (len(messages) - self.keep_recent) // self.block_size * self.block_size)
+        if eligible != self._eligible:
+            self._eligible = eligible
+            self._pending.update(self._chains)
+
+        chain = self._chain(viewer)
+        self._schedule(viewer, chain, messages)
+        # Keep the other viewers' summaries current too, so an agent that has been quiet
+        # for a while does not come back to a long uncompacted tail
+        for other in list(self._pending):
+            other_chain = self._chain(other) if other != viewer else chain
+            self._schedule(other, other_chain, messages)
+            if other_chain.target >= self._eligible:
+                self._pending.discard(other)
+        if chain.message is None:
+            return messages
+        return [chain.message] + messages[chain.covered:]
+
+    async def wait(self):
+        """Wait for the summaries being built right now."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def aclose(self):
+        """Cancel summaries still being built."""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
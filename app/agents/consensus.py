@@ -0,0 +1,82 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+
+@dataclass
+class ConsensusDetector:
+    """
+    Spots a settled goal before every participant has withdrawn.
+
+    Assigned to ChainOfDebate.consensus, it sees the verdict each participant message
+    leaves on record (None for a message without one, since such a message clears the
+    verdict). A participant is stable once its last `window` messages of the goal all
+    carried the same verdict; a participant who withdrew is stable with its final verdict.
+    The goal is settled when every participant has a verdict, at least `agreement` of them
+    share the most common one, and at least `stability` of them are stable.
+
+    Attributes:
+        window: Messages a participant must hold the same verdict for
+        agreement: Share of participants that must give the majority verdict
+        stability: Share of participants that must be stable
+        min_participants: Smallest panel the detector closes goals for
+        goals_closed: Goals closed on consensus so far
+        turns_saved: Participant turns those goals did not spend (see ChainOfDebate.consensus)
+    """
+    window: int = 3
+    agreement: float = 1.0
+    stability: float = 1.0
+    min_participants: int = 2
+    goals_closed: int = 0
+    turns_saved: int = 0
+    # Verdicts on record after each participant's latest messages of the current goal
+    _stances: Dict[str, List[Optional[str]]] = field(default_factory=dict, repr=False)
+
+    def observe(self, name: str, verdict: Optional[str]):
+        """Record the verdict a participant's message left on record."""
+        stances = self._stances.setdefault(name, [])
+        stances.append(verdict)
+        del stances[:-self.window]
+
+    def reset(self):
+        """Forget every stance, e.g. when a new goal starts."""
+        self._stances.clear()
+
+    def is_stable(self, name: str, verdict: Optional[str]) -> bool:
+        stances = self._stances.get(name, [])
+        return verdict is not None and len(stances) >= self.window and all(s == verdict for s in stances)
+
+    def check(self, verdicts: Dict[str, Optional[str]], withdrawn: Set[str]) -> Optional[str]:
+        """
+        The verdict the participants have settled on, if any.
+
+        Args:
+            verdicts: Each participant's verdict on record (None when it has none)
+            withdrawn: Participants who have withdrawn from the goal
+
+        Returns:
+            The majority verdict once the agreement and stability thresholds are met, else None
+        """
+        count = len(verdicts)
+        if count < max(1, self.min_participants) or any(verdict is None for verdict in verdicts.values()):
+            return None
+        verdict, agreeing = Counter(verdicts.values()).most_common(1)[0]
+        if agreeing / count < self.agreement:
+            return None
+        stable = sum(1 for name, held in verdicts.items() if name in withdrawn or self.is_stable(name, held))
+        if stable / count < self.stability:
+            return None
+        return verdict
+
+    def record_close(self, turns_saved: int):
+        self.goals_closed += 1
+        self.turns_saved += turns_saved
+
+    def state_dict(self) -> Dict[str, Any]:
+        return {"goals_closed": self.goals_closed, "turns_saved": self.turns_saved,
+                "stances": {name: list(stances) for name, stances in self._stances.items()}}
+
+    def load_state_dict(self, state: Dict[str, Any]):
+        self.goals_closed = state["goals_closed"]
+        self.turns_saved = state["turns_saved"]
+        self._stances = {name: list(stances) for name, stances in state["stances"].items()}
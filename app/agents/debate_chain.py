@@ -1,11 +1,17 @@
 import regex
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, field
+import time
+from typing import Dict, List, Optional, Tuple, Any, Union
+from dataclasses import asdict, dataclass, field
 from agents.agent_system import (
     AgentOrchestrator, ValidityChecker, RejectionResult,
-    Persona, Goal, AgentType, CoordinatorConfig, DebateWatcher
+    Persona, Goal, AgentType, CoordinatorConfig, DebateWatcher, run_coroutine_sync
 )
-from models.base import BaseModel
+from agents.budget import DebateBudget
+from agents.consensus import ConsensusDetector
+from agents.journal import DebateJournal
+from models.base import BaseModel, Message
+from models.scaffolding import ParsedResponse, parse_scaffolding, parsed_response
+from telemetry.tracing import current_tracer
 
 
 @dataclass
@@ -25,18 +31,60 @@ class VerdictConfig:
         return " | ".join(self.verdict_options)
 
 
+@dataclass
+class GoalOutcome:
+    """
+    How a completed goal ended: each participant's verdict and reasoning, and the
+    messages of the goal's discussion once they have been archived.
+    """
+    goal_name: str
+    goal_description: str
+    verdicts: Dict[str, Dict[str, Optional[str]]]
+    verdict_counts: Dict[str, int]
+    message_count: int
+    # Wall-clock time from the start of the goal (or of the resumed run) to its completion
+    seconds: float = field(default=0.0, compare=False)
+    # Whether the consensus detector closed the goal, and the participant turns that saved
+    closed_by_consensus: bool = False
+    turns_saved: int = 0
+    archived_messages: List[Message] = field(default_factory=list, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-serializable copy without the archived messages, which can be long; debate
+        journals save them once (see ChainOfDebate.archived_transcripts).
+        """
+        return {"goal_name": self.goal_name, "goal_description": self.goal_description,
+                "verdicts": self.verdicts, "verdict_counts": self.verdict_counts,
+                "message_count": self.message_count, "seconds": self.seconds,
+                "closed_by_consensus": self.closed_by_consensus, "turns_saved": self.turns_saved}
+
+    def to_prompt(self, max_reasoning_chars: int = 300) -> str:
+        """The outcome as a compact record for the goals that follow."""
+        tally = ", ".join(f"{option} ×{count}" for option, count in self.verdict_counts.items() if count)
+        lines = [f"📌 GOAL OUTCOME: '{self.goal_name}' ({self.goal_description})",
+                 f"Verdicts: {tally or 'none'}"]
+        for name, verdict in self.verdicts.items():
+            reasoning = " ".join((verdict.get("reasoning") or "").split())
+            if len(reasoning) > max_reasoning_chars:
+                reasoning = reasoning[:max_reasoning_chars - 3].rstrip() + "..."
+            lines.append(f"- {name}: {verdict.get('verdict') or 'NO VERDICT'}" + (f" — {reasoning}" if reasoning else ""))
+        return "\n".join(lines)
+
+
 class VerdictValidityChecker(ValidityChecker):
     """Checks if verdict is valid when provided."""
 
     def check(self, message, config: VerdictConfig, participant_state) -> RejectionResult:
-        full_response = message.to_prompt()
+        return self.check_partial(parsed_response(message), config, participant_state)
 
+    def check_partial(self, parsed, config: VerdictConfig, participant_state) -> RejectionResult:
+        # The first <Verdict> decides, so a closed one is final
         # Check if verdict tag is present
-        verdict_match = regex.search(r"<Verdict>(?:\s|\n)*(.*?)(?:\s|\n)*</Verdict>", full_response, regex.DOTALL)
-        if not verdict_match:
+        if parsed.verdict is None:
             return RejectionResult.valid()  # No verdict tag is fine
 
-        verdict_content = verdict_match.group(1).strip()
+        verdict_content = parsed.verdict
 
         # Empty verdict is okay
         if not verdict_content:
@@ -57,17 +105,14 @@ class VerdictReasoningChecker(ValidityChecker):
     """Checks if verdict reasoning is provided when verdict is given."""
 
     def check(self, message, config: VerdictConfig, participant_state) -> RejectionResult:
-        full_response = message.to_prompt()
+        parsed = parsed_response(message)
 
         # Check if verdict is present and not empty
-        verdict_match = regex.search(r"<Verdict>(?:\s|\n)*(.*?)(?:\s|\n)*</Verdict>", full_response, regex.DOTALL)
-        if not verdict_match or not verdict_match.group(1).strip():
+        if not parsed.verdict:
             return RejectionResult.valid()  # No verdict, so reasoning not required
 
         # Check if reasoning tag is present
-        reasoning_match = regex.search(r"<VerdictReasoning>(?:\s|\n)*(.*?)(?:\s|\n)*</VerdictReasoning>", full_response,
-                                       regex.DOTALL)
-        if not reasoning_match or not reasoning_match.group(1).strip():
+        if not parsed.verdict_reasoning:
             return RejectionResult.invalid(
                 "Verdict reasoning must be provided when a verdict is given. Please include <VerdictReasoning>your explanation</VerdictReasoning>"
             )
@@ -79,26 +124,20 @@ class WithdrawalValidityChecker(ValidityChecker):
     """Checks if withdrawal is valid - requires a verdict first."""
 
     def check(self, message, config: VerdictConfig, participant_state) -> RejectionResult:
-        full_response = message.to_prompt()
+        parsed = parsed_response(message)
 
         # Check if trying to withdraw
-        withdrawn_match = regex.search(r"<Withdrawn>(?:\s|\n)*(.*?)(?:\s|\n)*</Withdrawn>", full_response, regex.DOTALL)
-        if not withdrawn_match:
+        if parsed.withdrawn is None:
             return RejectionResult.valid()  # No withdrawal attempt
 
-        withdrawn_content = withdrawn_match.group(1).strip().lower()
-        if withdrawn_content != "true":
+        if not parsed.is_withdrawing:
             return RejectionResult.valid()  # Not withdrawing
 
         # Check if they have a current verdict
         current_verdict = participant_state.custom_data.get('verdict')
 
         # Check if they're providing a verdict in this message
-        verdict_in_message = None
-        for option in config.verdict_options:
-            if regex.findall(rf"<Verdict>(?:\s|\n)*{regex.escape(option)}(?:\s|\n)*</Verdict>", full_response):
-                verdict_in_message = option
-                break
+        verdict_in_message = parsed.verdict_option(config.verdict_options)
 
         # Allow withdrawal if they have a previous verdict OR providing one now
         if current_verdict or verdict_in_message:
@@ -113,14 +152,15 @@ class WithdrawnFormatChecker(ValidityChecker):
     """Checks if withdrawn tag is properly formatted when present."""
 
     def check(self, message, config: VerdictConfig, participant_state) -> RejectionResult:
-        full_response = message.to_prompt()
+        return self.check_partial(parsed_response(message), config, participant_state)
 
+    def check_partial(self, parsed, config: VerdictConfig, participant_state) -> RejectionResult:
+        # The first <Withdrawn> decides, so a closed one is final
         # Check if withdrawn tag is present
-        withdrawn_match = regex.search(r"<Withdrawn>(?:\s|\n)*(.*?)(?:\s|\n)*</Withdrawn>", full_response, regex.DOTALL)
-        if not withdrawn_match:
+        if parsed.withdrawn is None:
             return RejectionResult.valid()  # No withdrawn tag is fine
 
-        withdrawn_content = withdrawn_match.group(1).strip().lower()
+        withdrawn_content = parsed.withdrawn.lower()
         if withdrawn_content not in ["true", "false"]:
             return RejectionResult.invalid(
                 f"Invalid withdrawn value '{withdrawn_content}'. Must be 'true' or 'false'"
@@ -130,14 +170,23 @@ class WithdrawnFormatChecker(ValidityChecker):
 
 
 class DebateTimeKeeperConfig(CoordinatorConfig):
-    """Extended configuration for debate TimeKeeper."""
+    """
+    Extended configuration for debate TimeKeeper.
+
+    Args:
+        budget_thresholds: Remaining budget shares at which the TimeKeeper insists, demands
+            and forces verdicts (e.g. [0.5, 0.25, 0.1]), replacing the message-count
+            thresholds whenever a DebateBudget applies to the debate
+    """
 
     def __init__(self,
                  intervention_interval: int = 4,
                  insist_threshold: int = 20,
                  demand_threshold: int = 35,
-                 force_verdict_threshold: int = 50):
-        super().__init__(intervention_interval, [insist_threshold, demand_threshold, force_verdict_threshold])
+                 force_verdict_threshold: int = 50,
+                 budget_thresholds: List[float] = None):
+        super().__init__(intervention_interval, [insist_threshold, demand_threshold, force_verdict_threshold],
+                         budget_thresholds)
         self.insist_threshold = insist_threshold
         self.demand_threshold = demand_threshold
         self.force_verdict_threshold = force_verdict_threshold
@@ -156,7 +205,24 @@ class ChainOfDebate(AgentOrchestrator):
                  goals: List[Goal] = None,
                  timekeeper_config: DebateTimeKeeperConfig = None,
                  custom_validity_checkers: List[ValidityChecker] = None,
-                 watchers: List[DebateWatcher] = None):
+                 watchers: List[DebateWatcher] = None,
+                 compact_goal_history: bool = False,
+                 simultaneous_rounds: bool = False,
+                 consensus: Optional[ConsensusDetector] = None,
+                 budget: Optional[DebateBudget] = None):
+        """
+        Args:
+            compact_goal_history: At each goal transition, archive the finished goal's
+                messages and continue from a single outcome record (verdict tallies and
+                reasoning) instead of the full earlier transcript
+            simultaneous_rounds: Every active participant responds to the same transcript
+                concurrently each round, instead of one speaker per turn (large panels then
+                take one model round trip per round rather than one per participant)
+            consensus: Closes a goal once the participants hold the same verdict stably,
+                without waiting for every withdrawal (see ConsensusDetector)
+            budget: Token, cost and time limits of the debate and its meta-debates (see
+                DebateBudget; timekeeper_config.budget_thresholds escalates on it)
+        """
 
         # Setup default validity checkers
         default_checkers = [
@@ -176,6 +242,10 @@ class ChainOfDebate(AgentOrchestrator):
         self.goal_queue = goals.copy() if goals else []
         self.current_goal = self.goal_queue.pop(0) if self.goal_queue else None
         self.completed_goals = []
+        self.goal_outcomes: List[GoalOutcome] = []
+        self.compact_goal_history = compact_goal_history
+        self.consensus = consensus
+        self._goal_started: Optional[float] = None
 
         super().__init__(
             llm=llm,
@@ -185,7 +255,10 @@ class ChainOfDebate(AgentOrchestrator):
             validity_checkers=all_checkers,
             goals=[],  # Clear goals from parent class since we handle them differently
             watchers=watchers,
+            budget=budget,
         )
+        self.simultaneous_rounds = simultaneous_rounds
+        self.agents.track('verdict')
 
         # Override coordinator persona for debate context
         self.coordinator_persona.name = "TimeKeeper"
@@ -196,33 +269,20 @@ class ChainOfDebate(AgentOrchestrator):
         """Provide verdict config for validators."""
         return self.verdict_config
 
-    def parse_custom_fields(self, full_response: str) -> Dict[str, Any]:
+    def parse_custom_fields(self, full_response: Union[str, ParsedResponse]) -> Dict[str, Any]:
         """Parse debate-specific fields: verdict, reasoning, withdrawn."""
+        parsed = full_response if isinstance(full_response, ParsedResponse) else parse_scaffolding(full_response)
         fields = {}
 
-        # Extract verdict using regex with whitespace/newline handling
-        verdict = None
-        for option in self.verdict_config.verdict_options:
-            if regex.findall(rf"<Verdict>(?:\s|\n)*{regex.escape(option)}(?:\s|\n)*</Verdict>", full_response):
-                verdict = option
-                break
-        fields['verdict'] = verdict
-
-        # Extract reasoning using regex
-        reasoning = None
-        reasoning_match = regex.search(r"<VerdictReasoning>(?:\s|\n)*(.*?)(?:\s|\n)*</VerdictReasoning>", full_response,
-                                       regex.DOTALL)
-        if reasoning_match:
-            reasoning = reasoning_match.group(1).strip()
-            fields['reasoning'] = reasoning if reasoning else None
-
-        # Extract withdrawal status using regex
-        withdrawn = False
-        withdrawn_match = regex.search(r"<Withdrawn>(?:\s|\n)*(.*?)(?:\s|\n)*</Withdrawn>", full_response, regex.DOTALL)
-        if withdrawn_match:
-            withdrawn_content = withdrawn_match.group(1).strip().lower()
-            withdrawn = withdrawn_content == "true"
-        fields['withdrawn'] = withdrawn
+        # Extract verdict: first configured option written as a whole <Verdict> value
+        fields['verdict'] = parsed.verdict_option(self.verdict_config.verdict_options)
+
+        # Extract reasoning
+        if parsed.verdict_reasoning is not None:
+            fields['reasoning'] = parsed.verdict_reasoning if parsed.verdict_reasoning else None
+
+        # Extract withdrawal status
+        fields['withdrawn'] = parsed.is_withdrawing
 
         return fields
 
@@ -237,26 +297,71 @@ class ChainOfDebate(AgentOrchestrator):
             agent_state.custom_data['verdict'] = custom_fields['verdict']
             agent_state.custom_data['verdict_reasoning'] = custom_fields.get('reasoning')
 
+        is_participant = agent_state.persona.agent_type == AgentType.PARTICIPANT
+        if self.consensus is not None and is_participant:
+            self.consensus.observe(agent_name.lower(), agent_state.custom_data.get('verdict'))
+        goal = self.current_goal
+
         # Update withdrawal status and handle goal progression
         if custom_fields.get('withdrawn'):
             agent_state.has_withdrawn = True
             self._check_goal_completion()
 
+        if self.consensus is not None and is_participant and self.current_goal is goal:
+            self._check_consensus()
+
+    def _check_consensus(self):
+        """Close the current goal early once the consensus detector finds it settled."""
+        if not self.current_goal or self.get_participants_without_verdicts():
+            return
+        participants = {name: state for name, state in self.agents.items()
+                        if state.persona.agent_type == AgentType.PARTICIPANT}
+        verdict = self.consensus.check({name: state.custom_data.get('verdict') for name, state in participants.items()},
+                                       {name for name, state in participants.items() if state.has_withdrawn})
+        remaining = self.get_active_agents()
+        if verdict is None or not remaining:
+            return
+
+        # Each participant still active would have needed at least one more turn to withdraw
+        turns_saved = len(remaining)
+        agreeing = sum(state.custom_data.get('verdict') == verdict for state in participants.values())
+        announcement = Message.make(
+            content=f"⏱️ CONSENSUS REACHED on '{self.current_goal.name}': {agreeing} of {len(participants)} "
+                    f"participants hold the verdict {verdict}, and their verdicts have been stable for their last "
+                    f"{self.consensus.window} messages. Closing this goal now; no further withdrawals are needed.",
+            speaker="coordinator"
+        )
+        self._append_message(announcement)
+        self.message_count += 1
+        print(f"🤝 CONSENSUS: {verdict} ({agreeing}/{len(participants)}) on {self.current_goal.name}, "
+              f"closing the goal and saving {turns_saved} turns")
+
+        self.consensus.record_close(turns_saved)
+        current_tracer().count("consensus_turns_saved", turns_saved, goal=self.current_goal.name)
+        outcomes = len(self.goal_outcomes)
+        for name in remaining:
+            self.agents[name].has_withdrawn = True
+        self._check_goal_completion()
+        if len(self.goal_outcomes) > outcomes:
+            self.goal_outcomes[outcomes].closed_by_consensus = True
+            self.goal_outcomes[outcomes].turns_saved = turns_saved
+
     def _check_goal_completion(self):
         """Check if current goal should be completed and advance to next goal."""
         if not self.current_goal:
             return
 
         # Check if all participants have withdrawn (completed their verdicts)
-        active_participants = [name for name, state in self.agents.items()
-                               if not state.has_withdrawn and
-                               state.persona.agent_type == AgentType.PARTICIPANT]
-
-        if not active_participants:  # All participants have withdrawn
+        if not self.agents.active_count():  # All participants have withdrawn
             # Mark current goal as achieved and move to next
             self.current_goal.achieved = True
             self.completed_goals.append(self.current_goal)
-            print(f"🎯 GOAL COMPLETED: {self.current_goal.name}")
+            outcome = self._record_goal_outcome(self.current_goal)
+            print(f"🎯 GOAL COMPLETED: {self.current_goal.name} ({outcome.message_count} messages in "
+                  f"{outcome.seconds:.1f}s)")
+
+            if self.consensus is not None:
+                self.consensus.reset()
 
             # Advance to next goal
             if self.goal_queue:
@@ -270,31 +375,18 @@ class ChainOfDebate(AgentOrchestrator):
                         state.custom_data.pop('verdict', None)
                         state.custom_data.pop('verdict_reasoning', None)
 
-                # Clean up old verdicts and withdrawals from message history
-                for message in self.messages:
-                    # Remove old verdicts
-                    message.content = regex.sub(
-                        r"<Verdict>(?:\s|\n)*(?:(?:" + "|".join(
-                            self.verdict_config.verdict_options) + r"))(?:\s|\n)*</Verdict>",
-                        "", message.content
-                    )
-
-                    agent = self.agents.get(message.speaker)
-                    if agent and agent.persona.agent_type == AgentType.PARTICIPANT:
-                        # Remove old verdict reasoning
-                        message.content = regex.sub(
-                            r"<VerdictReasoning>(?:\s|\n)*.*?(?:\s|\n)*</VerdictReasoning>",
-                            "", message.content, flags=regex.DOTALL
-                        )
-                        # Reset withdrawals to false
-                        message.content = regex.sub(
-                            r"<Withdrawn>(?:\s|\n)*(?:true|TRUE|True)(?:\s|\n)*</Withdrawn>",
-                            "<Withdrawn>false</Withdrawn>",
-                            message.content
-                        )
+                # Earlier messages keep their raw text; mask_content() hides their verdicts and
+                # withdrawals from the agents from now on
+                self.epoch += 1
+
+                if self.compact_goal_history:
+                    # Later goals only see the outcome; the raw discussion moves to the archive,
+                    # so the transition costs the same however long the goal ran
+                    outcome.archived_messages = self.messages
+                    self.messages = []
+                    self._append_message(Message.make(outcome.to_prompt(), "coordinator"))
 
                 # Add system message about goal transition
-                from models.base import Message
                 transition_message = Message.make(
                     content=f"🎯 GOAL COMPLETED: '{self.completed_goals[-1].name}' has been successfully completed by "
                             f"all participants.\n\n🎯 NEW GOAL: We are now moving to the next goal: "
@@ -302,22 +394,106 @@ class ChainOfDebate(AgentOrchestrator):
                             f"may continue the debate on this new objective.",
                     speaker="coordinator"
                 )
-                self.messages.append(transition_message)
+                self._append_message(transition_message)
                 self.message_count += 1
             else:
                 self.current_goal = None
                 print("🎯 ALL GOALS COMPLETED!")
                 self.conversation_active = False
 
+    def mask_content(self, message: Message) -> str:
+        """Hide the verdicts, verdict reasoning and withdrawals of goals that are already completed."""
+        content = regex.sub(
+            r"<Verdict>(?:\s|\n)*(?:(?:" + "|".join(
+                self.verdict_config.verdict_options) + r"))(?:\s|\n)*</Verdict>",
+            "", message.content
+        )
+
+        agent = self.agents.get(message.speaker)
+        if agent and agent.persona.agent_type == AgentType.PARTICIPANT:
+            # Remove old verdict reasoning
+            content = regex.sub(
+                r"<VerdictReasoning>(?:\s|\n)*.*?(?:\s|\n)*</VerdictReasoning>",
+                "", content, flags=regex.DOTALL
+            )
+            # Show withdrawals as reset
+            content = regex.sub(
+                r"<Withdrawn>(?:\s|\n)*(?:true|TRUE|True)(?:\s|\n)*</Withdrawn>",
+                "<Withdrawn>false</Withdrawn>",
+                content
+            )
+
+        return content
+
+    def _record_goal_outcome(self, goal: Goal) -> GoalOutcome:
+        """Capture the participants' verdicts on a goal that was just completed."""
+        verdicts = {}
+        verdict_counts = {option: 0 for option in self.verdict_config.verdict_options}
+        for name, state in self.agents.items():
+            if state.persona.agent_type != AgentType.PARTICIPANT:
+                continue
+            verdict = state.custom_data.get('verdict')
+            verdicts[state.persona.name] = {'verdict': verdict, 'reasoning': state.custom_data.get('verdict_reasoning')}
+            if verdict in verdict_counts:
+                verdict_counts[verdict] += 1
+
+        now = time.perf_counter()
+        outcome = GoalOutcome(goal.name, goal.description, verdicts, verdict_counts,
+                              self.message_count - sum(o.message_count for o in self.goal_outcomes),
+                              now - self._goal_started if self._goal_started is not None else 0.0)
+        self._goal_started = now
+        self.goal_outcomes.append(outcome)
+        current_tracer().count("goal_seconds", outcome.seconds, goal=goal.name)
+        return outcome
+
+    def state_dict(self) -> Dict[str, Any]:
+        """Conversation state plus the goal queue (see AgentOrchestrator.state_dict)."""
+        state = super().state_dict()
+        state.update({
+            "current_goal": asdict(self.current_goal) if self.current_goal else None,
+            "goal_queue": [asdict(goal) for goal in self.goal_queue],
+            "completed_goals": [asdict(goal) for goal in self.completed_goals],
+            # Archived messages are journaled once, through archived_transcripts()
+            "goal_outcomes": [outcome.to_dict() for outcome in self.goal_outcomes],
+        })
+        if self.consensus is not None:
+            state["consensus"] = self.consensus.state_dict()
+        return state
+
+    def load_state_dict(self, state: Dict[str, Any]):
+        super().load_state_dict(state)
+        self.current_goal = Goal(**state["current_goal"]) if state["current_goal"] else None
+        self.goal_queue = [Goal(**goal) for goal in state["goal_queue"]]
+        self.completed_goals = [Goal(**goal) for goal in state["completed_goals"]]
+        self.goal_outcomes = [GoalOutcome(**outcome) for outcome in state.get("goal_outcomes", [])]
+        if self.consensus is not None and "consensus" in state:
+            self.consensus.load_state_dict(state["consensus"])
+
+    def archived_transcripts(self) -> List[List[Message]]:
+        """The discussion archived with each goal outcome (empty unless compact_goal_history)."""
+        return [outcome.archived_messages for outcome in self.goal_outcomes]
+
+    def restore_archived_transcripts(self, archives: List[List[Message]]):
+        for outcome, messages in zip(self.goal_outcomes, archives):
+            outcome.archived_messages = messages
+
     def get_participants_without_verdicts(self) -> List[str]:
         """Get list of participants who haven't provided verdicts yet."""
-        return [name for name, state in self.agents.items()
-                if not state.has_withdrawn and
-                state.persona.agent_type == AgentType.PARTICIPANT and
-                not state.custom_data.get('verdict')]
+        return self.agents.active_without('verdict')
+
+    def get_coordinator_urgency_level(self) -> str:
+        """
+        Urgency of the next TimeKeeper intervention. The conversation loop passes this level
+        to get_coordinator_message_content, whose texts are keyed by the timekeeper levels
+        ("remind", "insist", "demand", "force") rather than the base coordinator ones.
+        """
+        return self.get_timekeeper_urgency_level()
 
     def get_timekeeper_urgency_level(self) -> str:
         """Determine the urgency level for TimeKeeper interventions."""
+        level = self.budget_escalation_level()
+        if level is not None:
+            return ["remind", "insist", "demand", "force"][level]
         if self.message_count >= self.timekeeper_config.force_verdict_threshold:
             return "force"
         elif self.message_count >= self.timekeeper_config.demand_threshold:
@@ -630,8 +806,39 @@ Remember: The TimeKeeper's/Coordinator's cannot speak and they are part of the s
                     print(f"   {option}: {count} ({percentage:.1f}%)")
 
     def run_debate(self):
-        """Run the debate and return results."""
-        results = self.run_conversation()
+        """Run the debate and return results. Thin wrapper around run_debate_async()."""
+        return run_coroutine_sync(self.run_debate_async())
+
+    def resume(self, path: str):
+        """Resume (or start) a journaled debate and return results. Thin wrapper around resume_async()."""
+        return run_coroutine_sync(self.resume_async(path))
+
+    async def resume_async(self, path: str):
+        """
+        Continue the debate journaled at `path` from its last completed turn, then keep
+        journaling there. Turns already in the journal are restored, not regenerated.
+        Starts a new journaled debate when the file does not exist yet.
+
+        The debate must be configured as in the original run (same personas, goals,
+        watchers and verdict config); the journal holds only the state that changes.
+
+        Args:
+            path: Journal file (see agents.journal.DebateJournal)
+        """
+        journal = DebateJournal(path)
+        first_speaker = journal.restore(self)
+        if first_speaker is None:
+            first_speaker = "coordinator"
+        else:
+            print(f"♻️  Resuming debate from {path} at message {self.message_count} "
+                  f"(next speaker: {first_speaker})")
+        self.journal = journal
+        return await self.run_debate_async(first_speaker)
+
+    async def run_debate_async(self, first_speaker: str = "coordinator"):
+        """Run the debate on the current event loop and return results."""
+        self._goal_started = time.perf_counter()
+        results = await self.run_conversation_async(first_speaker)
 
         # Add verdict-specific results
         verdicts = {}
@@ -693,7 +900,9 @@ Remember: The TimeKeeper's/Coordinator's cannot speak and they are part of the s
             'goal_results': goal_results,
             'total_goals': len(all_goals),
             'current_goal': self.current_goal.name if self.current_goal else None,
-            'goals_completed_count': len(self.completed_goals)
+            'goals_completed_count': len(self.completed_goals),
+            'goal_outcomes': [outcome.to_dict() for outcome in self.goal_outcomes],
+            'turns_saved_by_consensus': sum(outcome.turns_saved for outcome in self.goal_outcomes)
         })
 
         return results
@@ -0,0 +1,147 @@
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from agents.agent_system import AgentOrchestrator
+from models.base import Message
+
+
+class DebateJournal:
+    """
+    Durable, append-only log of a conversation, written between turns so that a crashed
+    or interrupted debate can be resumed (ChainOfDebate.resume) without repeating the
+    LLM calls it already made.
+
+    The file is JSON lines. The first record identifies the debate; every following
+    record is a checkpoint holding the full state_dict() of the orchestrator, the next
+    speaker, and only the message changes since the previous checkpoint: messages kept
+    from the last one (`keep`), earlier messages whose content changed since
+    (`updated`), and new messages (`append`). Transcripts the orchestrator archived since
+    the previous checkpoint (AgentOrchestrator.archived_transcripts, e.g. the discussion of
+    a goal collapsed into its outcome) are written once, in `archive`. Each record is
+    flushed (and fsynced, by default) before the next turn starts; a record torn by a crash
+    is ignored on load.
+
+    Args:
+        path: Journal file path
+        fsync: Force every checkpoint to disk, not just to the OS
+    """
+
+    SCHEMA = "debate-journal/1"
+
+    def __init__(self, path: str, fsync: bool = True):
+        self.path = path
+        self.fsync = fsync
+        # Messages (and their revisions) as of the last checkpoint, by position
+        self._written: Optional[List[Tuple[Message, int]]] = None
+        # Archived transcripts already written
+        self._archived = 0
+
+    def _append(self, record: Dict[str, Any]):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+
+    def _read(self) -> Tuple[List[Dict[str, Any]], int]:
+        """Complete records in the file, and the number of bytes they span."""
+        if not os.path.exists(self.path):
+            return [], 0
+        records, valid_bytes = [], 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("unterminated record")
+                    records.append(json.loads(line))
+                except ValueError:
+                    # Only the last write can be torn; everything before it is complete
+                    break
+                valid_bytes += len(line)
+        return records, valid_bytes
+
+    def record(self, orchestrator: AgentOrchestrator, next_speaker: str):
+        """
+        Append a checkpoint of `orchestrator` before `next_speaker` takes a turn.
+
+        Raises:
+            ValueError: if the file already holds another debate that was not restored
+        """
+        if self._written is None:
+            if self._read()[0]:
+                raise ValueError(f"Journal {self.path} already holds a debate; resume it instead")
+            self._append({"type": "debate", "schema": self.SCHEMA, "topic": orchestrator.conversation_topic,
+                          "agents": sorted(orchestrator.agents)})
+            self._written = []
+
+        messages = orchestrator.messages
+        keep = 0
+        while keep < min(len(messages), len(self._written)) and messages[keep] is self._written[keep][0]:
+            keep += 1
+        updated = {str(position): messages[position].to_dict() for position in range(keep)
+                   if messages[position].revision != self._written[position][1]}
+        archives = orchestrator.archived_transcripts()
+
+        self._append({
+            "type": "checkpoint",
+            "next_speaker": next_speaker,
+            "keep": keep,
+            "updated": updated,
+            "append": [message.to_dict() for message in messages[keep:]],
+            "archive": [[message.to_dict() for message in archive] for archive in archives[self._archived:]],
+            "state": orchestrator.state_dict(),
+        })
+        self._written = [(message, message.revision) for message in messages]
+        self._archived = len(archives)
+
+    def load(self) -> Optional[Tuple[List[Message], Dict[str, Any], str, List[List[Message]]]]:
+        """
+        Replay the journal.
+
+        Returns:
+            (messages, state, next_speaker, archives) as of the last complete checkpoint,
+            or None for a missing or empty journal
+        """
+        messages: List[Dict[str, Any]] = []
+        archives: List[List[Dict[str, Any]]] = []
+        latest = None
+        for record in self._read()[0]:
+            if record.get("type") != "checkpoint":
+                continue
+            del messages[record["keep"]:]
+            for position, message in record["updated"].items():
+                messages[int(position)] = message
+            messages.extend(record["append"])
+            archives.extend(record.get("archive", []))
+            latest = record
+        if latest is None:
+            return None
+        return ([Message.from_dict(message) for message in messages], latest["state"], latest["next_speaker"],
+                [[Message.from_dict(message) for message in archive] for archive in archives])
+
+    def restore(self, orchestrator: AgentOrchestrator) -> Optional[str]:
+        """
+        Load the last checkpoint into `orchestrator` and continue journaling after it.
+
+        Returns:
+            The speaker of the next turn, or None if there was nothing to restore
+        """
+        records, valid_bytes = self._read()
+        if os.path.exists(self.path) and os.path.getsize(self.path) > valid_bytes:
+            # Drop a record torn by a crash so new checkpoints follow the last complete one
+            with open(self.path, "r+b") as f:
+                f.truncate(valid_bytes)
+
+        loaded = self.load()
+        if loaded is None:
+            # A journal cut off before its first checkpoint only holds the debate record
+            self._written = [] if records else None
+            return None
+        messages, state, next_speaker, archives = loaded
+        orchestrator.load_state_dict(state)
+        orchestrator.messages = messages
+        orchestrator.restore_archived_transcripts(archives)
+        self._written = [(message, message.revision) for message in messages]
+        self._archived = len(archives)
+        return next_speaker
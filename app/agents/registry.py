@@ -0,0 +1,281 @@
+from collections.abc import MutableMapping
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Set
+
+
+class FenwickTree:
+    """
+    Prefix sums over a growable list of non-negative integer weights (a binary indexed
+    tree): point updates, prefix sums and weighted searches take O(log n).
+    """
+
+    def __init__(self):
+        self._values: List[int] = []
+        self._tree: List[int] = [0]  # 1-based
+        self.total = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> int:
+        return self._values[index]
+
+    def append(self, value: int):
+        """Add a weight at the end."""
+        self._values.append(value)
+        position = len(self._values)
+        # The new node covers (position - lowbit(position), position]: sum the nodes already covering it
+        node_sum = value
+        child, stop = position - 1, position - (position & -position)
+        while child > stop:
+            node_sum += self._tree[child]
+            child -= child & -child
+        self._tree.append(node_sum)
+        self.total += value
+
+    def set(self, index: int, value: int):
+        """Replace the weight at `index`."""
+        delta = value - self._values[index]
+        if not delta:
+            return
+        self._values[index] = value
+        self.total += delta
+        position = index + 1
+        while position < len(self._tree):
+            self._tree[position] += delta
+            position += position & -position
+
+    def prefix_sum(self, count: int) -> int:
+        """Sum of the first `count` weights."""
+        total = 0
+        while count > 0:
+            total += self._tree[count]
+            count -= count & -count
+        return total
+
+    def find(self, target: float) -> int:
+        """
+        Index of the first weight whose inclusive prefix sum exceeds `target`, i.e.
+        bisect.bisect_right over the cumulative weights (zero weights are never found).
+        Requires 0 <= target < total.
+        """
+        position, covered = 0, 0
+        step = 1 << (len(self._values).bit_length() - 1) if self._values else 0
+        while step:
+            node = position + step
+            # Integer sums are exact, so comparing them to the float target matches bisect
+            if node < len(self._tree) and covered + self._tree[node] <= target:
+                position = node
+                covered += self._tree[node]
+            step >>= 1
+        return position
+
+
+class CustomData(dict):
+    """AgentState.custom_data: a dict that reports its changes to the registry holding the agent."""
+
+    def __init__(self, data, state: "AgentState"):
+        super().__init__(data)
+        self._state = state
+
+    def _changed(self):
+        registry = self._state.__dict__.get("_registry")
+        if registry is not None:
+            registry._refresh(self._state)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other):
+        super().__ior__(other)
+        self._changed()
+        return self
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._changed()
+        return value
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class AgentRegistry(MutableMapping):
+    """
+    The agents of a conversation by lowercase name, indexed for large panels.
+
+    Behaves like the Dict[str, AgentState] it replaces, and keeps in step with every
+    state it holds: whether each participant is active (not withdrawn), which custom_data
+    keys are set (for the keys passed to track()), and each active participant's speaking
+    weight in a Fenwick tree. Changing `has_withdrawn`, `message_count` or `custom_data`
+    on a state updates the indexes in O(log n), so nothing has to rescan every agent.
+    Participants keep the position they were added at, which orders every listing.
+
+    Args:
+        is_participant: Whether a state belongs to a participant; only participants are
+            indexed and sampled
+        weight: Base sampling weight of an active participant's state. Integer weights
+            keep sample() bit-for-bit identical to random.choices over the same list
+    """
+
+    def __init__(self, is_participant: Callable[["AgentState"], bool], weight: Callable[["AgentState"], int]):
+        self.is_participant = is_participant
+        self.weight = weight
+        self._states: Dict[str, "AgentState"] = {}
+        # Participants by position (None once removed), and their weights (0 while inactive)
+        self._names: List[Optional[str]] = []
+        self._positions: Dict[str, int] = {}
+        self._weights = FenwickTree()
+        self._active: Set[str] = set()
+        self._active_order: Optional[List[str]] = None
+        self._tracked: Dict[str, Set[str]] = {}
+
+    # Mapping interface
+
+    def __getitem__(self, name: str) -> "AgentState":
+        return self._states[name]
+
+    def __setitem__(self, name: str, state: "AgentState"):
+        if name in self._states:
+            del self[name]
+        self._states[name] = state
+        object.__setattr__(state, "_registry", self)
+        object.__setattr__(state, "_registry_name", name)
+        if self.is_participant(state):
+            self._positions[name] = len(self._names)
+            self._names.append(name)
+            self._weights.append(0)
+        self._refresh(state)
+
+    def __delitem__(self, name: str):
+        state = self._states.pop(name)
+        state.__dict__.pop("_registry", None)
+        state.__dict__.pop("_registry_name", None)
+        position = self._positions.pop(name, None)
+        if position is not None:
+            self._names[position] = None
+            self._weights.set(position, 0)
+        self._set_active(name, False)
+        for names in self._tracked.values():
+            names.discard(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._states)
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, name) -> bool:
+        return name in self._states
+
+    def __repr__(self) -> str:
+        return f"AgentRegistry({self._states!r})"
+
+    # Index maintenance
+
+    def _set_active(self, name: str, active: bool):
+        if active != (name in self._active):
+            if active:
+                self._active.add(name)
+            else:
+                self._active.discard(name)
+            self._active_order = None
+
+    def _refresh(self, state: "AgentState"):
+        """Re-index one state after it changed."""
+        name = state.__dict__.get("_registry_name")
+        if name is None or self._states.get(name) is not state:
+            return
+        position = self._positions.get(name)
+        if position is None:
+            return
+        active = not state.has_withdrawn
+        self._set_active(name, active)
+        self._weights.set(position, self.weight(state) if active else 0)
+        for key, names in self._tracked.items():
+            if state.custom_data.get(key):
+                names.add(name)
+            else:
+                names.discard(name)
+
+    def track(self, key: str):
+        """Index the participants whose custom_data has a truthy value for `key`."""
+        if key not in self._tracked:
+            self._tracked[key] = {name for name in self._positions if self._states[name].custom_data.get(key)}
+
+    # Queries
+
+    def active(self) -> List[str]:
+        """Names of the participants who have not withdrawn, in the order they were added."""
+        if self._active_order is None:
+            self._active_order = sorted(self._active, key=self._positions.__getitem__)
+        return list(self._active_order)
+
+    def active_count(self) -> int:
+        return len(self._active)
+
+    def is_active(self, name: str) -> bool:
+        return name in self._active
+
+    def active_without(self, key: str) -> List[str]:
+        """Active participants whose custom_data has no truthy `key` (which must be tracked)."""
+        with_key = self._tracked[key]
+        return [name for name in self.active() if name not in with_key]
+
+    def position(self, name: str) -> int:
+        """Position a participant was added at (orders every listing)."""
+        return self._positions[name]
+
+    def speaking_weight(self, name: str) -> int:
+        """Current sampling weight of a participant (0 while withdrawn)."""
+        return self._weights[self._positions[name]]
+
+    def sample(self, rng, overrides: Optional[Mapping[str, int]] = None) -> Optional[str]:
+        """
+        Draw an active participant with probability proportional to its weight, in
+        O(log n). Uses one rng.random() call and selects exactly what
+        rng.choices(self.active(), weights)[0] would.
+
+        Args:
+            rng: random.Random or the `random` module
+            overrides: Weights replacing the base ones of some active participants for this
+                draw (e.g. 0 to exclude one); inactive participants are ignored
+
+        Returns:
+            The chosen name, or None when no participant has any weight
+        """
+        overrides = {name: weight for name, weight in (overrides or {}).items() if name in self._active}
+        saved = {name: self.speaking_weight(name) for name in overrides}
+        try:
+            for name, weight in overrides.items():
+                self._weights.set(self._positions[name], weight)
+            total = self._weights.total
+            if total <= 0:
+                return None
+            # Same arithmetic as random.choices: random() * float(total), then bisect_right
+            return self._names[self._weights.find(rng.random() * (total + 0.0))]
+        finally:
+            for name, weight in saved.items():
+                self._weights.set(self._positions[name], weight)
@@ -0,0 +1,155 @@
+import asyncio
+import contextlib
+import time
+import traceback
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+
+from agents.agent_system import AgentOrchestrator, run_coroutine_sync
+
+
+@dataclass
+class JobResult:
+    """Outcome of one debate run by DebateRunner."""
+    job_id: Any
+    job: Any
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    traceback: Optional[str] = None
+    timed_out: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class RunnerStats:
+    """Counters of a DebateRunner."""
+    started: int = 0
+    completed: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    peak_concurrency: int = 0
+
+
+class DebateRunner:
+    """
+    Runs many independent debates concurrently on one event loop.
+
+    Each job (for example the text of one document) is turned into a configured
+    debate by `build_debate`; to share one API client and one rate limit between all
+    debates, build them around the same model instance, e.g.
+
+        llm = AnthropicLLM(api_key, rate_limiter=RateLimiter(requests_per_minute=50))
+        runner = DebateRunner(lambda text: make_debate(llm, text), max_concurrency=16)
+        async for outcome in runner.run({path: open(path).read() for path in paths}):
+            ...
+
+    At most `max_concurrency` debates run at a time and results are yielded as each one
+    finishes. A debate that raises or exceeds `timeout` is reported as a failed JobResult
+    without affecting the others.
+
+    Args:
+        build_debate: Creates the debate (ChainOfDebate or any AgentOrchestrator) for a job
+        max_concurrency: Maximum number of debates in flight
+        timeout: Per-debate time limit in seconds (None for no limit). Models without a
+            native acall() run in worker threads, which keep running after a timeout.
+    """
+
+    def __init__(self,
+                 build_debate: Callable[[Any], AgentOrchestrator],
+                 max_concurrency: int = 8,
+                 timeout: Optional[float] = None):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.build_debate = build_debate
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.stats = RunnerStats()
+        self._active = 0
+
+    @staticmethod
+    def _enumerate(jobs) -> Iterable[Tuple[Any, Any]]:
+        """Mappings are keyed by their keys, other iterables by position."""
+        if isinstance(jobs, Mapping):
+            return iter(jobs.items())
+        return enumerate(jobs)
+
+    @staticmethod
+    async def _run_debate(debate: AgentOrchestrator) -> Dict[str, Any]:
+        if hasattr(debate, "run_debate_async"):
+            return await debate.run_debate_async()
+        return await debate.run_conversation_async()
+
+    async def _run_job(self, job_id: Any, job: Any) -> JobResult:
+        started = time.perf_counter()
+        self.stats.started += 1
+        self._active += 1
+        self.stats.peak_concurrency = max(self.stats.peak_concurrency, self._active)
+        try:
+            debate = self.build_debate(job)
+            result = await asyncio.wait_for(self._run_debate(debate), self.timeout)
+            self.stats.completed += 1
+            return JobResult(job_id, job, result=result, elapsed=time.perf_counter() - started)
+        except asyncio.TimeoutError:
+            self.stats.timed_out += 1
+            return JobResult(job_id, job, error=f"Timed out after {self.timeout}s", timed_out=True,
+                             elapsed=time.perf_counter() - started)
+        except Exception as e:
+            self.stats.failed += 1
+            print(f"❌ Debate for job {job_id!r} failed: {type(e).__name__}: {e}")
+            return JobResult(job_id, job, error=f"{type(e).__name__}: {e}", traceback=traceback.format_exc(),
+                             elapsed=time.perf_counter() - started)
+        finally:
+            self._active -= 1
+
+    async def _run_indexed(self, jobs) -> AsyncIterator[Tuple[int, JobResult]]:
+        pending = enumerate(self._enumerate(jobs))
+        results: asyncio.Queue = asyncio.Queue()
+
+        async def worker():
+            try:
+                for position, (job_id, job) in pending:
+                    await results.put((position, await self._run_job(job_id, job)))
+            finally:
+                results.put_nowait(None)
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.max_concurrency)]
+        try:
+            finished = 0
+            while finished < len(workers):
+                item = await results.get()
+                if item is None:
+                    finished += 1
+                else:
+                    yield item
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def run(self, jobs) -> AsyncIterator[JobResult]:
+        """
+        Run a debate per job, yielding each JobResult as soon as its debate finishes.
+
+        Jobs are pulled lazily, so `jobs` may be a generator over a large corpus.
+        Leaving the iteration early cancels the debates still in flight.
+
+        Args:
+            jobs: Mapping of job id to job, or an iterable of jobs (ids are positions)
+        """
+        async with contextlib.aclosing(self._run_indexed(jobs)) as outcomes:
+            async for _, outcome in outcomes:
+                yield outcome
+
+    async def run_all_async(self, jobs) -> List[JobResult]:
+        """Run every job and return the results in job order."""
+        outcomes = [item async for item in self._run_indexed(jobs)]
+        return [outcome for _, outcome in sorted(outcomes, key=lambda item: item[0])]
+
+    def run_all(self, jobs) -> List[JobResult]:
+        """Blocking wrapper around run_all_async()."""
+        return run_coroutine_sync(self.run_all_async(jobs))
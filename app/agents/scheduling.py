@@ -0,0 +1,117 @@
+from typing import Any, Dict, Optional
+
+from agents.agent_system import AgentOrchestrator, SpeakerPolicy, WeightedRandomPolicy
+
+
+class RoundRobinPolicy(SpeakerPolicy):
+    """
+    Active participants take turns in the order they joined, skipping those who have
+    withdrawn. Ignores whispers and message counts, so every participant gets a turn
+    within one cycle.
+    """
+
+    def __init__(self):
+        self._last: Optional[str] = None
+
+    def choose(self, orchestrator: AgentOrchestrator, last_speaker: Optional[str]) -> Optional[str]:
+        agents = orchestrator.agents
+        active = agents.active()
+        if not active:
+            return None
+        chosen = active[0]
+        if self._last is not None and self._last in agents:
+            last_position = agents.position(self._last)
+            chosen = next((name for name in active if agents.position(name) > last_position), active[0])
+        self._last = chosen
+        return chosen
+
+    def state_dict(self) -> Dict[str, Any]:
+        return {"last": self._last}
+
+    def load_state_dict(self, state: Dict[str, Any]):
+        self._last = state.get("last")
+
+
+class VerdictPendingFirstPolicy(SpeakerPolicy):
+    """
+    Gives the floor to participants who have not yet given a verdict for the current goal
+    (custom_data[`key`] unset), drawn by speaking weight and avoiding the last speaker
+    when another is pending. Once everyone active has a verdict (or the conversation
+    tracks none), defers to `fallback`.
+
+    Args:
+        fallback: Policy used when nobody is pending (WeightedRandomPolicy by default)
+        key: custom_data key marking a participant as decided
+    """
+
+    def __init__(self, fallback: Optional[SpeakerPolicy] = None, key: str = "verdict"):
+        self.fallback = fallback or WeightedRandomPolicy()
+        self.key = key
+
+    def pending(self, orchestrator: AgentOrchestrator) -> list:
+        """Active participants still owing a verdict."""
+        orchestrator.agents.track(self.key)
+        return orchestrator.agents.active_without(self.key)
+
+    def choose(self, orchestrator: AgentOrchestrator, last_speaker: Optional[str]) -> Optional[str]:
+        pending = self.pending(orchestrator)
+        if last_speaker and len(pending) > 1 and last_speaker.lower() in pending:
+            pending.remove(last_speaker.lower())
+        if not pending:
+            return self.fallback.choose(orchestrator, last_speaker)
+        weights = [orchestrator.agents.speaking_weight(name) for name in pending]
+        return orchestrator.rng.choices(pending, weights=weights)[0]
+
+    def state_dict(self) -> Dict[str, Any]:
+        return {"fallback": self.fallback.state_dict()}
+
+    def load_state_dict(self, state: Dict[str, Any]):
+        self.fallback.load_state_dict(state.get("fallback", {}))
+
+
+class UrgencyAwarePolicy(VerdictPendingFirstPolicy):
+    """
+    Shifts the floor towards participants still owing a verdict as the conversation's
+    urgency rises: their speaking weight is multiplied by the bias of the current level,
+    and a bias of None gives the floor to them alone. The level comes from
+    get_timekeeper_urgency_level() in a ChainOfDebate, and from
+    get_coordinator_urgency_level() otherwise.
+
+    Args:
+        pending_bias: Weight multiplier per urgency level (levels not listed: 1, i.e. the
+            fallback policy's choice)
+        fallback: Policy used at bias 1 and when nobody is pending
+        key: custom_data key marking a participant as decided
+    """
+
+    DEFAULT_BIAS: Dict[str, Optional[int]] = {
+        # ChainOfDebate timekeeper levels
+        "remind": 1, "insist": 3, "demand": 10, "force": None,
+        # Coordinator levels
+        "normal": 1, "elevated": 3, "urgent": 10, "critical": None,
+    }
+
+    def __init__(self, pending_bias: Optional[Dict[str, Optional[int]]] = None,
+                 fallback: Optional[SpeakerPolicy] = None, key: str = "verdict"):
+        super().__init__(fallback, key)
+        self.pending_bias = dict(self.DEFAULT_BIAS if pending_bias is None else pending_bias)
+
+    @staticmethod
+    def urgency_level(orchestrator: AgentOrchestrator) -> str:
+        if hasattr(orchestrator, "get_timekeeper_urgency_level"):
+            return orchestrator.get_timekeeper_urgency_level()
+        return orchestrator.get_coordinator_urgency_level()
+
+    def choose(self, orchestrator: AgentOrchestrator, last_speaker: Optional[str]) -> Optional[str]:
+        bias = self.pending_bias.get(self.urgency_level(orchestrator), 1)
+        if bias is None:
+            return super().choose(orchestrator, last_speaker)
+        pending = self.pending(orchestrator) if bias != 1 else []
+        if not pending:
+            return self.fallback.choose(orchestrator, last_speaker)
+
+        agents = orchestrator.agents
+        overrides = {name: agents.speaking_weight(name) * bias for name in pending}
+        if last_speaker and agents.is_active(last_speaker.lower()) and agents.active_count() > 1:
+            overrides[last_speaker.lower()] = 0
+        return agents.sample(orchestrator.rng, overrides)
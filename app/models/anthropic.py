@@ -1,11 +1,59 @@
+import asyncio
+import time
 import traceback
 
 import anthropic
 import uuid
 import os
 import datetime
-from typing import List, Optional
-from .base import BaseModel, Message  # Assuming your base classes are in a separate module
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Union
+from .base import BaseModel, Message, StreamEvent  # Assuming your base classes are in a separate module
+from .scaffolding import ParsedResponse, StreamingScaffoldingParser
+from .transcript import TranscriptViewCache, BEGIN_FILLER, USER_FILLER
+from .rate_limit import RateLimiter, RetryPolicy, estimate_request_tokens, is_retryable, retry_after_seconds
+from telemetry.tracing import current_tracer
+
+
+EPHEMERAL_CACHE = {"type": "ephemeral"}
+
+# Token counters copied from API usage blocks onto Message.usage
+USAGE_FIELDS = ("input_tokens", "output_tokens", "cache_read_input_tokens", "cache_creation_input_tokens")
+
+
+def _usage_tokens(usage, field_name: str) -> int:
+    """Read a token counter from an API usage block; missing or non-numeric values count as 0."""
+    value = getattr(usage, field_name, None)
+    return value if isinstance(value, int) else 0
+
+
+@dataclass
+class PromptCacheStats:
+    """Prompt-cache counters accumulated from API usage reports."""
+    requests: int = 0
+    hits: int = 0
+    misses: int = 0
+    input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.requests if self.requests else 0.0
+
+    def record(self, usage):
+        """Record the usage block of one API response. A hit is any request that read from the cache."""
+        if usage is None:
+            return
+        cache_read = _usage_tokens(usage, "cache_read_input_tokens")
+        self.requests += 1
+        self.input_tokens += _usage_tokens(usage, "input_tokens")
+        self.cache_read_input_tokens += cache_read
+        self.cache_creation_input_tokens += _usage_tokens(usage, "cache_creation_input_tokens")
+        if cache_read > 0:
+            self.hits += 1
+        else:
+            self.misses += 1
 
 
 class AnthropicLLM(BaseModel):
@@ -17,7 +65,12 @@ class AnthropicLLM(BaseModel):
                  api_key: str,
                  model: str = "claude-sonnet-4-20250514",
                  max_tokens: int = 4096,
-                 temperature: float = 0.7):
+                 temperature: float = 0.7,
+                 client: Optional[anthropic.Anthropic] = None,
+                 async_client: Optional[anthropic.AsyncAnthropic] = None,
+                 enable_prompt_cache: bool = True,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = RetryPolicy()):
         """
         Initialize the Anthropic LLM.
 
@@ -26,13 +79,30 @@ class AnthropicLLM(BaseModel):
             model: Model name (default: claude-sonnet-4-20250514)
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature (0.0 to 1.0)
+            client: Optional pre-built sync client (e.g. one shared by many debates)
+            async_client: Optional pre-built async client used by acall()
+            enable_prompt_cache: Mark the system prompt, scaffolding examples and older
+                transcript as cacheable prefixes
+            rate_limiter: Optional limiter shared with every other model drawing on the
+                same API limits; each request waits for capacity before it is sent
+                (see shared_rate_limiter())
+            retry_policy: Backoff for transient errors (429, overload, 5xx, connection
+                errors). None leaves retries to the SDK client's own defaults.
         """
         if api_key is None:
             api_key = os.environ.get("ANTHROPIC_API_KEY")
-        self.client = anthropic.Anthropic(api_key=api_key)
+        # Retries go through retry_policy so they are rate limited and counted
+        max_retries = 0 if retry_policy is not None else anthropic.DEFAULT_MAX_RETRIES
+        self.client = client or anthropic.Anthropic(api_key=api_key, max_retries=max_retries)
+        self.async_client = async_client or anthropic.AsyncAnthropic(api_key=api_key, max_retries=max_retries)
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
+        self.enable_prompt_cache = enable_prompt_cache
+        self.cache_stats = PromptCacheStats()
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self._transcript_views = TranscriptViewCache()
 
     def _filter_messages_for_speaker(self, messages: List[Message], speaker: str) -> List[Message]:
         """
@@ -88,6 +158,37 @@ class AnthropicLLM(BaseModel):
 
         return formatted_messages
 
+    def _format_messages_incremental(self, messages: List[Message], current_speaker: str) -> List[dict]:
+        """
+        Incremental equivalent of _ensure_alternating_roles(_format_messages_for_anthropic(...)).
+
+        Rendered history is kept in a per-speaker TranscriptView, so only messages that are
+        new (or were mutated) since the speaker's previous turn get rendered. Visibility
+        filtering happens inside the view.
+
+        Args:
+            messages: List of Message objects (without the system message), unfiltered
+            current_speaker: The speaker who is currently generating a response
+
+        Returns:
+            List of dictionaries formatted for Anthropic API, ending in the assistant prefill
+        """
+        view = self._transcript_views.get(current_speaker, messages)
+        formatted_messages = list(view.sync(messages))
+        last_visible = view.last_visible
+
+        if last_visible is not None and last_visible.speaker == current_speaker:
+            # Last message is from current speaker - extract scaffolding for continuation
+            formatted_messages[-1] = {"role": "assistant", "content": self._extract_scaffolding(last_visible)}
+        else:
+            if not formatted_messages:
+                formatted_messages.append(BEGIN_FILLER)
+            elif formatted_messages[-1]["role"] == "assistant":
+                formatted_messages.append(USER_FILLER)
+            formatted_messages.append({"role": "assistant", "content": self._create_temp_scaffolding(current_speaker)})
+
+        return formatted_messages
+
     def _ensure_alternating_roles(self, formatted_messages: List[dict]) -> List[dict]:
         """
         Ensure messages alternate between user and assistant roles as required by Anthropic API.
@@ -199,86 +300,421 @@ class AnthropicLLM(BaseModel):
             return messages[0].content, messages[1:]
         return None, messages
 
-    def __call__(self,
-                 speaker: str,
-                 messages: List[Message],
-                 stop_sequences: List[str] = None) -> Message:
+    def _build_system_blocks(self, system_message: str, speaker: str) -> List[dict]:
         """
-        Generate a response using Anthropic's API.
+        Split the prepared system message into cacheable blocks.
+
+        The agent system prompt and the scaffolding examples appended by prepare() each
+        get a cache breakpoint, so a change to one does not evict the other.
+
+        Args:
+            system_message: System message content as produced by prepare()
+            speaker: The speaker generating the response
+
+        Returns:
+            List of text blocks for the "system" API parameter
+        """
+        scaffolding_suffix = "\n\n" + self.get_scaffolding_examples(speaker)
+        blocks = []
+        if system_message.endswith(scaffolding_suffix) and len(system_message) > len(scaffolding_suffix):
+            blocks.append({"type": "text", "text": system_message[:-len(scaffolding_suffix)],
+                           "cache_control": EPHEMERAL_CACHE})
+            blocks.append({"type": "text", "text": scaffolding_suffix, "cache_control": EPHEMERAL_CACHE})
+        else:
+            blocks.append({"type": "text", "text": system_message, "cache_control": EPHEMERAL_CACHE})
+        return blocks
+
+    @staticmethod
+    def _mark_transcript_breakpoint(formatted_messages: List[dict]):
+        """
+        Put a cache breakpoint on the last message before the assistant prefill.
+
+        Everything up to that point is unchanged on the speaker's next turn, so the
+        next request reads it from the cache and only pays for the new tail.
+        """
+        if len(formatted_messages) < 2:
+            return
+        stable = formatted_messages[-2]
+        content: Union[str, List[dict]] = stable["content"]
+        if isinstance(content, str):
+            content = [{"type": "text", "text": content}]
+        else:
+            content = [dict(block) for block in content]
+        content[-1]["cache_control"] = EPHEMERAL_CACHE
+        formatted_messages[-2] = {"role": stable["role"], "content": content}
+
+    def reset_cache_stats(self):
+        """Start a fresh set of prompt-cache counters (e.g. at the start of a run)."""
+        self.cache_stats = PromptCacheStats()
+
+    def _build_request(self,
+                       speaker: str,
+                       messages: List[Message],
+                       stop_sequences: List[str] = None) -> dict:
+        """
+        Build the Anthropic API parameters for the given speaker's turn.
+
+        Args:
+            speaker: The speaker generating the response
+            messages: List of previous messages
+            stop_sequences: Optional stop sequences
+
+        Returns:
+            Dictionary of keyword arguments for messages.create
+        """
+        messages = self.prepare(speaker, messages)
+
+        # Extract system message if present (system messages are visible to everyone)
+        system_message, user_messages = self._extract_system_message(messages)
+
+        # Filter by whisper visibility, format for Anthropic API and ensure alternating roles,
+        # reusing what was rendered for this speaker on previous turns
+        formatted_messages = self._format_messages_incremental(user_messages, speaker)
+
+        # If we're creating new scaffolding and have a speaking_to target, update it
+        if not formatted_messages:
+            formatted_messages = []
+        if formatted_messages[-1]["role"] != "assistant":
+            formatted_messages.append({"role": "assistant", "content": self._create_temp_scaffolding(speaker)})
+
+        # Prepare API call parameters
+        api_params = {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "messages": formatted_messages
+        }
+
+        if self.enable_prompt_cache:
+            self._mark_transcript_breakpoint(formatted_messages)
+
+        if system_message:
+            api_params["system"] = (self._build_system_blocks(system_message, speaker)
+                                    if self.enable_prompt_cache else system_message)
+        if stop_sequences:
+            api_params["stop_sequences"] = stop_sequences
+
+        return api_params
+
+    def _build_recovery_request(self, speaker: str, api_params: dict) -> tuple[dict, str]:
         """
+        Build a second request that forces the model to continue from complete scaffolding.
+
+        Args:
+            speaker: The speaker generating the response
+            api_params: The parameters of the failed request
+
+        Returns:
+            Tuple of (recovery_api_params, recovery_scaffolding)
+        """
+        recovery_scaffolding = self._create_recovery_scaffolding(speaker, "All", False)
+
+        # Create new formatted messages with forced scaffolding as the assistant message
+        recovery_formatted_messages = api_params["messages"][:-1]  # Remove the last assistant message
+        recovery_formatted_messages.append({
+            "role": "assistant",
+            "content": recovery_scaffolding
+        })
+
+        # Update API params with new messages
+        recovery_api_params = api_params.copy()
+        recovery_api_params["messages"] = recovery_formatted_messages
+        return recovery_api_params, recovery_scaffolding
+
+    @staticmethod
+    def _parse_recovery_response(speaker: str, recovery_scaffolding: str, recovery_response) -> Message:
+        """Parse the recovery response, falling back to a plain message if that fails too."""
+        recovery_text = recovery_scaffolding + recovery_response.content[0].text
+
         try:
-            messages = self.prepare(speaker, messages)
+            return Message.parse_from_response(recovery_text)
+        except Exception as recovery_parse_error:
+            print(f"❌ Recovery attempt also failed: {recovery_parse_error}")
+            # Last resort: create a basic message manually
+            return Message.make(
+                content=recovery_response.content[0].text,
+                speaker=speaker,
+                speaking_to="All",  # Speak to everyone as fallback
+                is_whisper=False
+            )
+
+    def _create(self, api_params: dict):
+        """Send one request with the sync client. Subclasses override the three transport hooks."""
+        return self.client.messages.create(**api_params)
+
+    async def _acreate(self, api_params: dict):
+        """Send one request with the async client."""
+        return await self.async_client.messages.create(**api_params)
+
+    def _stream(self, api_params: dict):
+        """Open a streaming request (an async context manager exposing text_stream)."""
+        return self.async_client.messages.stream(**api_params)
+
+    def _reserve_capacity(self, api_params: dict) -> int:
+        """Wait until the rate limiter allows this request. Returns the tokens reserved for it."""
+        if self.rate_limiter is None:
+            return 0
+        tokens = estimate_request_tokens(api_params)
+        with current_tracer().span("rate_limit"):
+            self.rate_limiter.acquire_sync(tokens)
+        return tokens
+
+    async def _areserve_capacity(self, api_params: dict) -> int:
+        """Async version of _reserve_capacity()."""
+        if self.rate_limiter is None:
+            return 0
+        tokens = estimate_request_tokens(api_params)
+        with current_tracer().span("rate_limit"):
+            await self.rate_limiter.acquire(tokens)
+        return tokens
+
+    def _sleep(self, seconds: float):
+        """Wait out a retry backoff."""
+        time.sleep(seconds)
+
+    async def _asleep(self, seconds: float):
+        """Wait out a retry backoff without blocking the event loop."""
+        await asyncio.sleep(seconds)
+
+    def _retry_delay(self, error: Exception, attempt: int, reserved: int) -> Optional[float]:
+        """
+        Decide whether a failed request is retried.
 
-            # Filter messages based on whisper visibility
-            filtered_messages = self._filter_messages_for_speaker(messages, speaker)
+        Args:
+            error: Exception raised by the transport
+            attempt: Index of the failed attempt (0 for the first)
+            reserved: Tokens reserved for the failed attempt, which are returned to the limiter
 
-            # Extract system message if present
-            system_message, user_messages = self._extract_system_message(filtered_messages)
+        Returns:
+            Seconds to back off before the next attempt, or None to give up
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.settle(reserved, 0)
+        policy = self.retry_policy
+        if policy is None or attempt + 1 >= policy.max_attempts or not is_retryable(error):
+            return None
+
+        delay = policy.delay(attempt, retry_after_seconds(error))
+        current_tracer().count("retries", model=self.model, error=type(error).__name__)
+        print(f"⏳ {type(error).__name__} from the API, retrying in {delay:.1f}s "
+              f"(attempt {attempt + 2}/{policy.max_attempts})")
+        if self.rate_limiter is not None:
+            self.rate_limiter.stats.retries += 1
+            if isinstance(error, anthropic.RateLimitError):
+                # Hold back every request sharing the limit; the retry then queues behind the pause
+                self.rate_limiter.pause(delay)
+                return 0.0
+        return delay
+
+    def _send(self, api_params: dict, speaker: str, total: Optional[dict] = None, **attributes):
+        """
+        Send one request through the rate limiter, retrying transient errors.
 
-            # Format messages for Anthropic API
-            formatted_messages = self._format_messages_for_anthropic(user_messages, speaker)
+        Returns:
+            The response and `total` with its token usage added
+        """
+        tracer = current_tracer()
+        attempt = 0
+        while True:
+            reserved = self._reserve_capacity(api_params)
+            try:
+                with tracer.span("api", model=self.model, speaker=speaker, **attributes) as span:
+                    response = self._create(api_params)
+                    return response, self._record_usage(getattr(response, "usage", None), span, total, reserved)
+            except Exception as error:
+                delay = self._retry_delay(error, attempt, reserved)
+                if delay is None:
+                    raise
+                attempt += 1
+                with tracer.span("retry_backoff"):
+                    self._sleep(delay)
+
+    async def _asend(self, api_params: dict, speaker: str, total: Optional[dict] = None, **attributes):
+        """Async version of _send()."""
+        tracer = current_tracer()
+        attempt = 0
+        while True:
+            reserved = await self._areserve_capacity(api_params)
+            try:
+                with tracer.span("api", model=self.model, speaker=speaker, **attributes) as span:
+                    response = await self._acreate(api_params)
+                    return response, self._record_usage(getattr(response, "usage", None), span, total, reserved)
+            except Exception as error:
+                delay = self._retry_delay(error, attempt, reserved)
+                if delay is None:
+                    raise
+                attempt += 1
+                with tracer.span("retry_backoff"):
+                    await self._asleep(delay)
+
+    def _record_usage(self, usage, span, total: Optional[dict] = None, reserved: int = 0) -> Optional[dict]:
+        """
+        Record one API usage block in the cache counters and on the current "api" span,
+        and settle the rate-limit reservation made for the request. A response without a
+        usage block (e.g. from a proxy or a replay) releases its reservation, like a failed
+        request, since nothing is known to have been spent.
 
-            # Ensure alternating roles
-            formatted_messages = self._ensure_alternating_roles(formatted_messages)
+        Returns:
+            `total` with this call's token counts added (a new dict when `total` is None)
+        """
+        self.cache_stats.record(usage)
+        counts = {name: _usage_tokens(usage, name) for name in USAGE_FIELDS} if usage is not None else None
+        if self.rate_limiter is not None:
+            self.rate_limiter.settle(reserved, sum(counts.values()) if counts is not None else 0)
+        if counts is None:
+            return total
+        for name, tokens in counts.items():
+            span.set_attribute(name, tokens)
+        if total is None:
+            return counts
+        return {name: total.get(name, 0) + tokens for name, tokens in counts.items()}
 
-            # If we're creating new scaffolding and have a speaking_to target, update it
-            if not formatted_messages:
-                formatted_messages = []
-            if formatted_messages[-1]["role"] != "assistant":
-                formatted_messages.append({"role": "assistant", "content": self._create_temp_scaffolding(speaker)})
-
-            # Prepare API call parameters
-            api_params = {
-                "model": self.model,
-                "max_tokens": self.max_tokens,
-                "temperature": self.temperature,
-                "messages": formatted_messages
-            }
-
-            if system_message:
-                api_params["system"] = system_message
-            if stop_sequences:
-                api_params["stop_sequences"] = stop_sequences
+    def __call__(self,
+                 speaker: str,
+                 messages: List[Message],
+                 stop_sequences: List[str] = None) -> Message:
+        """
+        Generate a response using Anthropic's API.
+        """
+        tracer = current_tracer()
+        try:
+            with tracer.span("prompt_assembly", speaker=speaker):
+                api_params = self._build_request(speaker, messages, stop_sequences)
 
             # Make the API call
-            response = self.client.messages.create(**api_params)
-            response_text = formatted_messages[-1]['content'] + response.content[0].text
+            response, usage = self._send(api_params, speaker)
+            response_text = api_params["messages"][-1]['content'] + response.content[0].text
 
             # Try to parse the response
             try:
-                return Message.parse_from_response(response_text)
+                with tracer.span("parse_response"):
+                    message = Message.parse_from_response(response_text)
             except Exception as parse_error:
                 print(f"⚠️ Failed to parse LLM response, retrying with forced scaffolding: {parse_error}")
 
                 # FALLBACK: Completely redo the call with forced scaffolding
-                recovery_scaffolding = self._create_recovery_scaffolding(speaker, "All", False)
+                recovery_api_params, recovery_scaffolding = self._build_recovery_request(speaker, api_params)
 
-                # Create new formatted messages with forced scaffolding as the assistant message
-                recovery_formatted_messages = formatted_messages[:-1]  # Remove the last assistant message
-                recovery_formatted_messages.append({
-                    "role": "assistant",
-                    "content": recovery_scaffolding
-                })
+                # Second attempt with forced scaffolding
+                recovery_response, usage = self._send(recovery_api_params, speaker, usage, recovery=True)
+                message = self._parse_recovery_response(speaker, recovery_scaffolding, recovery_response)
 
-                # Update API params with new messages
-                recovery_api_params = api_params.copy()
-                recovery_api_params["messages"] = recovery_formatted_messages
+            message.usage = usage
+            return message
 
-                # Second attempt with forced scaffolding
-                recovery_response = self.client.messages.create(**recovery_api_params)
-                recovery_text = recovery_scaffolding + recovery_response.content[0].text
+        except anthropic.APIError as e:
+            raise RuntimeError(f"Anthropic API error: {str(e)}")
+        except Exception as e:
+            raise RuntimeError(f"Unexpected error calling Anthropic API: {str(e)}")
+
+    async def acall(self,
+                    speaker: str,
+                    messages: List[Message],
+                    stop_sequences: List[str] = None) -> Message:
+        """
+        Generate a response using Anthropic's async client, without blocking the event loop.
+        """
+        tracer = current_tracer()
+        try:
+            with tracer.span("prompt_assembly", speaker=speaker):
+                api_params = self._build_request(speaker, messages, stop_sequences)
+
+            # Make the API call
+            response, usage = await self._asend(api_params, speaker)
+            response_text = api_params["messages"][-1]['content'] + response.content[0].text
+
+            return await self._aparse_or_recover(speaker, api_params, response_text, usage)
 
+        except anthropic.APIError as e:
+            raise RuntimeError(f"Anthropic API error: {str(e)}")
+        except Exception as e:
+            raise RuntimeError(f"Unexpected error calling Anthropic API: {str(e)}")
+
+    async def _aparse_or_recover(self, speaker: str, api_params: dict, response_text: str,
+                                 usage: Optional[dict] = None) -> Message:
+        """Parse a response, redoing the call with forced scaffolding if that fails."""
+        tracer = current_tracer()
+        try:
+            with tracer.span("parse_response"):
+                message = Message.parse_from_response(response_text)
+        except Exception as parse_error:
+            print(f"⚠️ Failed to parse LLM response, retrying with forced scaffolding: {parse_error}")
+
+            # FALLBACK: Completely redo the call with forced scaffolding
+            recovery_api_params, recovery_scaffolding = self._build_recovery_request(speaker, api_params)
+
+            # Second attempt with forced scaffolding
+            recovery_response, usage = await self._asend(recovery_api_params, speaker, usage, recovery=True)
+            message = self._parse_recovery_response(speaker, recovery_scaffolding, recovery_response)
+
+        message.usage = usage
+        return message
+
+    async def astream(self,
+                      speaker: str,
+                      messages: List[Message],
+                      stop_sequences: List[str] = None,
+                      on_event: Optional[Callable[[StreamEvent], None]] = None,
+                      should_abort: Optional[Callable[[ParsedResponse], bool]] = None) -> Message:
+        """
+        Generate a response with the streaming API, parsing the scaffolding as text arrives.
+
+        Speaker, SpeakingTo and Whisper are reported as soon as their tags close and content
+        is reported chunk by chunk. Generation stops early once </Content> closes and the
+        message's visibility is settled (or at </Message>), and as soon as should_abort()
+        returns True for the tags written inside <Content> so far. A response cut off inside
+        <Content> keeps the content generated up to that point.
+        """
+        started = time.perf_counter()
+        tracer = current_tracer()
+
+        def emit(kind: str, field_name: Optional[str] = None, value=None):
+            if on_event is not None:
+                on_event(StreamEvent(kind, speaker, field_name, value, time.perf_counter() - started))
+
+        try:
+            with tracer.span("prompt_assembly", speaker=speaker):
+                api_params = self._build_request(speaker, messages, stop_sequences)
+            parser = StreamingScaffoldingParser(api_params["messages"][-1]["content"])
+            for kind, field_name, value in parser.prefix_updates:
+                emit(kind, field_name, value)
+
+            attempt = 0
+            first_token = None
+            while True:
+                reserved = await self._areserve_capacity(api_params)
                 try:
-                    return Message.parse_from_response(recovery_text)
-                except Exception as recovery_parse_error:
-                    print(f"❌ Recovery attempt also failed: {recovery_parse_error}")
-                    # Last resort: create a basic message manually
-                    return Message.make(
-                        content=recovery_response.content[0].text,
-                        speaker=speaker,
-                        speaking_to="All",  # Speak to everyone as fallback
-                        is_whisper=False
-                    )
+                    with tracer.span("api", model=self.model, speaker=speaker, streamed=True) as span:
+                        async with self._stream(api_params) as stream:
+                            async for text in stream.text_stream:
+                                if first_token is None:
+                                    first_token = time.perf_counter() - started
+                                for kind, field_name, value in parser.feed(text):
+                                    emit(kind, field_name, value)
+                                if parser.can_stop():
+                                    break
+                                if should_abort is not None and should_abort(parser.content_fields):
+                                    span.set_attribute("aborted", True)
+                                    emit("abort")
+                                    break
+                            # Leaving the context closes the connection, which ends generation early
+                            snapshot = stream.current_message_snapshot
+                        if first_token is not None:
+                            span.set_attribute("time_to_first_token", first_token)
+                        usage = self._record_usage(getattr(snapshot, "usage", None), span, reserved=reserved)
+                    break
+                except Exception as error:
+                    # Only a request that failed before streaming anything can be sent again
+                    delay = None if first_token is not None else self._retry_delay(error, attempt, reserved)
+                    if delay is None:
+                        raise
+                    attempt += 1
+                    with tracer.span("retry_backoff"):
+                        await self._asleep(delay)
+
+            message = await self._aparse_or_recover(speaker, api_params, parser.final_text(), usage)
+            emit("complete", value=message)
+            return message
 
         except anthropic.APIError as e:
             raise RuntimeError(f"Anthropic API error: {str(e)}")
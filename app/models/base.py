@@ -1,7 +1,12 @@
 import abc
+import asyncio
 import datetime
+import time
 import uuid
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+from .scaffolding import ParsedResponse, parse_scaffolding
 
 
 class Artifact(abc.ABC):
@@ -14,7 +19,34 @@ class Artifact(abc.ABC):
         raise NotImplementedError
 
 
+@dataclass
+class StreamEvent:
+    """
+    Partial-message update emitted while a response is being generated.
+
+    kind is one of:
+        "field": a scaffolding field became known (field/value hold its name and value,
+                 e.g. "speaking_to" / "Bob")
+        "content": value holds new <Content> text
+        "abort": generation was stopped early because should_abort() reported a violation
+        "complete": generation finished; value holds the final Message
+    """
+    kind: str
+    speaker: str
+    field: Optional[str] = None
+    value: Any = None
+    elapsed: float = 0.0  # seconds since the request was started
+
+
 class Message(object):
+    # Fields that affect to_prompt() or visibility. Re-assigning one after construction
+    # bumps the message's revision so rendering caches know to refresh it.
+    RENDERED_FIELDS = frozenset({"id", "content", "speaker", "timestamp", "artifacts", "speaking_to",
+                                 "is_whisper", "thoughts", "private_predictions"})
+
+    # Total number of post-construction mutations across all messages
+    mutation_count = 0
+
     def __init__(self, id: str, content: str, speaker: str, timestamp: str, artifacts: List[Artifact],
                  speaking_to: Optional[str] = None, is_whisper: bool = False, thoughts: str = None, private_predictions: str = None):
         self.id = id
@@ -26,6 +58,17 @@ class Message(object):
         self.is_whisper = is_whisper
         self.thoughts = thoughts
         self.private_predictions = private_predictions
+        # Token usage reported by the API for the call(s) that generated this message, if any
+        self.usage: Optional[dict] = None
+        # History epoch the message was added in (e.g. the debate goal it belongs to); set by the orchestrator
+        self.epoch = 0
+        self.revision = 0
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in Message.RENDERED_FIELDS and "revision" in self.__dict__:
+            object.__setattr__(self, "revision", self.revision + 1)
+            Message.mutation_count += 1
 
     def to_prompt(self, speaker=None, **kwargs) -> str:
         artifacts_section = "\n".join([f"<li id=\"{a.id}\" type=\"{a.arch_type}\">" + a.to_prompt() + "</li>"
@@ -52,6 +95,24 @@ class Message(object):
                 f"<Content>{self.content}</Content>\n"
                 f"</Message>")
 
+    # Fields saved by to_dict(); artifacts are left out (they have no serialized form)
+    SERIALIZED_FIELDS = ("id", "content", "speaker", "timestamp", "speaking_to", "is_whisper", "thoughts",
+                         "private_predictions", "usage", "epoch")
+
+    def to_dict(self) -> dict:
+        """JSON-serializable copy of the message (without artifacts)."""
+        return {name: getattr(self, name) for name in Message.SERIALIZED_FIELDS}
+
+    @staticmethod
+    def from_dict(data: dict) -> 'Message':
+        """Rebuild a message saved with to_dict()."""
+        message = Message(data["id"], data["content"], data["speaker"], data["timestamp"], [],
+                          data.get("speaking_to"), data.get("is_whisper", False), data.get("thoughts"),
+                          data.get("private_predictions"))
+        message.usage = data.get("usage")
+        message.epoch = data.get("epoch", 0)
+        return message
+
     @staticmethod
     def make(content, speaker, artifacts=None, speaking_to=None, is_whisper=False, thoughts=None):
         return Message(str(uuid.uuid4()), content, speaker, str(datetime.datetime.now()),
@@ -68,42 +129,51 @@ class Message(object):
         Returns:
             Message object parsed from the response
         """
-        import re
-
-        # Extract message ID
-        id_match = re.search(r'<Message id="([^"]*)"', response_text)
-        msg_id = id_match.group(1) if id_match else str(uuid.uuid4())
+        parsed = parse_scaffolding(response_text)
 
-        # Extract timestamp
-        timestamp_match = re.search(r'timestamp="([^"]*)"', response_text)
-        timestamp = timestamp_match.group(1) if timestamp_match else str(datetime.datetime.now())
-
-        # Extract speaker
-        speaker_match = re.search(r'<Speaker>([^<]*)</Speaker>', response_text)
-        speaker = speaker_match.group(1) if speaker_match else "unknown"
-
-        # Extract speaking_to
-        speaking_to_match = re.search(r'<SpeakingTo>([^<]*)</SpeakingTo>', response_text)
-        speaking_to = speaking_to_match.group(1) if speaking_to_match else None
-
-        # Extract whisper flag
-        whisper_match = re.search(r'<Whisper>([^<]*)</Whisper>', response_text)
-        is_whisper = whisper_match.group(1).lower() == 'true' if whisper_match else False
-
-        # Extract content
-        content_match = re.search(r'<Content>(.*?)</Content>', response_text, re.DOTALL)
-        content = content_match.group(1).strip() if content_match else ""
-
-        thoughts_match = re.search(r'<PrivateThoughts>(.*?)</PrivateThoughts>', response_text, re.DOTALL)
-        thoughts = thoughts_match.group(1).strip() if thoughts_match else ""
-
-        private_predictions_match = re.search(r'<PrivatePredictions>(.*?)</PrivatePredictions>', response_text, re.DOTALL)
-        private_predictions = private_predictions_match.group(1).strip() if private_predictions_match else ""
+        msg_id = parsed.message_id if parsed.message_id is not None else str(uuid.uuid4())
+        timestamp = parsed.timestamp if parsed.timestamp is not None else str(datetime.datetime.now())
+        speaker = parsed.speaker if parsed.speaker is not None else "unknown"
+        speaking_to = parsed.speaking_to
+        is_whisper = parsed.is_whisper
+        content = parsed.content.strip() if parsed.content is not None else ""
+        thoughts = parsed.thoughts.strip() if parsed.thoughts is not None else ""
+        private_predictions = parsed.private_predictions.strip() if parsed.private_predictions is not None else ""
 
         # For now, artifacts parsing is simplified - you'd need to implement based on your Artifact classes
         artifacts = []
 
-        return Message(msg_id, content, speaker, timestamp, artifacts, speaking_to, is_whisper, thoughts, private_predictions)
+        message = Message(msg_id, content, speaker, timestamp, artifacts, speaking_to, is_whisper, thoughts, private_predictions)
+
+        # The verdict/withdrawal tags of to_prompt() are exactly the ones inside <Content>,
+        # which were already scanned above, so seed the cache instead of parsing again
+        if parsed.content_scope is not None:
+            scope = parsed.content_scope
+            message._seed_parsed(ParsedResponse(
+                message_id=msg_id, timestamp=timestamp, speaker=speaker,
+                speaking_to=speaking_to if speaking_to else "All",
+                whisper="true" if is_whisper else "False",
+                content=content, thoughts=scope.thoughts, private_predictions=scope.private_predictions,
+                verdict=scope.verdict, verdict_reasoning=scope.verdict_reasoning, withdrawn=scope.withdrawn,
+                verdict_candidates=scope.verdict_candidates, goals_achieved=scope.goals_achieved
+            ))
+        return message
+
+    @property
+    def parsed(self) -> ParsedResponse:
+        """
+        Scaffolding tags carried by this message as rendered by to_prompt() (i.e. the
+        <Verdict>, <VerdictReasoning>, <Withdrawn> and <GoalAchieved> tags written in its
+        content). Parsed once and cached until the message is mutated.
+        """
+        cached = self.__dict__.get("_parsed")
+        if cached is None or cached[0] != self.revision:
+            cached = (self.revision, parse_scaffolding(self.to_prompt()))
+            object.__setattr__(self, "_parsed", cached)
+        return cached[1]
+
+    def _seed_parsed(self, parsed: ParsedResponse):
+        object.__setattr__(self, "_parsed", (self.revision, parsed))
 
     def can_be_seen_by(self, speaker: str) -> bool:
         """
@@ -264,4 +334,56 @@ Always use this exact scaffolding format in your responses.
         Returns:
             Complete Message object with the response
         """
-        raise NotImplementedError("You must implement this method")
\ No newline at end of file
+        raise NotImplementedError("You must implement this method")
+
+    async def acall(self, speaker: str, messages: List[Message], stop_sequences: List[str] = None) -> Message:
+        """
+        Async counterpart of __call__. Override this with a natively async client so
+        that a single event loop can drive many conversations at once; the default
+        runs the blocking __call__ in a worker thread.
+
+        Args:
+            speaker: The speaker generating the response
+            messages: List of previous messages
+            stop_sequences: Optional stop sequences
+
+        Returns:
+            Complete Message object with the response
+        """
+        return await asyncio.to_thread(self.__call__, speaker, messages, stop_sequences)
+
+    async def astream(self,
+                      speaker: str,
+                      messages: List[Message],
+                      stop_sequences: List[str] = None,
+                      on_event: Optional[Callable[[StreamEvent], None]] = None,
+                      should_abort: Optional[Callable[[ParsedResponse], bool]] = None) -> Message:
+        """
+        Streaming counterpart of acall. Implementations emit StreamEvents as the response
+        is generated and may stop generating early once the rest of the output cannot
+        change the resulting Message, or once should_abort() returns True for the
+        scaffolding tags written inside <Content> so far.
+
+        The default generates the whole response with acall() and then replays it as events,
+        so callers can rely on the event contract with any model.
+
+        Args:
+            speaker: The speaker generating the response
+            messages: List of previous messages
+            stop_sequences: Optional stop sequences
+            on_event: Optional callback receiving StreamEvents in order
+            should_abort: Optional predicate over the partial content tags
+
+        Returns:
+            Complete Message object with the response
+        """
+        started = time.perf_counter()
+        message = await self.acall(speaker, messages, stop_sequences)
+        if on_event is not None:
+            elapsed = time.perf_counter() - started
+            on_event(StreamEvent("field", speaker, "speaker", message.speaker, elapsed))
+            on_event(StreamEvent("field", speaker, "speaking_to", message.speaking_to, elapsed))
+            on_event(StreamEvent("field", speaker, "whisper", "true" if message.is_whisper else "false", elapsed))
+            on_event(StreamEvent("content", speaker, None, message.content, elapsed))
+            on_event(StreamEvent("complete", speaker, None, message, elapsed))
+        return message
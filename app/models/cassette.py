@@ -0,0 +1,272 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from types import SimpleNamespace
+from typing import Deque, Dict, List, Optional
+
+from .anthropic import AnthropicLLM
+
+
+# Per-run values that must not affect matching: message ids, timestamps and other uuids
+_VOLATILE_PATTERNS = [
+    (re.compile(r' id="[^"]*"'), ' id=""'),
+    (re.compile(r'timestamp="[^"]*"'), 'timestamp=""'),
+    (re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'), '<uuid>'),
+    (re.compile(r'\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:\.\d+)?'), '<datetime>'),
+]
+
+_USAGE_FIELDS = ("input_tokens", "output_tokens", "cache_read_input_tokens", "cache_creation_input_tokens")
+
+
+class CassetteMiss(LookupError):
+    """Raised when a replayed request was never recorded (or all its recordings were used)."""
+
+
+def _normalize(value):
+    if isinstance(value, str):
+        for pattern, replacement in _VOLATILE_PATTERNS:
+            value = pattern.sub(replacement, value)
+        return value
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def request_key(kind: str, api_params: dict) -> str:
+    """
+    Hash a request after removing per-run values, so the same conversation state maps
+    to the same key across runs.
+
+    Args:
+        kind: "create" for complete responses, "stream" for streamed ones
+        api_params: Keyword arguments of the API call
+
+    Returns:
+        Hex digest identifying the request
+    """
+    normalized = json.dumps([kind, _normalize(api_params)], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:32]
+
+
+def _usage_to_dict(usage) -> Optional[dict]:
+    if usage is None:
+        return None
+    values = {name: getattr(usage, name, None) for name in _USAGE_FIELDS}
+    return {name: value for name, value in values.items() if isinstance(value, int)}
+
+
+def _usage_from_dict(usage: Optional[dict]):
+    return SimpleNamespace(**usage) if usage is not None else None
+
+
+class Cassette:
+    """
+    On-disk list of recorded request/response pairs, one JSON object per line.
+
+    Entries are keyed by request_key() and store only the response text (or streamed
+    chunks), token usage and latency. Paths ending in ".gz" are gzip-compressed.
+    Recording appends and flushes each entry as it happens, so a crashed run keeps
+    everything recorded up to that point.
+
+    Args:
+        path: Cassette file path
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _open(self, mode: str):
+        if self.path.endswith(".gz"):
+            return gzip.open(self.path, mode + "t", encoding="utf-8")
+        return open(self.path, mode, encoding="utf-8")
+
+    def append(self, entry: dict):
+        with self._lock:
+            with self._open("a") as f:
+                f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    def load(self) -> List[dict]:
+        if not os.path.exists(self.path):
+            return []
+        with self._open("r") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+
+class _RecordingStream:
+    """Wraps a streaming response and records the chunks the caller consumed."""
+
+    def __init__(self, inner, on_close):
+        self._inner = inner
+        self._on_close = on_close
+        self._stream = None
+        self.chunks: List[str] = []
+
+    async def __aenter__(self):
+        self._started = time.perf_counter()
+        self._stream = await self._inner.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        snapshot = self.current_message_snapshot
+        result = await self._inner.__aexit__(*exc_info)
+        if exc_info[0] is None:
+            self._on_close(self.chunks, getattr(snapshot, "usage", None), time.perf_counter() - self._started)
+        return result
+
+    @property
+    async def text_stream(self):
+        async for text in self._stream.text_stream:
+            self.chunks.append(text)
+            yield text
+
+    @property
+    def current_message_snapshot(self):
+        return self._stream.current_message_snapshot
+
+
+class _ReplayStream:
+    """Serves recorded chunks through the interface of a streaming response."""
+
+    def __init__(self, entry: dict, latency_scale: float):
+        self._chunks = entry["chunks"]
+        self._delay = entry.get("latency", 0.0) * latency_scale / max(len(self._chunks), 1)
+        self.current_message_snapshot = SimpleNamespace(usage=_usage_from_dict(entry.get("usage")))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    @property
+    async def text_stream(self):
+        for chunk in self._chunks:
+            if self._delay:
+                await asyncio.sleep(self._delay)
+            yield chunk
+
+
+class RecordingLLM(AnthropicLLM):
+    """
+    AnthropicLLM that appends every request/response pair it makes to a cassette.
+
+    Args:
+        cassette: Cassette (or cassette path) to record into
+        api_key: Your Anthropic API key
+        **kwargs: Other AnthropicLLM arguments
+    """
+
+    def __init__(self, cassette, api_key: Optional[str] = None, **kwargs):
+        super().__init__(api_key, **kwargs)
+        self.cassette = cassette if isinstance(cassette, Cassette) else Cassette(cassette)
+
+    def _record(self, kind: str, api_params: dict, latency: float, usage, **response):
+        entry = {"key": request_key(kind, api_params), "kind": kind, "latency": round(latency, 4),
+                 "usage": _usage_to_dict(usage)}
+        entry.update(response)
+        self.cassette.append(entry)
+
+    def _create(self, api_params: dict):
+        started = time.perf_counter()
+        response = super()._create(api_params)
+        self._record("create", api_params, time.perf_counter() - started, getattr(response, "usage", None),
+                     text=response.content[0].text)
+        return response
+
+    async def _acreate(self, api_params: dict):
+        started = time.perf_counter()
+        response = await super()._acreate(api_params)
+        self._record("create", api_params, time.perf_counter() - started, getattr(response, "usage", None),
+                     text=response.content[0].text)
+        return response
+
+    def _stream(self, api_params: dict):
+        return _RecordingStream(
+            super()._stream(api_params),
+            lambda chunks, usage, latency: self._record("stream", api_params, latency, usage, chunks=chunks)
+        )
+
+
+class ReplayLLM(AnthropicLLM):
+    """
+    Offline AnthropicLLM that answers from a cassette instead of the API.
+
+    Requests are matched by request_key(), so message ids and timestamps may differ from
+    the recorded run but everything else in the prompt must be identical; a run replays
+    cleanly when it makes the same choices as the recorded one (e.g. seed `random` the
+    same way). Identical requests are served their recordings in recorded order.
+
+    Args:
+        cassette: Cassette (or cassette path) to replay
+        latency_scale: Multiplier for the recorded latencies (0 replays at full speed,
+            1 reproduces the recorded timing)
+        **kwargs: Other AnthropicLLM arguments (model, temperature, ... must match the recording)
+    """
+
+    def __init__(self, cassette, latency_scale: float = 0.0, **kwargs):
+        # The clients are never used; a placeholder key lets them be constructed offline
+        super().__init__(api_key="offline-replay", **kwargs)
+        self.cassette = cassette if isinstance(cassette, Cassette) else Cassette(cassette)
+        self.latency_scale = latency_scale
+        self.replayed = 0
+        self._entries: Dict[str, Deque[dict]] = defaultdict(deque)
+        for entry in self.cassette.load():
+            self._entries[entry["key"]].append(entry)
+
+    def _next_entry(self, kind: str, api_params: dict) -> dict:
+        key = request_key(kind, api_params)
+        recorded = self._entries.get(key)
+        if not recorded:
+            raise CassetteMiss(f"No recorded {kind} response left for request {key} in {self.cassette.path}")
+        self.replayed += 1
+        return recorded.popleft()
+
+    @staticmethod
+    def _response(entry: dict):
+        return SimpleNamespace(content=[SimpleNamespace(text=entry["text"])], usage=_usage_from_dict(entry.get("usage")))
+
+    def _create(self, api_params: dict):
+        entry = self._next_entry("create", api_params)
+        if self.latency_scale:
+            time.sleep(entry.get("latency", 0.0) * self.latency_scale)
+        return self._response(entry)
+
+    async def _acreate(self, api_params: dict):
+        entry = self._next_entry("create", api_params)
+        if self.latency_scale:
+            await asyncio.sleep(entry.get("latency", 0.0) * self.latency_scale)
+        return self._response(entry)
+
+    def _stream(self, api_params: dict):
+        return _ReplayStream(self._next_entry("stream", api_params), self.latency_scale)
+
+
+def open_cassette_llm(path: str, mode: str = "auto", api_key: Optional[str] = None, **kwargs) -> AnthropicLLM:
+    """
+    Build a recording or replaying model for a scenario script.
+
+    Args:
+        path: Cassette file path
+        mode: "record", "replay", or "auto" (replay when the cassette exists, record otherwise)
+        api_key: Your Anthropic API key (only needed for recording)
+        **kwargs: Other AnthropicLLM arguments
+
+    Returns:
+        RecordingLLM or ReplayLLM
+    """
+    if mode == "auto":
+        mode = "replay" if os.path.exists(path) else "record"
+    if mode == "record":
+        return RecordingLLM(path, api_key=api_key, **kwargs)
+    if mode == "replay":
+        return ReplayLLM(path, **kwargs)
+    raise ValueError(f"Unknown cassette mode '{mode}'. Must be one of: auto | record | replay")
@@ -0,0 +1,248 @@
+import asyncio
+import email.utils
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Optional
+
+import anthropic
+
+# Status codes worth retrying: request timeout, conflict, rate limit, server errors and overload (529)
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+# Independent of the global `random`, so retries never disturb seeded runs
+_jitter = random.Random()
+
+
+def estimate_request_tokens(api_params: dict) -> int:
+    """
+    Rough input-token count of a request (about 4 characters per token), used to
+    reserve rate-limit capacity before the API reports the real usage.
+    """
+    def text_length(content) -> int:
+        if isinstance(content, str):
+            return len(content)
+        return sum(len(block.get("text", "")) for block in content)
+
+    characters = text_length(api_params.get("system", ""))
+    characters += sum(text_length(message["content"]) for message in api_params.get("messages", []))
+    return max(1, characters // 4)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether an API error is transient (connection problems, 429s, overload and 5xx responses)."""
+    if isinstance(error, (anthropic.APIConnectionError, anthropic.APITimeoutError)):
+        return True
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code in RETRYABLE_STATUS_CODES
+    return False
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """
+    The delay requested by an error response's retry-after-ms or retry-after header
+    (in seconds or as an HTTP date), or None when the response carries none.
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return max(0.0, float(headers["retry-after-ms"]) / 1000.0)
+        value = headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Jittered exponential backoff for transient API errors.
+
+    Attempt n (counting from 0) waits a random time up to min(max_delay, base_delay * 2**n)
+    ("full jitter"), so clients that failed together do not retry together. When the
+    server sends retry-after, that delay is used instead, plus up to 10% jitter.
+
+    Attributes:
+        max_attempts: Total attempts per request, including the first
+        base_delay: Backoff ceiling of the first retry, in seconds
+        max_delay: Upper bound of any single wait, in seconds
+    """
+    max_attempts: int = 6
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Seconds to wait before retrying after failed attempt `attempt` (0-based).
+
+        Args:
+            attempt: Index of the attempt that just failed
+            retry_after: Delay requested by the server, if any
+        """
+        if retry_after is not None:
+            return min(self.max_delay, retry_after * (1.0 + 0.1 * _jitter.random()))
+        return _jitter.uniform(0.0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+@dataclass
+class LimiterStats:
+    """
+    Queueing statistics of a RateLimiter, for sizing concurrency against the API limits.
+    A high delayed share or long waits mean more concurrency only adds queueing.
+    """
+    requests: int = 0
+    delayed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    throttled: int = 0
+    retries: int = 0
+    recent_waits: Deque[float] = field(default_factory=lambda: deque(maxlen=1000))
+
+    def record_wait(self, seconds: float):
+        self.requests += 1
+        self.recent_waits.append(seconds)
+        if seconds > 0:
+            self.delayed += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.requests if self.requests else 0.0
+
+    def wait_percentile(self, q: float) -> float:
+        """Queueing-time percentile (0-100) over the most recent requests."""
+        if not self.recent_waits:
+            return 0.0
+        ordered = sorted(self.recent_waits)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q / 100))]
+
+
+class _Bucket:
+    """Token bucket refilled continuously at `per_minute / 60` units per second."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, amount: float) -> float:
+        """Debit `amount` (possibly going into debt) and return the seconds until the debt is repaid."""
+        self.level -= amount
+        return -self.level / self.rate if self.level < 0 else 0.0
+
+
+class RateLimiter:
+    """
+    Client-side request and token rate limiter shared by every model (and every debate)
+    that should count against the same API limits.
+
+    Each call reserves one request and its estimated tokens up front and waits until the
+    buckets can cover them and any pause() after a 429 has passed. Reservations are served
+    in arrival order, so a large request is never starved by a stream of small ones. Once
+    the response reports its real usage, settle() refunds or charges the difference.
+    Queueing times are collected in `stats`. Safe to use from several threads and event
+    loops at once.
+
+    Args:
+        requests_per_minute: Request budget (None for no request limit)
+        tokens_per_minute: Input plus output token budget (None for no token limit)
+    """
+
+    def __init__(self, requests_per_minute: Optional[float] = None, tokens_per_minute: Optional[float] = None):
+        self.requests = _Bucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = _Bucket(tokens_per_minute) if tokens_per_minute else None
+        self.stats = LimiterStats()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int = 0) -> float:
+        """
+        Reserve capacity for one request without waiting.
+
+        Args:
+            tokens: Estimated tokens of the request
+
+        Returns:
+            Seconds the caller must wait before sending the request
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._paused_until - now)
+            for bucket, amount in ((self.requests, 1), (self.tokens, tokens)):
+                if bucket is not None:
+                    bucket.refill(now)
+                    wait = max(wait, bucket.take(amount))
+            self.stats.record_wait(wait)
+            return wait
+
+    def pause(self, seconds: float):
+        """
+        Hold back every request for `seconds`, e.g. after the API answered 429: the
+        limit is shared, so the other callers would only be throttled as well.
+        """
+        with self._lock:
+            self.stats.throttled += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def acquire(self, tokens: int = 0) -> float:
+        """Reserve capacity for one request and sleep until it may be sent. Returns the time waited."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def acquire_sync(self, tokens: int = 0) -> float:
+        """Blocking version of acquire() for synchronous callers."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def settle(self, reserved: int, actual: int):
+        """
+        Correct a reservation once the real token usage is known.
+
+        Args:
+            reserved: Tokens reserved for the request
+            actual: Tokens the request really consumed
+        """
+        if self.tokens is None:
+            return
+        with self._lock:
+            self.tokens.refill(time.monotonic())
+            self.tokens.level = min(self.tokens.capacity, self.tokens.level + reserved - actual)
+
+
+_shared_limiters: Dict[str, RateLimiter] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_rate_limiter(name: str = "default",
+                        requests_per_minute: Optional[float] = None,
+                        tokens_per_minute: Optional[float] = None) -> RateLimiter:
+    """
+    The process-wide limiter registered under `name` (e.g. one per organization or API
+    key), created with the given limits on first use. Models built with the same name
+    share one budget.
+    """
+    with _shared_lock:
+        limiter = _shared_limiters.get(name)
+        if limiter is None:
+            limiter = _shared_limiters[name] = RateLimiter(requests_per_minute, tokens_per_minute)
+        return limiter
@@ -0,0 +1,290 @@
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Iterable
+
+
+# Tags whose value is the text up to the first matching close tag (may contain other tags)
+SPAN_TAGS = frozenset({"Content", "PrivateThoughts", "PrivatePredictions", "Verdict", "VerdictReasoning", "Withdrawn"})
+
+# Tags whose value may not contain '<' (plain values such as names and flags)
+FLAT_TAGS = frozenset({"Speaker", "SpeakingTo", "Whisper", "GoalAchieved"})
+
+TAG_PATTERN = re.compile(
+    r'<(/?)(Message|Speaker|SpeakingTo|Whisper|PrivateThoughts|PrivatePredictions|Content|'
+    r'VerdictReasoning|Verdict|Withdrawn|GoalAchieved)(\s[^<>]*)?>'
+)
+MESSAGE_ID_PATTERN = re.compile(r' id="([^"]*)"')
+TIMESTAMP_PATTERN = re.compile(r'timestamp="([^"]*)"')
+
+
+@dataclass
+class ParsedResponse:
+    """
+    Typed view of the scaffolding tags found in a response or rendered message.
+
+    Span values (content, thoughts, ...) are the raw text between the first opening tag
+    and the first closing tag after it; verdict, verdict_reasoning and withdrawn are
+    stripped. A field is None when its tag pair was not found.
+    """
+    message_id: Optional[str] = None
+    timestamp: Optional[str] = None
+    speaker: Optional[str] = None
+    speaking_to: Optional[str] = None
+    whisper: Optional[str] = None
+    content: Optional[str] = None
+    thoughts: Optional[str] = None
+    private_predictions: Optional[str] = None
+    verdict: Optional[str] = None
+    verdict_reasoning: Optional[str] = None
+    withdrawn: Optional[str] = None
+    # Stripped values of every <Verdict> tag whose value contains no other tag
+    verdict_candidates: List[str] = field(default_factory=list)
+    goals_achieved: List[str] = field(default_factory=list)
+    # Tags found inside the <Content> span only (None when there is no closed <Content>)
+    content_scope: Optional['ParsedResponse'] = None
+
+    @property
+    def is_whisper(self) -> bool:
+        return self.whisper is not None and self.whisper.lower() == "true"
+
+    @property
+    def is_withdrawing(self) -> bool:
+        return self.withdrawn is not None and self.withdrawn.lower() == "true"
+
+    def verdict_option(self, verdict_options: Iterable[str]) -> Optional[str]:
+        """Return the first configured option that appears as a whole <Verdict> value."""
+        if not self.verdict_candidates:
+            return None
+        candidates = set(self.verdict_candidates)
+        for option in verdict_options:
+            if option in candidates:
+                return option
+        return None
+
+
+_SPAN_FIELDS = {
+    "Content": "content",
+    "PrivateThoughts": "thoughts",
+    "PrivatePredictions": "private_predictions",
+    "Verdict": "verdict",
+    "VerdictReasoning": "verdict_reasoning",
+    "Withdrawn": "withdrawn",
+}
+_STRIPPED_SPANS = frozenset({"Verdict", "VerdictReasoning", "Withdrawn"})
+_FLAT_FIELDS = {"Speaker": "speaker", "SpeakingTo": "speaking_to", "Whisper": "whisper"}
+
+
+class ScaffoldingScanner:
+    """
+    Single-pass tag scanner. Feed it tag matches in text order with feed(); every field
+    is resolved the first time its tag pair closes, with the same first-match semantics
+    as searching for each tag separately.
+
+    Used directly by parse_scaffolding() and incrementally by the streaming parser.
+    """
+
+    def __init__(self, text_source, track_content_scope: bool = True):
+        # text_source is a callable returning the current text, so streaming buffers can grow
+        self._text = text_source
+        self.result = ParsedResponse()
+        self._span_open: Dict[str, int] = {}
+        self._flat_open: Dict[str, int] = {}
+        self._content_scope: Optional[ScaffoldingScanner] = None
+        self._track_content_scope = track_content_scope
+        self._content_closed = False
+        self.resolved: List[str] = []
+
+    def _resolve(self, name: str, value):
+        setattr(self.result, name, value)
+        self.resolved.append(name)
+
+    def feed(self, match) -> None:
+        closing, name, attributes = match.group(1), match.group(2), match.group(3)
+        text = self._text()
+
+        if self._content_scope is not None and not self._content_closed:
+            if closing and name == "Content":
+                self._content_closed = True
+                self.result.content_scope = self._content_scope.result
+            else:
+                self._content_scope.feed(match)
+
+        if name == "Message":
+            if not closing and attributes is not None:
+                if self.result.message_id is None:
+                    id_match = MESSAGE_ID_PATTERN.match(attributes)
+                    if id_match:
+                        self._resolve("message_id", id_match.group(1))
+                if self.result.timestamp is None:
+                    timestamp_match = TIMESTAMP_PATTERN.search(attributes)
+                    if timestamp_match:
+                        self._resolve("timestamp", timestamp_match.group(1))
+            return
+
+        if attributes is not None:
+            return  # only <Message> carries attributes
+
+        if name in FLAT_TAGS or name == "Verdict":
+            if not closing:
+                self._flat_open[name] = match.end()
+            else:
+                start = self._flat_open.pop(name, None)
+                if start is not None:
+                    value = text[start:match.start()]
+                    if "<" not in value:
+                        self._flat_value(name, value)
+
+        if name in SPAN_TAGS:
+            attr = _SPAN_FIELDS[name]
+            if getattr(self.result, attr) is not None:
+                return
+            if not closing:
+                if name not in self._span_open:
+                    self._span_open[name] = match.end()
+                    if name == "Content" and self._track_content_scope:
+                        self._content_scope = ScaffoldingScanner(self._text, track_content_scope=False)
+            elif name in self._span_open:
+                value = text[self._span_open[name]:match.start()]
+                self._resolve(attr, value.strip() if name in _STRIPPED_SPANS else value)
+
+    def _flat_value(self, name: str, value: str):
+        if name == "Verdict":
+            self.result.verdict_candidates.append(value.strip())
+        elif name == "GoalAchieved":
+            if value:
+                self.result.goals_achieved.append(value.strip())
+        elif getattr(self.result, _FLAT_FIELDS[name]) is None:
+            self._resolve(_FLAT_FIELDS[name], value)
+
+
+def parse_scaffolding(text: str) -> ParsedResponse:
+    """
+    Parse all scaffolding tags of a response in a single pass over the text.
+
+    Args:
+        text: Response or rendered message text
+
+    Returns:
+        ParsedResponse with every tag found in the text
+    """
+    scanner = ScaffoldingScanner(lambda: text)
+    for match in TAG_PATTERN.finditer(text):
+        scanner.feed(match)
+    return scanner.result
+
+
+def parsed_response(message) -> ParsedResponse:
+    """
+    Get the parsed scaffolding of a message, using the copy cached on the Message when
+    available and parsing message.to_prompt() otherwise (e.g. for duck-typed messages).
+    """
+    parsed = getattr(message, "parsed", None)
+    if isinstance(parsed, ParsedResponse):
+        return parsed
+    return parse_scaffolding(message.to_prompt())
+
+
+class StreamingScaffoldingParser:
+    """
+    Incremental counterpart of parse_scaffolding() for responses that arrive in chunks.
+
+    Each feed() scans only the new text (plus a possibly incomplete tag left at the end of
+    the previous chunk) and reports what became known: resolved fields such as speaker,
+    speaking_to and whisper, and new <Content> text.
+
+    Args:
+        prefix: Text the response continues from (e.g. the assistant prefill scaffolding)
+        max_pending_tag: How far back an unterminated '<' is still treated as a partial tag
+    """
+
+    def __init__(self, prefix: str = "", max_pending_tag: int = 512):
+        self.text = ""
+        self.max_pending_tag = max_pending_tag
+        self.message_closed = False
+        self._scan_from = 0
+        self._content_emitted: Optional[int] = None
+        self._scanner = ScaffoldingScanner(lambda: self.text)
+        self.prefix_updates = self.feed(prefix) if prefix else []
+
+    @property
+    def parsed(self) -> ParsedResponse:
+        """Fields resolved so far."""
+        return self._scanner.result
+
+    @property
+    def content_fields(self) -> ParsedResponse:
+        """Tags resolved inside <Content> so far (what validators will see once the message is built)."""
+        if self._scanner.result.content_scope is not None:
+            return self._scanner.result.content_scope
+        scope = self._scanner._content_scope
+        return scope.result if scope is not None else ParsedResponse()
+
+    @property
+    def content_open(self) -> bool:
+        return "Content" in self._scanner._span_open and self.parsed.content is None
+
+    def feed(self, chunk: str) -> List[tuple]:
+        """
+        Add a chunk of response text.
+
+        Returns:
+            List of ("field", name, value) and ("content", None, text_delta) updates, in text order
+        """
+        self.text += chunk
+        updates = []
+        resolved = self._scanner.resolved
+
+        for match in TAG_PATTERN.finditer(self.text, self._scan_from):
+            already_resolved = len(resolved)
+            was_open = self.content_open
+            self._scanner.feed(match)
+            self._scan_from = match.end()
+
+            if was_open and not self.content_open:
+                # Flush the rest of the content before reporting it as resolved
+                updates.extend(self._content_delta(match.start()))
+            for name in resolved[already_resolved:]:
+                updates.append(("field", name, getattr(self.parsed, name)))
+            if not was_open and self.content_open:
+                self._content_emitted = match.end()
+            if match.group(1) and match.group(2) == "Message":
+                self.message_closed = True
+
+        # Hold back a trailing '<' that may be the start of a tag split across chunks
+        pending = self.text.rfind("<", self._scan_from)
+        if pending != -1 and ">" not in self.text[pending:] and len(self.text) - pending <= self.max_pending_tag:
+            self._scan_from = pending
+        else:
+            self._scan_from = len(self.text)
+
+        if self.content_open:
+            updates.extend(self._content_delta(self._scan_from))
+        return updates
+
+    def _content_delta(self, end: int) -> List[tuple]:
+        if self._content_emitted is None or end <= self._content_emitted:
+            return []
+        delta = self.text[self._content_emitted:end]
+        self._content_emitted = end
+        return [("content", None, delta)]
+
+    def can_stop(self) -> bool:
+        """
+        True once generating more text cannot change the resulting Message: the message
+        is closed, or <Content> is closed and the speaking target / whisper flag (which
+        may follow the content) are settled.
+        """
+        if self.message_closed:
+            return True
+        parsed = self.parsed
+        if parsed.content is None:
+            return False
+        if parsed.whisper is not None:
+            return True
+        return parsed.speaking_to is not None and parsed.speaking_to.strip() in ("", "All")
+
+    def final_text(self) -> str:
+        """The text to build the Message from, closing <Content> if generation stopped inside it."""
+        if self.content_open:
+            return self.text + "</Content>\n</Message>"
+        return self.text
@@ -0,0 +1,317 @@
+import asyncio
+import random
+import re
+import time
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+
+import anthropic
+import httpx
+
+from .anthropic import AnthropicLLM
+from .cassette import request_key
+
+
+VERDICT_OPTIONS_PATTERN = re.compile(r"Use ONLY these options: (.*), or leave empty if undecided")
+CURRENT_GOAL_PATTERN = re.compile(r"CURRENT DEBATE GOAL:\n- ([^:\n]+):")
+SPEAKER_PATTERN = re.compile(r"<Speaker>([^<]*)</Speaker>")
+MESSAGE_PATTERN = re.compile(r"<Message[^>]*>(.*?)</Message>", re.DOTALL)
+VERDICT_PATTERN = re.compile(r"<Verdict>\s*([^<]*?)\s*</Verdict>")
+
+WORDS = ("the candidate experience systems team impact evidence risk delivery ownership scale design "
+         "references tenure growth concern strength record trade-off depth clarity results context").split()
+
+
+@dataclass
+class SimulationProfile:
+    """
+    Distributions driving SimulatedLLM. Probabilities are per generated message.
+
+    Attributes:
+        verdict_probability: Chance a message carries a verdict
+        verdict_weights: Relative weight of each verdict option (uniform when empty)
+        withdraw_probability: Chance to withdraw together with a verdict
+        decided_withdraw_probability: Chance that a participant whose verdict for the current
+            goal is already in the conversation restates it and withdraws. None (the default)
+            lets decided participants behave like undecided ones
+        speaking_to_probability: Chance to address a specific participant instead of All
+        whisper_probability: Chance that an addressed message is a whisper
+        goal_achieved_probability: Chance a verdict message also marks the current goal achieved
+        content_tokens: Range of content length in tokens
+        malformed_probability: Chance of a malformed message (see malformed_weights)
+        malformed_weights: Relative weight of each malformation: "invalid_verdict",
+            "missing_reasoning", "bad_withdrawn" and "unclosed_content"
+        rate_limit_probability: Chance a request fails with a 429 (anthropic.RateLimitError)
+        rate_limit_retry_after: Value of the 429's retry-after header, in seconds
+        first_token_latency: Median time to first token, in seconds (log-normally distributed)
+        latency_sigma: Spread of the time-to-first-token distribution
+        tokens_per_second: Output throughput once generation has started
+        chunk_tokens: Tokens per streamed chunk
+    """
+    verdict_probability: float = 0.35
+    verdict_weights: Dict[str, float] = field(default_factory=dict)
+    withdraw_probability: float = 0.5
+    decided_withdraw_probability: Optional[float] = None
+    speaking_to_probability: float = 0.4
+    whisper_probability: float = 0.15
+    goal_achieved_probability: float = 0.0
+    content_tokens: Tuple[int, int] = (40, 160)
+    malformed_probability: float = 0.02
+    malformed_weights: Dict[str, float] = field(default_factory=lambda: {
+        "invalid_verdict": 1.0, "missing_reasoning": 1.0, "bad_withdrawn": 1.0, "unclosed_content": 1.0})
+    rate_limit_probability: float = 0.0
+    rate_limit_retry_after: float = 1.0
+    first_token_latency: float = 0.6
+    latency_sigma: float = 0.4
+    tokens_per_second: float = 80.0
+    chunk_tokens: int = 8
+
+
+@dataclass
+class SimulationStats:
+    """Counters of what SimulatedLLM produced."""
+    requests: int = 0
+    rate_limited: int = 0
+    malformed: int = 0
+    verdicts: int = 0
+    whispers: int = 0
+    output_tokens: int = 0
+    simulated_seconds: float = 0.0
+
+
+@dataclass
+class _Generation:
+    text: str
+    first_token_latency: float
+    tokens: int
+
+
+class SimulatedLLM(AnthropicLLM):
+    """
+    Offline stand-in for AnthropicLLM that writes synthetic scaffolded responses.
+
+    Requests are built exactly as for the real API (prompt assembly, transcript views,
+    prompt-cache markers) and responses go through the normal parsing path, so debates,
+    validators and watchers behave as they would in production while the model itself
+    is replaced by the distributions of a SimulationProfile. Verdict options, the current
+    goal and the other participants are read from the request.
+
+    Every request draws from its own RNG seeded by (seed, normalized request, how often
+    that request was seen), so a run is reproducible regardless of how concurrent
+    debates interleave.
+
+    Args:
+        profile: Response and latency distributions
+        seed: Seed for all random choices
+        time_scale: Multiplier for simulated latencies and retry backoffs (0 disables sleeping entirely)
+        **kwargs: Other AnthropicLLM arguments
+    """
+
+    def __init__(self,
+                 profile: Optional[SimulationProfile] = None,
+                 seed: int = 0,
+                 time_scale: float = 1.0,
+                 **kwargs):
+        # The clients are never used; a placeholder key lets them be constructed offline
+        super().__init__(api_key="offline-simulation", **kwargs)
+        self.profile = profile or SimulationProfile()
+        self.seed = seed
+        self.time_scale = time_scale
+        self.stats = SimulationStats()
+        self._seen: Dict[str, int] = {}
+
+    def _rng(self, kind: str, api_params: dict) -> random.Random:
+        key = request_key(kind, api_params)
+        occurrence = self._seen.get(key, 0)
+        self._seen[key] = occurrence + 1
+        return random.Random(f"{self.seed}:{key}:{occurrence}")
+
+    @staticmethod
+    def _system_text(api_params: dict) -> str:
+        system = api_params.get("system", "")
+        if isinstance(system, list):
+            return "".join(block["text"] for block in system)
+        return system
+
+    @staticmethod
+    def _message_text(message: dict) -> str:
+        content = message["content"]
+        if isinstance(content, list):
+            return "".join(block["text"] for block in content)
+        return content
+
+    def _verdict_options(self, system: str) -> List[str]:
+        match = VERDICT_OPTIONS_PATTERN.search(system)
+        if not match:
+            return []
+        return [option.split(":", 1)[0].strip() for option in match.group(1).split(" | ")]
+
+    def _previous_verdict(self, speaker: str, messages: List[dict], options: List[str]) -> Optional[str]:
+        """The latest valid verdict `speaker` has on record in the prompt's history, if any."""
+        verdict = None
+        for message in messages:
+            for block in MESSAGE_PATTERN.findall(self._message_text(message)):
+                speaker_match = SPEAKER_PATTERN.search(block)
+                if not speaker_match or speaker_match.group(1) != speaker:
+                    continue
+                for value in VERDICT_PATTERN.findall(block):
+                    if value in options:
+                        verdict = value
+        return verdict
+
+    def _words(self, rng: random.Random, count: int) -> str:
+        return " ".join(rng.choice(WORDS) for _ in range(count))
+
+    def _generate(self, rng: random.Random, api_params: dict) -> _Generation:
+        profile = self.profile
+        messages = api_params["messages"]
+        prefill = messages[-1]["content"]
+        speaker_match = SPEAKER_PATTERN.search(prefill)
+        speaker = speaker_match.group(1) if speaker_match else ""
+        system = self._system_text(api_params)
+
+        others = []
+        for message in messages[:-1]:
+            for name in SPEAKER_PATTERN.findall(self._message_text(message)):
+                if name != speaker and name.lower() not in ("coordinator", "timekeeper", "system") \
+                        and name not in others:
+                    others.append(name)
+
+        malformation = None
+        if rng.random() < profile.malformed_probability:
+            kinds = list(profile.malformed_weights)
+            malformation = rng.choices(kinds, weights=[profile.malformed_weights[k] for k in kinds])[0]
+            self.stats.malformed += 1
+
+        # Message body
+        parts = [self._words(rng, rng.randint(*profile.content_tokens)).capitalize() + "."]
+        options = self._verdict_options(system)
+        previous_verdict = None
+        if options and profile.decided_withdraw_probability is not None:
+            previous_verdict = self._previous_verdict(speaker, messages[:-1], options)
+        # Decided participants who are done restate their verdict and withdraw
+        decided_withdraw = previous_verdict is not None and rng.random() < profile.decided_withdraw_probability
+        give_verdict = bool(options) and (decided_withdraw or rng.random() < profile.verdict_probability
+                                          or malformation in ("invalid_verdict", "missing_reasoning"))
+        if give_verdict:
+            weights = [profile.verdict_weights.get(option, 0.0 if profile.verdict_weights else 1.0)
+                       for option in options]
+            verdict = previous_verdict if decided_withdraw else rng.choices(options, weights=weights)[0]
+            if malformation == "invalid_verdict":
+                verdict = "UNDECIDED_" + verdict
+            parts.append(f"<Verdict>{verdict}</Verdict>")
+            if malformation != "missing_reasoning":
+                parts.append(f"<VerdictReasoning>{self._words(rng, 12).capitalize()}.</VerdictReasoning>")
+            self.stats.verdicts += 1
+        if malformation == "bad_withdrawn":
+            parts.append("<Withdrawn>maybe</Withdrawn>")
+        elif give_verdict and (decided_withdraw or rng.random() < profile.withdraw_probability):
+            # Withdraw alongside the verdict: a message without a verdict clears the one on record
+            parts.append("<Withdrawn>true</Withdrawn>")
+        goal_match = CURRENT_GOAL_PATTERN.search(system)
+        if give_verdict and goal_match and rng.random() < profile.goal_achieved_probability:
+            parts.append(f"<GoalAchieved>{goal_match.group(1)}</GoalAchieved>")
+        body = "\n".join(parts)
+        content_end = "" if malformation == "unclosed_content" else "</Content>\n"
+
+        # Continue from wherever the prefill stops
+        if prefill.endswith("<SpeakingTo>"):
+            target = rng.choice(others) if others and rng.random() < profile.speaking_to_probability else "All"
+            whisper = target != "All" and rng.random() < profile.whisper_probability
+            self.stats.whispers += whisper
+            text = (f"{target}</SpeakingTo>\n"
+                    f"<Whisper>{'true' if whisper else 'false'}</Whisper>\n"
+                    f"<PrivateThoughts>{self._words(rng, 20).capitalize()}.</PrivateThoughts>\n"
+                    f"<Content>{body}{content_end}")
+        elif prefill.endswith("<Content>"):
+            text = body + content_end
+        else:
+            text = " " + body + content_end
+
+        first_token_latency = profile.first_token_latency * rng.lognormvariate(0.0, profile.latency_sigma)
+        return _Generation(text, first_token_latency, max(1, len(text) // 4))
+
+    def _rate_limit(self, rng: random.Random) -> Optional[anthropic.RateLimitError]:
+        if rng.random() >= self.profile.rate_limit_probability:
+            return None
+        self.stats.rate_limited += 1
+        response = httpx.Response(429, headers={"retry-after": str(self.profile.rate_limit_retry_after)},
+                                  request=httpx.Request("POST", "https://api.anthropic.com/v1/messages"))
+        return anthropic.RateLimitError("Simulated rate limit", response=response, body=None)
+
+    def _response(self, api_params: dict, generation: _Generation):
+        self.stats.requests += 1
+        self.stats.output_tokens += generation.tokens
+        self.stats.simulated_seconds += self._total_latency(generation)
+        usage = SimpleNamespace(input_tokens=len(str(api_params["messages"])) // 4, output_tokens=generation.tokens,
+                                cache_read_input_tokens=0, cache_creation_input_tokens=0)
+        return SimpleNamespace(content=[SimpleNamespace(text=generation.text)], usage=usage)
+
+    def _total_latency(self, generation: _Generation) -> float:
+        return generation.first_token_latency + generation.tokens / self.profile.tokens_per_second
+
+    def _sleep(self, seconds: float):
+        if self.time_scale:
+            time.sleep(seconds * self.time_scale)
+
+    async def _asleep(self, seconds: float):
+        if self.time_scale:
+            await asyncio.sleep(seconds * self.time_scale)
+
+    def _create(self, api_params: dict):
+        rng = self._rng("create", api_params)
+        error = self._rate_limit(rng)
+        if error is not None:
+            raise error
+        generation = self._generate(rng, api_params)
+        if self.time_scale:
+            time.sleep(self._total_latency(generation) * self.time_scale)
+        return self._response(api_params, generation)
+
+    async def _acreate(self, api_params: dict):
+        rng = self._rng("create", api_params)
+        error = self._rate_limit(rng)
+        if error is not None:
+            raise error
+        generation = self._generate(rng, api_params)
+        if self.time_scale:
+            await asyncio.sleep(self._total_latency(generation) * self.time_scale)
+        return self._response(api_params, generation)
+
+    def _stream(self, api_params: dict):
+        rng = self._rng("stream", api_params)
+        error = self._rate_limit(rng)
+        generation = None if error is not None else self._generate(rng, api_params)
+        return _SimulatedStream(self, api_params, generation, error)
+
+
+class _SimulatedStream:
+    """Streams a simulated generation in chunks at the profile's throughput."""
+
+    def __init__(self, llm: SimulatedLLM, api_params: dict, generation: Optional[_Generation], error):
+        self._llm = llm
+        self._generation = generation
+        self._error = error
+        self.current_message_snapshot = None
+        if generation is not None:
+            self.current_message_snapshot = llm._response(api_params, generation)
+
+    async def __aenter__(self):
+        if self._error is not None:
+            raise self._error
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    @property
+    async def text_stream(self):
+        generation, profile, scale = self._generation, self._llm.profile, self._llm.time_scale
+        chunk_chars = profile.chunk_tokens * 4
+        if scale:
+            await asyncio.sleep(generation.first_token_latency * scale)
+        for start in range(0, len(generation.text), chunk_chars):
+            if scale:
+                await asyncio.sleep(profile.chunk_tokens / profile.tokens_per_second * scale)
+            yield generation.text[start:start + chunk_chars]
@@ -0,0 +1,137 @@
+from typing import Dict, List, Optional
+
+from .base import Message
+
+
+BEGIN_FILLER = {"role": "user", "content": "Please begin the discussion."}
+ASSISTANT_FILLER = {"role": "assistant", "content": "I understand. Please continue."}
+USER_FILLER = {"role": "user", "content": "Please continue with your assessment."}
+
+
+class TranscriptView:
+    """
+    Incrementally rendered, role-alternating transcript for a single viewer.
+
+    The view remembers which source messages it has already consumed. On every sync()
+    it only renders the messages appended since the last call, and only re-renders
+    consumed messages whose Message.revision changed (e.g. after a watcher edited
+    them). If the source list was reordered, truncated or had messages replaced (as
+    when a goal transition masks older epochs), the view is rebuilt from scratch.
+
+    The rendered entries are byte-identical to filtering with Message.can_be_seen_by,
+    rendering with Message.to_prompt(speaker=viewer) and applying the alternation
+    fillers of AnthropicLLM._ensure_alternating_roles.
+
+    Args:
+        viewer: The speaker whose perspective the transcript is rendered from
+    """
+
+    def __init__(self, viewer: str):
+        self.viewer = viewer
+        self.renders = 0
+        self._reset()
+
+    def _reset(self):
+        self._sources: List[Message] = []
+        self._revisions: List[int] = []
+        # Position of each consumed source message in self._entries, None when invisible
+        self._entry_positions: List[Optional[int]] = []
+        self._entries: List[dict] = []
+        self._last_visible: Optional[Message] = None
+        self._mutation_count = Message.mutation_count
+
+    def _render(self, message: Message) -> dict:
+        self.renders += 1
+        role = "assistant" if message.speaker == self.viewer else "user"
+        return {"role": role, "content": message.to_prompt(speaker=self.viewer)}
+
+    def _append(self, message: Message):
+        position = None
+        if message.can_be_seen_by(self.viewer):
+            entry = self._render(message)
+            if not self._entries:
+                if entry["role"] != "user":
+                    self._entries.append(BEGIN_FILLER)
+            elif self._entries[-1]["role"] == entry["role"]:
+                self._entries.append(ASSISTANT_FILLER if entry["role"] == "user" else USER_FILLER)
+            position = len(self._entries)
+            self._entries.append(entry)
+            self._last_visible = message
+
+        self._sources.append(message)
+        self._revisions.append(message.revision)
+        self._entry_positions.append(position)
+
+    def _refresh_mutated(self) -> bool:
+        """Re-render consumed messages that changed. Returns False when a full rebuild is needed."""
+        for i, message in enumerate(self._sources):
+            if message.revision == self._revisions[i]:
+                continue
+
+            position = self._entry_positions[i]
+            if (position is None) == message.can_be_seen_by(self.viewer):
+                return False  # visibility changed
+            if position is not None:
+                entry = self._render(message)
+                if entry["role"] != self._entries[position]["role"]:
+                    return False  # speaker changed, fillers would move
+                self._entries[position] = entry
+            self._revisions[i] = message.revision
+
+        self._mutation_count = Message.mutation_count
+        return True
+
+    def sync(self, messages: List[Message]) -> List[dict]:
+        """
+        Bring the view up to date with the given source messages.
+
+        Args:
+            messages: Conversation messages (without the system message), oldest first
+
+        Returns:
+            The rendered, role-alternating entries. Treat the list and its dicts as read-only.
+        """
+        consumed = len(self._sources)
+        if len(messages) < consumed or (consumed and messages[consumed - 1] is not self._sources[-1]):
+            self._reset()
+            consumed = 0
+
+        if self._mutation_count != Message.mutation_count and not self._refresh_mutated():
+            self._reset()
+            consumed = 0
+
+        for message in messages[consumed:]:
+            self._append(message)
+
+        return self._entries
+
+    @property
+    def last_visible(self) -> Optional[Message]:
+        """The most recent consumed message the viewer can see."""
+        return self._last_visible
+
+
+class TranscriptViewCache:
+    """
+    Bounded store of TranscriptViews keyed by viewer and conversation.
+
+    A model instance is often shared by several debates (e.g. a debate and its
+    moderation meta-debates), so views are keyed by the viewer and the identity of
+    the conversation's first message to keep them from evicting each other.
+    """
+
+    def __init__(self, max_views: int = 256):
+        self.max_views = max_views
+        self._views: Dict[tuple, tuple] = {}
+
+    def get(self, viewer: str, messages: List[Message]) -> TranscriptView:
+        anchor = messages[0] if messages else None
+        key = (viewer, id(anchor))
+        cached = self._views.pop(key, None)
+        if cached is None or cached[0] is not anchor:
+            cached = (anchor, TranscriptView(viewer))
+        # Re-insert to keep most recently used views at the end
+        self._views[key] = cached
+        while len(self._views) > self.max_views:
+            self._views.pop(next(iter(self._views)))
+        return cached[1]
@@ -0,0 +1,109 @@
+import datetime
+import json
+import os
+import re
+import tempfile
+from typing import List
+
+from .tracing import MetricsTracer, Span
+
+
+def _metric_name(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def _label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(pairs) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{_metric_name(key)}="{_label_value(value)}"' for key, value in pairs) + "}"
+
+
+def prometheus_text(tracer: MetricsTracer, prefix: str = "debate") -> str:
+    """
+    Render counters and per-phase durations in the Prometheus text exposition format.
+
+    Phases become a `<prefix>_phase_seconds` summary (sum/count) plus a
+    `<prefix>_phase_seconds_max` gauge; counters become `<prefix>_<name>_total`.
+    """
+    lines = [f"# TYPE {prefix}_phase_seconds summary"]
+    for phase, stats in sorted(tracer.phases.items()):
+        labels = _labels([("phase", phase)])
+        lines.append(f"{prefix}_phase_seconds_sum{labels} {stats.total_seconds:.9f}")
+        lines.append(f"{prefix}_phase_seconds_count{labels} {stats.count}")
+    lines.append(f"# TYPE {prefix}_phase_seconds_max gauge")
+    for phase, stats in sorted(tracer.phases.items()):
+        lines.append(f"{prefix}_phase_seconds_max{_labels([('phase', phase)])} {stats.max_seconds:.9f}")
+
+    by_name = {}
+    for (name, labels), value in tracer.counters.items():
+        by_name.setdefault(name, []).append((labels, value))
+    for name in sorted(by_name):
+        metric = f"{prefix}_{_metric_name(name)}_total"
+        lines.append(f"# TYPE {metric} counter")
+        for labels, value in sorted(by_name[name]):
+            lines.append(f"{metric}{_labels(labels)} {value:g}")
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(tracer: MetricsTracer, path: str, prefix: str = "debate"):
+    """
+    Write prometheus_text() to a file for the node_exporter textfile collector.
+    The file is replaced atomically so a scrape never sees a partial write.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(prometheus_text(tracer, prefix))
+    os.replace(temp_path, path)
+
+
+def _iso(ns: int) -> str:
+    return datetime.datetime.fromtimestamp(ns / 1e9, tz=datetime.timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def otel_span_dict(span: Span) -> dict:
+    """A span in the JSON shape of OpenTelemetry's ReadableSpan.to_json()."""
+    return {
+        "name": span.name,
+        "context": {
+            "trace_id": f"0x{span.trace_id:032x}",
+            "span_id": f"0x{span.span_id:016x}",
+            "trace_state": "[]",
+        },
+        "kind": "SpanKind.INTERNAL",
+        "parent_id": f"0x{span.parent_id:016x}" if span.parent_id is not None else None,
+        "start_time": _iso(span.start_ns),
+        "end_time": _iso(span.end_ns),
+        "status": {"status_code": "ERROR" if "error" in span.attributes else "UNSET"},
+        "attributes": dict(span.attributes),
+        "events": [],
+        "links": [],
+        "resource": {"attributes": {"service.name": "chain-of-debate"}, "schema_url": ""},
+    }
+
+
+def otel_spans(tracer: MetricsTracer) -> List[dict]:
+    """All retained spans as OpenTelemetry-compatible dicts, in finishing order."""
+    return [otel_span_dict(span) for span in tracer.spans]
+
+
+def write_jsonl(tracer: MetricsTracer, path: str):
+    """
+    Append retained spans and current counter values to a JSONL file, one record per line
+    ({"type": "span", ...} or {"type": "counter", ...}).
+    """
+    with open(path, "a", encoding="utf-8") as f:
+        for span in tracer.spans:
+            f.write(json.dumps({
+                "type": "span", "name": span.name, "trace_id": f"{span.trace_id:032x}",
+                "span_id": f"{span.span_id:016x}",
+                "parent_id": f"{span.parent_id:016x}" if span.parent_id is not None else None,
+                "start_ns": span.start_ns, "duration_ms": round(span.duration * 1e3, 4),
+                "attributes": span.attributes,
+            }, default=str) + "\n")
+        for (name, labels), value in sorted(tracer.counters.items()):
+            f.write(json.dumps({"type": "counter", "name": name, "labels": dict(labels), "value": value}) + "\n")
@@ -0,0 +1,183 @@
+import contextvars
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+@dataclass
+class Span:
+    """A finished, timed phase of a conversation."""
+    name: str
+    trace_id: int
+    span_id: int
+    parent_id: Optional[int]
+    start_ns: int
+    end_ns: int
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds."""
+        return (self.end_ns - self.start_ns) / 1e9
+
+
+@dataclass
+class PhaseStats:
+    """Running totals for every span with the same name."""
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+
+class _NullSpan:
+    """Span handle used while tracing is disabled: every operation is a no-op."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    Tracing and metrics surface of a conversation. This base class is the disabled
+    tracer: span() returns a shared no-op handle and count() does nothing, so
+    instrumented code costs one method call per phase when nobody is listening.
+    """
+
+    enabled = False
+
+    def span(self, name: str, **attributes) -> Any:
+        """
+        Time a phase. Use as a context manager; the handle accepts set_attribute() calls.
+
+        Args:
+            name: Phase name (e.g. "turn", "validation", "api")
+            **attributes: Attributes recorded on the span (e.g. speaker="alice")
+        """
+        return _NULL_SPAN
+
+    def count(self, name: str, value: float = 1, **labels):
+        """
+        Increment a counter.
+
+        Args:
+            name: Counter name (e.g. "turns", "tokens")
+            value: Amount to add
+            **labels: Counter labels (e.g. speaker="alice")
+        """
+        pass
+
+
+NULL_TRACER = Tracer()
+
+_current_tracer: contextvars.ContextVar[Tracer] = contextvars.ContextVar("current_tracer", default=NULL_TRACER)
+_current_span: contextvars.ContextVar[Optional['_ActiveSpan']] = contextvars.ContextVar("current_span", default=None)
+
+
+def current_tracer() -> Tracer:
+    """The tracer of the conversation running in this context (NULL_TRACER when none is)."""
+    return _current_tracer.get()
+
+
+def use_tracer(tracer: Tracer) -> contextvars.Token:
+    """Make `tracer` the current tracer; undo with reset_tracer(token)."""
+    return _current_tracer.set(tracer)
+
+
+def reset_tracer(token: contextvars.Token):
+    _current_tracer.reset(token)
+
+
+def _new_id(bits: int) -> int:
+    # uuid4 draws from os.urandom, so tracing never disturbs seeded `random` state
+    return (uuid.uuid4().int & ((1 << bits) - 1)) or 1
+
+
+class _ActiveSpan:
+    def __init__(self, tracer: 'MetricsTracer', name: str, attributes: Dict[str, Any]):
+        self._tracer = tracer
+        self.name = name
+        self.attributes = attributes
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def __enter__(self):
+        parent = _current_span.get()
+        if parent is not None and parent._tracer is self._tracer:
+            self.trace_id, self.parent_id = parent.trace_id, parent.span_id
+        else:
+            self.trace_id, self.parent_id = _new_id(128), None
+        self.span_id = _new_id(64)
+        self._token = _current_span.set(self)
+        self.start_ns = time.time_ns()
+        self._started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        duration_ns = time.perf_counter_ns() - self._started
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        self._tracer._finish(Span(self.name, self.trace_id, self.span_id, self.parent_id,
+                                  self.start_ns, self.start_ns + duration_ns, self.attributes))
+        return False
+
+
+class MetricsTracer(Tracer):
+    """
+    Tracer that records spans and counters in memory for the exporters in
+    telemetry.exporters.
+
+    Spans nest by execution context, so concurrent debates sharing one tracer each get
+    their own trace and nested meta-debates appear under the watcher that ran them.
+    Only the most recent `max_spans` spans are kept; per-phase totals and counters
+    cover everything.
+
+    Args:
+        max_spans: Number of finished spans to keep for export
+    """
+
+    enabled = True
+
+    def __init__(self, max_spans: int = 100_000):
+        self.spans: Deque[Span] = deque(maxlen=max_spans)
+        self.phases: Dict[str, PhaseStats] = {}
+        self.counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+
+    def span(self, name: str, **attributes) -> _ActiveSpan:
+        return _ActiveSpan(self, name, attributes)
+
+    def count(self, name: str, value: float = 1, **labels):
+        key = (name, tuple(sorted((label, str(label_value)) for label, label_value in labels.items())))
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def _finish(self, span: Span):
+        self.spans.append(span)
+        stats = self.phases.get(span.name)
+        if stats is None:
+            stats = self.phases[span.name] = PhaseStats()
+        stats.add(span.duration)
+
+    def counter(self, name: str, **labels) -> float:
+        """Current value of one counter (0 if never incremented)."""
+        return self.counters.get((name, tuple(sorted((k, str(v)) for k, v in labels.items()))), 0)
+
+    def breakdown(self) -> List[Tuple[str, PhaseStats]]:
+        """Per-phase totals, slowest first."""
+        return sorted(self.phases.items(), key=lambda item: item[1].total_seconds, reverse=True)
@@ -1,6 +1,13 @@
-from agents.agent_system import AgentOrchestratorAPI, DebateWatcher, Goal, Persona
+import asyncio
+from dataclasses import dataclass
+from agents.agent_system import AgentOrchestratorAPI, DebateWatcher, Goal, Persona, run_coroutine_sync
+from agents.budget import charge_usage, conversation_depth, current_budget
+from agents.compaction import ExtractiveSummarizer, Summarizer
 from agents.debate_chain import ChainOfDebate, DebateTimeKeeperConfig, VerdictConfig
-from typing import List, Optional
+from models.base import Message
+from telemetry.tracing import current_tracer
+from watchers.prescreen import PreScreen, ScreeningDecision
+from typing import Coroutine, List, Optional, Tuple
 
 
 def create_moderation_verdict_config() -> VerdictConfig:
@@ -16,19 +23,130 @@ def create_moderation_verdict_config() -> VerdictConfig:
     )
 
 
+def default_moderator_personas() -> List[Persona]:
+    """The moderation experts reviewing a debate."""
+    return [
+        Persona(
+            name="Process Monitor",
+            title="Debate Process Expert",
+            expertise="Meeting facilitation, goal tracking, procedural compliance",
+            personality="Efficient and direct, focused on keeping discussions productive",
+            speaking_style="Brief and action-oriented, provides clear recommendations"
+        ),
+        Persona(
+            name="Quality Assessor",
+            title="Discussion Quality Analyst",
+            expertise="Content analysis, professional communication, topic adherence",
+            personality="Quality-focused observer who identifies issues quickly",
+            speaking_style="Concise evaluations with specific corrective suggestions"
+        )
+    ]
+
+
+MODERATION_MODES = ("debate", "vote")
+
+
+@dataclass
+class ModerationStats:
+    """Counters of a ModerationWatcher."""
+    reviews: int = 0
+    interventions: int = 0
+    no_action: int = 0
+    stale: int = 0
+    deferred: int = 0
+    skipped: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    # Reviews degraded because the DebateBudget ran low: shortened, voted instead of debated, or skipped
+    shortened: int = 0
+    voted: int = 0
+    over_budget: int = 0
+    # Estimated tokens of the review contexts sent, and saved compared to sending the full log
+    context_tokens: int = 0
+    tokens_saved: int = 0
+
+
 class ModerationWatcher(DebateWatcher):
+    """
+    Every `check_interval` messages, runs a short meta-debate of moderators over the
+    transcript and injects their majority intervention, if any, as a coordinator message.
+
+    In async conversations the meta-debate runs in the background by default, on a snapshot
+    of the transcript taken when the review is due, so the debate keeps going meanwhile; the
+    intervention is injected as soon as the review finishes, a few messages after the point
+    it reviewed rather than right there. A review that comes due while the previous one is
+    still running waits for it and then covers the newer transcript. Results that arrive
+    too late to matter are dropped, never injected: when more than `max_staleness` messages
+    were added since the snapshot, or the debate moved on to another goal. With
+    `background=False`, and on synchronous ticks (__call__), the review runs inline as it
+    used to, holding the debate until the intervention is in.
+
+    Reviews are incremental: each one is shown only the messages added since the previous
+    review, after a rolling summary of everything reviewed before (kept by `summarizer`
+    and extended while the review runs), so a review costs the same late in a long debate
+    as early on. The tokens this saves are reported per check.
+
+    Under a DebateBudget (see agents.budget) every review first asks the budget how it
+    may run. As the budget runs low, meta-debates are shortened to their minimum length
+    without meta-watchers, then replaced by a vote, and finally skipped (the messages
+    still go into the summary). Moderators whose meta-debate would nest deeper than the
+    budget's max_depth vote instead.
+
+    In "vote" mode there is no meta-debate: every moderator casts a verdict in a single
+    call, all at once, and the same majority rule decides on the intervention. A review
+    then costs one concurrent call per moderator instead of several sequential turns.
+
+    Args:
+        llm: Model of the moderators
+        check_interval: Messages between reviews
+        moderation_criteria: What the moderators evaluate
+        length_multiplier: Target length of the meta-debate
+        meta_watchers: Watchers of the meta-debate (e.g. a ModerationWatcher moderating the moderators)
+        background: Run reviews in the background in async conversations (False: inline,
+            with interventions at the reviewed point and nothing dropped as stale)
+        max_staleness: Messages the debate may advance during a background review before
+            its result is dropped (None: `check_interval`)
+        summarizer: Keeps the summary of already reviewed messages (default: ExtractiveSummarizer)
+        mode: "debate" (moderators debate, then vote) or "vote" (moderators vote at once)
+        moderator_personas: The moderators (default: default_moderator_personas())
+        prescreen: Local check deciding whether a due review is worth running (e.g.
+            watchers.prescreen.HeuristicPreScreen); skipped messages only go into the summary
+    """
+
     def __init__(self,
                  llm,
                  check_interval: int = 8,
                  moderation_criteria: str = None,
                  length_multiplier: float = 2.0,
-                 meta_watchers: List[DebateWatcher] = None):
+                 meta_watchers: List[DebateWatcher] = None,
+                 background: bool = True,
+                 max_staleness: Optional[int] = None,
+                 summarizer: Optional[Summarizer] = None,
+                 mode: str = "debate",
+                 moderator_personas: List[Persona] = None,
+                 prescreen: Optional[PreScreen] = None):
+        if mode not in MODERATION_MODES:
+            raise ValueError(f"Unknown moderation mode {mode!r}, expected one of {', '.join(MODERATION_MODES)}")
         self.llm = llm
         self.check_interval = check_interval
         self.last_check_message = 0
         self.moderation_criteria = moderation_criteria or self._default_criteria()
         self.length_multiplier = length_multiplier
         self.meta_watchers = meta_watchers or []
+        self.background = background
+        self.max_staleness = check_interval if max_staleness is None else max_staleness
+        self.summarizer = summarizer or ExtractiveSummarizer()
+        self.mode = mode
+        self.moderator_personas = moderator_personas or default_moderator_personas()
+        self.prescreen = prescreen
+        self.stats = ModerationStats()
+        self._review: Optional[asyncio.Task] = None
+        # Messages covered by earlier reviews: their count, the id of the last one, and their summary
+        self._reviewed = 0
+        self._last_reviewed_id: Optional[str] = None
+        self._summary: Optional[str] = None
+        # Size of the full log the reviews would otherwise have been sent
+        self._log_chars = 0
 
     def _default_criteria(self) -> str:
         return """
@@ -40,19 +158,20 @@ class ModerationWatcher(DebateWatcher):
     - Should any corrective action be taken?
     """
 
-    def _calculate_meta_debate_config(self) -> tuple:
-        """Calculate meta-debate configuration based on length multiplier"""
-        base_messages = max(2, int(self.length_multiplier))
+    def _calculate_meta_debate_config(self, length_multiplier: Optional[float] = None) -> tuple:
+        """Calculate meta-debate configuration based on length multiplier (default: the watcher's)"""
+        length_multiplier = self.length_multiplier if length_multiplier is None else length_multiplier
+        base_messages = max(2, int(length_multiplier))
         max_messages = base_messages + 2  # Small buffer for completion
 
         # Scale timekeeper settings based on desired length
-        if self.length_multiplier <= 2:
+        if length_multiplier <= 2:
             # Very short debates
             intervention_interval = 1
             insist_threshold = 1
             demand_threshold = 3
             force_verdict_threshold = base_messages
-        elif self.length_multiplier <= 4:
+        elif length_multiplier <= 4:
             # Short debates
             intervention_interval = 1
             insist_threshold = 2
@@ -60,9 +179,9 @@ class ModerationWatcher(DebateWatcher):
             force_verdict_threshold = base_messages
         else:
             # Longer debates
-            intervention_interval = max(2, int(self.length_multiplier / 2))
-            insist_threshold = max(3, int(self.length_multiplier * 0.6))
-            demand_threshold = max(4, int(self.length_multiplier * 0.8))
+            intervention_interval = max(2, int(length_multiplier / 2))
+            insist_threshold = max(3, int(length_multiplier * 0.6))
+            demand_threshold = max(4, int(length_multiplier * 0.8))
             force_verdict_threshold = base_messages
 
         timekeeper_config = DebateTimeKeeperConfig(
@@ -74,21 +193,81 @@ class ModerationWatcher(DebateWatcher):
 
         return timekeeper_config, max_messages
 
-    def __call__(self, current_speaker, orchestrator_api: AgentOrchestratorAPI):
-        # Only check every N messages
+    def _due_for_check(self, orchestrator_api: AgentOrchestratorAPI) -> bool:
+        """Only check every N messages; records the check position when due."""
         current_count = orchestrator_api.debate_messages_count()
         if current_count - self.last_check_message < self.check_interval:
-            return
+            return False
+        if self._review is not None:
+            # Still reviewing an earlier snapshot; check again on the next tick
+            self.stats.deferred += 1
+            return False
 
         self.last_check_message = current_count
+        return True
 
-        # Convert all messages to string log
-        debate_log = ""
-        for message in orchestrator_api.messages():
-            debate_log += f"[{message.speaker}] → {message.speaking_to or 'All'}: {message.content}\n"
+    @staticmethod
+    def _format_message(message: Message) -> str:
+        return f"[{message.speaker}] → {message.speaking_to or 'All'}: {message.content}\n"
 
+    def _unreviewed(self, orchestrator_api: AgentOrchestratorAPI) -> List[Message]:
+        """Messages added since the previous review. Marks them as reviewed."""
+        messages = orchestrator_api.messages_since(self._reviewed - 1) if self._reviewed else []
+        if messages and messages[0].id == self._last_reviewed_id:
+            new_messages = messages[1:]
+        else:
+            # Messages were inserted before, or moved out of, the reviewed part (e.g. archived
+            # at a goal transition): find where the last review stopped
+            messages = list(orchestrator_api.messages())
+            ids = [message.id for message in messages]
+            start = ids.index(self._last_reviewed_id) + 1 if self._last_reviewed_id in ids else 0
+            new_messages = messages[start:]
+            self._reviewed = start
+        if new_messages:
+            self._reviewed += len(new_messages)
+            self._last_reviewed_id = new_messages[-1].id
+        return new_messages
+
+    def _review_log(self, new_messages: List[Message]) -> str:
+        """The log for a review of `new_messages`: the summary of earlier messages plus the new ones."""
+        new_log = "".join(self._format_message(message) for message in new_messages)
+        self._log_chars += len(new_log)
+        if self._summary:
+            debate_log = (f"SUMMARY OF EARLIER MESSAGES (already reviewed):\n{self._summary}\n\n"
+                          f"MESSAGES SINCE THE LAST REVIEW:\n{new_log}")
+        else:
+            debate_log = new_log
+
+        # About 4 characters per token, as for rate limiting
+        sent, full = len(debate_log) // 4, self._log_chars // 4
+        self.stats.context_tokens += sent
+        self.stats.tokens_saved += full - sent
+        current_tracer().count("moderation_context_tokens", sent, kind="sent")
+        current_tracer().count("moderation_context_tokens", full - sent, kind="saved")
+        print(f"📉 Moderation review of {len(new_messages)} new messages: ~{sent} tokens of log "
+              f"instead of ~{full} (saved ~{full - sent})")
+        return debate_log
+
+    async def _skip_review(self, new_messages: List[Message]):
+        """Leave the messages unreviewed (pre-screened or over budget): they only go into the summary."""
+        self._log_chars += sum(len(self._format_message(message)) for message in new_messages)
+        await self._update_summary(new_messages)
+
+    async def _update_summary(self, new_messages: List[Message]):
+        """Fold reviewed messages into the rolling summary."""
+        if not new_messages:
+            return
+        try:
+            self._summary = await self.summarizer.summarize("moderator", self._summary, new_messages)
+        except Exception as e:
+            print(f"⚠️ Moderation summary update failed, summary misses {len(new_messages)} messages: {e}")
+
+    def _create_meta_debate(self, orchestrator_api: AgentOrchestratorAPI, debate_log: str,
+                            short: bool = False) -> ChainOfDebate:
+        """Build the moderation meta-debate over `debate_log`; `short` ones have minimal length and no meta-watchers."""
+        length_multiplier = 1.0 if short else self.length_multiplier
         # Calculate meta-debate configuration
-        timekeeper_config, max_messages = self._calculate_meta_debate_config()
+        timekeeper_config, max_messages = self._calculate_meta_debate_config(length_multiplier)
 
         # Create meta-debate for moderation
         meta_debate = ChainOfDebate(
@@ -117,42 +296,202 @@ VOTING MECHANISM:
 
 Your verdict and reasoning directly impact whether and how the primary debate is moderated.
 
-IMPORTANT: This is a SHORT meta-analysis (target: {int(self.length_multiplier)} messages). If you vote for GENTLE_REDIRECT, FIRM_CORRECTION, or URGENT_INTERVENTION, write your specific intervention message in your verdict reasoning - this will be sent directly to the debate participants.
+IMPORTANT: This is a SHORT meta-analysis (target: {int(length_multiplier)} messages). If you vote for GENTLE_REDIRECT, FIRM_CORRECTION, or URGENT_INTERVENTION, write your specific intervention message in your verdict reasoning - this will be sent directly to the debate participants.
 """,
             verdict_config=create_moderation_verdict_config(),
             goals=[Goal("moderation_decision", "Decide if intervention is needed and craft response message, according to the <Task> tag.")],
             timekeeper_config=timekeeper_config,
-            watchers=self.meta_watchers  # Pass watchers to meta-debate
+            watchers=[] if short else self.meta_watchers  # Pass watchers to meta-debate
         )
 
-        # Create moderation experts
-        moderator_personas = [
-            Persona(
-                name="Process Monitor",
-                title="Debate Process Expert",
-                expertise="Meeting facilitation, goal tracking, procedural compliance",
-                personality="Efficient and direct, focused on keeping discussions productive",
-                speaking_style="Brief and action-oriented, provides clear recommendations"
-            ),
-            Persona(
-                name="Quality Assessor",
-                title="Discussion Quality Analyst",
-                expertise="Content analysis, professional communication, topic adherence",
-                personality="Quality-focused observer who identifies issues quickly",
-                speaking_style="Concise evaluations with specific corrective suggestions"
-            )
-        ]
-
-        meta_debate.setup_agents(moderator_personas)
-
-        # Run short meta-debate
-        meta_results = meta_debate.run_debate()
+        meta_debate.setup_agents(self.moderator_personas)
+
+        return meta_debate
+
+    def _vote_messages(self, persona: Persona, debate_log: str) -> List[Message]:
+        verdict_config = create_moderation_verdict_config()
+        instructions = Message.make(f"""You are {persona.name}, {persona.title}, moderating a debate.
+
+EXPERTISE: {persona.expertise}
+PERSONALITY: {persona.personality}
+SPEAKING STYLE: {persona.speaking_style}
+
+Review the debate log below against the task and cast your vote in a single message.
+
+<Task>
+{self.moderation_criteria}
+</Task>
+
+SCAFFOLDING RULES - your message <Content> must contain:
+- In <Verdict> section: Use ONLY these options: {verdict_config.get_verdict_prompt()}, or leave empty if undecided
+- In <VerdictReasoning>: Brief explanation of your verdict. If you vote for GENTLE_REDIRECT, FIRM_CORRECTION or URGENT_INTERVENTION, write the intervention message itself here - it is sent directly to the debate participants
+
+A MAJORITY of the moderators must vote for the same intervention for it to be sent; otherwise no intervention occurs.""", "system")
+        request = Message.make(f"DEBATE LOG TO REVIEW:\n\n<Logs>\n{debate_log}\n</Logs>\n\nCast your vote now.",
+                               "coordinator")
+        return [instructions, request]
+
+    async def _cast_vote(self, persona: Persona, debate_log: str) -> Tuple[Optional[str], Optional[str]]:
+        """One moderator's verdict and reasoning; (None, None) for a failed call or an invalid verdict."""
+        try:
+            response = await self.llm.acall(speaker=persona.name, messages=self._vote_messages(persona, debate_log),
+                                             stop_sequences=["</Message>"])
+        except Exception as e:
+            print(f"⚠️ Moderation vote of {persona.name} failed: {e}")
+            return None, None
+        charge_usage(response)
+        verdict = (response.parsed.verdict or "").strip()
+        if verdict not in create_moderation_verdict_config().verdict_options:
+            return None, None
+        return verdict, response.parsed.verdict_reasoning
+
+    async def _vote(self, debate_log: str) -> dict:
+        """All moderators vote at once; the result has the shape of a meta-debate's results."""
+        votes = await asyncio.gather(*(self._cast_vote(persona, debate_log) for persona in self.moderator_personas))
+        return {
+            # Moderators without a valid vote still count towards the majority threshold
+            'verdicts': {persona.name: verdict for persona, (verdict, _) in zip(self.moderator_personas, votes)},
+            'verdict_details': {persona.name: {'verdict': verdict, 'reasoning': reasoning}
+                                for persona, (verdict, reasoning) in zip(self.moderator_personas, votes)},
+        }
 
+    def _budget_plan(self, orchestrator_api: AgentOrchestratorAPI) -> str:
+        """How the due review may run under the current DebateBudget: "full", "short", "vote" or "skip"."""
+        budget = current_budget()
+        if budget is None:
+            return "full"
+        plan = budget.plan(conversation_depth())
+        if plan == "full" or (plan != "skip" and self.mode == "vote"):
+            # A vote is already the cheapest review short of none
+            return "full"
+        budget.record_degraded(plan)
+        if plan == "skip":
+            self.stats.over_budget += 1
+        elif plan == "vote":
+            self.stats.voted += 1
+        else:
+            self.stats.shortened += 1
+        action = {"skip": "skipping review", "vote": "voting instead of debating",
+                  "short": "shortening the meta-debate"}[plan]
+        print(f"💸 Moderation review of message {orchestrator_api.debate_messages_count()} over budget, "
+              f"{action} ({budget.summary()})")
+        return plan
+
+    def _start_review(self, orchestrator_api: AgentOrchestratorAPI, debate_log: str, plan: str = "full") -> Coroutine:
+        """The review of `debate_log` as allowed by `plan`, producing meta-debate style results."""
+        if self.mode == "vote" or plan == "vote":
+            return self._vote(debate_log)
+        return self._create_meta_debate(orchestrator_api, debate_log, short=plan == "short").run_debate_async()
+
+    def _apply_meta_results(self, meta_results, orchestrator_api: AgentOrchestratorAPI,
+                            decision: Optional[ScreeningDecision] = None):
         # Extract intervention message from meta-debate results
         intervention_message = self.extract_intervention_from_meta_results(meta_results)
 
         if intervention_message:
+            self.stats.interventions += 1
             orchestrator_api.inject_message(intervention_message, "coordinator")
+        else:
+            self.stats.no_action += 1
+        if decision is not None:
+            self.prescreen.record_outcome(decision, bool(intervention_message))
+
+    def _is_stale(self, orchestrator_api: AgentOrchestratorAPI, snapshot_count: int, snapshot_epoch: int) -> bool:
+        """Whether a review of the transcript at `snapshot_count` messages no longer applies."""
+        return (orchestrator_api.debate_messages_count() - snapshot_count > self.max_staleness
+                or orchestrator_api.epoch() != snapshot_epoch)
+
+    async def _run_review(self, review: Coroutine, new_messages: List[Message],
+                          orchestrator_api: AgentOrchestratorAPI, snapshot_count: int, snapshot_epoch: int,
+                          decision: Optional[ScreeningDecision] = None):
+        try:
+            meta_results, _ = await asyncio.gather(review, self._update_summary(new_messages))
+            if self._is_stale(orchestrator_api, snapshot_count, snapshot_epoch):
+                self.stats.stale += 1
+                print(f"⌛ Moderation review of message {snapshot_count} finished too late, dropped")
+                return
+            self._apply_meta_results(meta_results, orchestrator_api, decision)
+        except Exception as e:
+            self.stats.failed += 1
+            print(f"⚠️ Moderation review of message {snapshot_count} failed: {e}")
+        finally:
+            self._review = None
+
+    def __call__(self, current_speaker, orchestrator_api: AgentOrchestratorAPI):
+        if not self._due_for_check(orchestrator_api):
+            return
+
+        new_messages = self._unreviewed(orchestrator_api)
+        decision = self.prescreen.screen(orchestrator_api, new_messages) if self.prescreen else None
+        if decision is not None and not decision.run_review:
+            self.stats.skipped += 1
+            run_coroutine_sync(self._skip_review(new_messages))
+            return
+        plan = self._budget_plan(orchestrator_api)
+        if plan == "skip":
+            run_coroutine_sync(self._skip_review(new_messages))
+            return
+
+        debate_log = self._review_log(new_messages)
+        self.stats.reviews += 1
+
+        # Run short meta-debate (or the vote)
+        meta_results = run_coroutine_sync(self._start_review(orchestrator_api, debate_log, plan))
+        run_coroutine_sync(self._update_summary(new_messages))
+        self._apply_meta_results(meta_results, orchestrator_api, decision)
+
+    async def acall(self, current_speaker, orchestrator_api: AgentOrchestratorAPI):
+        if not self._due_for_check(orchestrator_api):
+            return
+
+        new_messages = self._unreviewed(orchestrator_api)
+        decision = self.prescreen.screen(orchestrator_api, new_messages) if self.prescreen else None
+        if decision is not None and not decision.run_review:
+            self.stats.skipped += 1
+            await self._skip_review(new_messages)
+            return
+        plan = self._budget_plan(orchestrator_api)
+        if plan == "skip":
+            await self._skip_review(new_messages)
+            return
+
+        # The meta-debate's context holds the transcript as of now, so it reviews a snapshot
+        debate_log = self._review_log(new_messages)
+        self.stats.reviews += 1
+        review = self._run_review(self._start_review(orchestrator_api, debate_log, plan), new_messages,
+                                  orchestrator_api, orchestrator_api.debate_messages_count(), orchestrator_api.epoch(),
+                                  decision)
+        if not self.background:
+            await review
+            return
+        self._review = asyncio.get_running_loop().create_task(review)
+
+    async def wait(self):
+        """Wait for the review running in the background, if any."""
+        if self._review is not None:
+            await asyncio.gather(self._review, return_exceptions=True)
+
+    async def aclose(self):
+        """Cancel a review still running when the debate ends."""
+        review, self._review = self._review, None
+        if review is not None:
+            self.stats.cancelled += 1
+            review.cancel()
+            await asyncio.gather(review, return_exceptions=True)
+
+    def state_dict(self):
+        return {"last_check_message": self.last_check_message, "reviewed": self._reviewed,
+                "last_reviewed_id": self._last_reviewed_id, "summary": self._summary,
+                "log_chars": self._log_chars, "prescreen": self.prescreen.state_dict() if self.prescreen else None}
+
+    def load_state_dict(self, state):
+        self.last_check_message = state["last_check_message"]
+        self._reviewed = state.get("reviewed", 0)
+        self._last_reviewed_id = state.get("last_reviewed_id")
+        self._summary = state.get("summary")
+        self._log_chars = state.get("log_chars", 0)
+        if self.prescreen is not None and state.get("prescreen") is not None:
+            self.prescreen.load_state_dict(state["prescreen"])
 
     def extract_intervention_from_meta_results(self, meta_results) -> str:
         """Extract intervention message from meta-debate verdicts using majority vote"""
@@ -243,21 +582,21 @@ META-MODERATION CRITERIA:
 
 
 # Helper functions for different debate lengths:
-def create_quick_moderation_watcher(llm, criteria: str = None):
+def create_quick_moderation_watcher(llm, criteria: str = None, mode: str = "debate"):
     """Very fast moderation - 1-2 messages"""
-    return ModerationWatcher(llm, moderation_criteria=criteria, length_multiplier=1.0)
+    return ModerationWatcher(llm, moderation_criteria=criteria, length_multiplier=1.0, mode=mode)
 
 
-def create_standard_moderation_watcher(llm, criteria: str = None):
+def create_standard_moderation_watcher(llm, criteria: str = None, mode: str = "debate"):
     """Standard moderation - 2-4 messages"""
-    return ModerationWatcher(llm, moderation_criteria=criteria, length_multiplier=2.0)
+    return ModerationWatcher(llm, moderation_criteria=criteria, length_multiplier=2.0, mode=mode)
 
 
-def create_thorough_moderation_watcher(llm, criteria: str = None):
+def create_thorough_moderation_watcher(llm, criteria: str = None, mode: str = "debate"):
     """Thorough moderation - 6-8 messages"""
-    return ModerationWatcher(llm, moderation_criteria=criteria, length_multiplier=6.0)
+    return ModerationWatcher(llm, moderation_criteria=criteria, length_multiplier=6.0, mode=mode)
 
 
-def create_comprehensive_moderation_watcher(llm, criteria: str = None):
+def create_comprehensive_moderation_watcher(llm, criteria: str = None, mode: str = "debate"):
     """Comprehensive moderation - 10-12 messages"""
-    return ModerationWatcher(llm, moderation_criteria=criteria, length_multiplier=10.0)
\ No newline at end of file
+    return ModerationWatcher(llm, moderation_criteria=criteria, length_multiplier=10.0, mode=mode)
\ No newline at end of file
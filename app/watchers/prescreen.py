@@ -0,0 +1,246 @@
+import math
+import random
+import re
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, FrozenSet, List, Optional
+
+from agents.agent_system import AgentOrchestratorAPI
+from models.base import Message
+
+
+TAG_PATTERN = re.compile(r"<[^>]+>")
+WORD_PATTERN = re.compile(r"[a-z][a-z0-9'-]{3,}")
+STOPWORDS = frozenset({
+    "about", "also", "been", "being", "could", "does", "from", "have", "here", "into", "just", "like",
+    "more", "most", "much", "only", "other", "over", "same", "should", "some", "such", "than", "that",
+    "their", "them", "then", "there", "these", "they", "this", "those", "very", "were", "what", "when",
+    "where", "which", "while", "will", "with", "would", "your", "yours", "true", "false",
+})
+# Speakers whose messages are templated rather than debated
+SYSTEM_SPEAKERS = frozenset({"coordinator", "system"})
+
+
+def content_words(text: str) -> FrozenSet[str]:
+    """Distinct lowercase content words of a message, without scaffolding tags and stopwords."""
+    return frozenset(word for word in WORD_PATTERN.findall(TAG_PATTERN.sub(" ", text).lower())
+                     if word not in STOPWORDS)
+
+
+@dataclass
+class ScreeningDecision:
+    """Outcome of screening the messages added since the previous check."""
+    message_count: int
+    score: float
+    signals: Dict[str, float]
+    run_review: bool
+    audited: bool = False
+    # Whether the review that ran intervened (None until known, and for skipped checks)
+    intervened: Optional[bool] = None
+
+
+@dataclass
+class PreScreenStats:
+    """
+    Decisions of a pre-screen and how well they agreed with the reviews that ran.
+
+    A decision agrees with its review when the screen flagged the messages (score at or
+    above the threshold) and the moderators intervened, or it did not and they did not.
+    Skipped checks only have an outcome when they were audited.
+    """
+    screened: int = 0
+    skipped: int = 0
+    ran: int = 0
+    audited: int = 0
+    agreed: int = 0
+    disagreed: int = 0
+    # Flagged checks the moderators left alone, and unflagged (audited) ones they corrected
+    false_alarms: int = 0
+    misses: int = 0
+    recent: Deque[ScreeningDecision] = field(default_factory=lambda: deque(maxlen=200))
+
+    @property
+    def skip_rate(self) -> float:
+        return self.skipped / self.screened if self.screened else 0.0
+
+    @property
+    def agreement_rate(self) -> float:
+        judged = self.agreed + self.disagreed
+        return self.agreed / judged if judged else 0.0
+
+
+class PreScreen(ABC):
+    """
+    Cheap local check run before a moderation review, deciding whether the review is
+    worth its LLM calls.
+
+    Args:
+        threshold: Reviews run when the risk score reaches this value
+        audit_probability: Share of skipped checks reviewed anyway, to measure how often
+            skipping was right
+        seed: Seed of the audit sampling
+    """
+
+    def __init__(self, threshold: float, audit_probability: float = 0.0, seed: Optional[int] = None):
+        self.threshold = threshold
+        self.audit_probability = audit_probability
+        self.stats = PreScreenStats()
+        self._rng = random.Random(seed)
+
+    @abstractmethod
+    def signals(self, orchestrator_api: AgentOrchestratorAPI, new_messages: List[Message]) -> Dict[str, float]:
+        """
+        Risk signals of the messages added since the previous check, each between 0 and 1.
+
+        Args:
+            orchestrator_api: The moderated debate
+            new_messages: Messages added since the previous check, oldest first
+        """
+        pass
+
+    def risk(self, signals: Dict[str, float]) -> float:
+        """Combined risk score; the strongest signal by default."""
+        return max(signals.values(), default=0.0)
+
+    def screen(self, orchestrator_api: AgentOrchestratorAPI, new_messages: List[Message]) -> ScreeningDecision:
+        """Score the new messages and decide whether the review should run."""
+        signals = self.signals(orchestrator_api, new_messages)
+        score = self.risk(signals)
+        run_review = score >= self.threshold
+        audited = not run_review and self._rng.random() < self.audit_probability
+        decision = ScreeningDecision(orchestrator_api.debate_messages_count(), score, signals,
+                                     run_review or audited, audited)
+
+        self.stats.screened += 1
+        self.stats.recent.append(decision)
+        if decision.run_review:
+            self.stats.ran += 1
+            self.stats.audited += audited
+        else:
+            self.stats.skipped += 1
+        details = ", ".join(f"{name} {value:.2f}" for name, value in signals.items())
+        action = "audit review" if audited else "run review" if run_review else "skip review"
+        print(f"🔎 Moderation pre-screen at message {decision.message_count}: risk {score:.2f} "
+              f"(threshold {self.threshold:.2f}; {details}) → {action}")
+        return decision
+
+    def record_outcome(self, decision: ScreeningDecision, intervened: bool):
+        """Record whether the review of a screened check intervened."""
+        decision.intervened = intervened
+        flagged = decision.score >= self.threshold
+        if flagged == intervened:
+            self.stats.agreed += 1
+        else:
+            self.stats.disagreed += 1
+            if flagged:
+                self.stats.false_alarms += 1
+            else:
+                self.stats.misses += 1
+        print(f"🔎 Pre-screen {'agreed' if flagged == intervened else 'disagreed'} with the review "
+              f"(agreement {self.stats.agreement_rate:.0%} over {self.stats.agreed + self.stats.disagreed} reviews)")
+
+    def state_dict(self) -> dict:
+        return {}
+
+    def load_state_dict(self, state: dict):
+        pass
+
+
+class HeuristicPreScreen(PreScreen):
+    """
+    Pre-screen over local heuristics of the new participant messages:
+
+    - off_topic: share of messages sharing no content word with the debate topic and context
+    - repetition: share of messages that nearly repeat a recent message (word Jaccard
+      similarity of at least `repeat_similarity`)
+    - rejections: format rejections per new message since the previous check
+    - length: share of messages whose length is anomalous against the running length
+      statistics (beyond `length_z` standard deviations), or that are empty
+
+    The risk score is the strongest weighted signal, so one clear problem is enough to
+    run the review.
+
+    Args:
+        threshold: Reviews run when the risk score reaches this value
+        weights: Weight per signal (missing signals weigh 1.0)
+        repeat_similarity: Jaccard similarity from which two messages count as repeats
+        history: Number of recent messages compared for repetition
+        length_z: Standard deviations from the mean length that count as anomalous
+        audit_probability: Share of skipped checks reviewed anyway
+        seed: Seed of the audit sampling
+    """
+
+    def __init__(self,
+                 threshold: float = 0.3,
+                 weights: Optional[Dict[str, float]] = None,
+                 repeat_similarity: float = 0.8,
+                 history: int = 50,
+                 length_z: float = 3.0,
+                 audit_probability: float = 0.0,
+                 seed: Optional[int] = None):
+        super().__init__(threshold, audit_probability, seed)
+        self.weights = weights or {}
+        self.repeat_similarity = repeat_similarity
+        self.length_z = length_z
+        self._recent_words: Deque[FrozenSet[str]] = deque(maxlen=history)
+        self._topic_words: Optional[FrozenSet[str]] = None
+        self._rejections = 0
+        # Running mean and variance of message lengths (Welford)
+        self._lengths = 0
+        self._mean_length = 0.0
+        self._length_m2 = 0.0
+
+    def _length_anomalous(self, length: int) -> bool:
+        anomalous = length == 0
+        if self._lengths >= 5:
+            deviation = math.sqrt(self._length_m2 / (self._lengths - 1))
+            anomalous = anomalous or abs(length - self._mean_length) > self.length_z * max(deviation, 1.0)
+        self._lengths += 1
+        delta = length - self._mean_length
+        self._mean_length += delta / self._lengths
+        self._length_m2 += delta * (length - self._mean_length)
+        return anomalous
+
+    def _repeats(self, words: FrozenSet[str]) -> bool:
+        for earlier in self._recent_words:
+            union = len(words | earlier)
+            if union and len(words & earlier) / union >= self.repeat_similarity:
+                return True
+        return False
+
+    def signals(self, orchestrator_api: AgentOrchestratorAPI, new_messages: List[Message]) -> Dict[str, float]:
+        if self._topic_words is None:
+            self._topic_words = content_words(f"{orchestrator_api.topic()}\n{orchestrator_api.context()}")
+
+        messages = [message for message in new_messages if message.speaker.lower() not in SYSTEM_SPEAKERS]
+        off_topic = repeats = anomalies = 0
+        for message in messages:
+            words = content_words(message.content)
+            off_topic += bool(words) and not (words & self._topic_words)
+            repeats += bool(words) and self._repeats(words)
+            anomalies += self._length_anomalous(len(message.content.strip()))
+            self._recent_words.append(words)
+
+        rejections = orchestrator_api.rejection_count()
+        new_rejections, self._rejections = rejections - self._rejections, rejections
+        count = max(1, len(messages))
+        signals = {
+            "off_topic": off_topic / count,
+            "repetition": repeats / count,
+            "rejections": min(1.0, new_rejections / max(1, len(new_messages))),
+            "length": anomalies / count,
+        }
+        return {name: value * self.weights.get(name, 1.0) for name, value in signals.items()}
+
+    def state_dict(self) -> dict:
+        return {"rejections": self._rejections, "lengths": self._lengths, "mean_length": self._mean_length,
+                "length_m2": self._length_m2, "recent_words": [sorted(words) for words in self._recent_words]}
+
+    def load_state_dict(self, state: dict):
+        self._rejections = state["rejections"]
+        self._lengths = state["lengths"]
+        self._mean_length = state["mean_length"]
+        self._length_m2 = state["length_m2"]
+        self._recent_words.clear()
+        self._recent_words.extend(frozenset(words) for words in state["recent_words"])
@@ -42,4 +42,10 @@ class ScheduledMessage(DebateWatcher):
             return
         if self.trigger(current_speaker, orchestrator_api):
             self._finished = True
-            orchestrator_api.inject_message(self.message_content, self.speaker)
\ No newline at end of file
+            orchestrator_api.inject_message(self.message_content, self.speaker)
+
+    def state_dict(self):
+        return {"finished": self._finished}
+
+    def load_state_dict(self, state):
+        self._finished = state["finished"]
\ No newline at end of file
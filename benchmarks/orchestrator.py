@@ -0,0 +1,327 @@
+"""
+Benchmark: per-turn orchestration overhead, independent of LLM latency.
+
+Runs ChainOfDebate turns against an AnthropicLLM whose transport answers instantly,
+so every measured microsecond is spent in the orchestrator: system prompt and request
+assembly, whisper filtering, response parsing, validation, watchers, printing and
+speaker selection. Scenarios sweep history length, agent count and watcher count.
+
+Each scenario reports p50/p99 per phase and per turn, plus the peak memory allocated
+while its turns ran (measured in a second pass, since tracemalloc slows everything down).
+Phases nest where the code does: "filtering" is part of "prompt_assembly".
+
+Usage:
+    python benchmarks/orchestrator.py [--history 10 100 1000 10000] [--agents 2 6 50 500]
+                                      [--watchers 0 2 10] [--grid] [--turns 30]
+                                      [--output results.json] [--baseline old.json --tolerance 2]
+"""
+import argparse
+import asyncio
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from types import SimpleNamespace
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from agents.debate_chain import ChainOfDebate, Goal, Persona, create_resume_verdict_config  # noqa: E402
+from models.anthropic import AnthropicLLM  # noqa: E402
+from models.base import Message  # noqa: E402
+from watchers.scheduled import ScheduledMessage  # noqa: E402
+
+SCHEMA = "orchestrator-benchmark/1"
+BASELINE_SCENARIO = {"history": 100, "agents": 6, "watchers": 2}
+
+PARAGRAPH = ("The candidate's payment-processing work shows strong systems thinking, but the "
+             "startup tenure is short and the references are thin. ")
+
+
+class InstantLLM(AnthropicLLM):
+    """AnthropicLLM that builds real requests and parses real responses, with a zero-latency transport."""
+
+    RESPONSE = f"All</SpeakingTo>\n<PrivateThoughts>{PARAGRAPH}</PrivateThoughts>\n<Content>{PARAGRAPH * 3}</Content>\n"
+
+    def __init__(self):
+        super().__init__(api_key="offline-benchmark")
+
+    def _reply(self, api_params: dict):
+        prefill = api_params["messages"][-1]["content"]
+        text = self.RESPONSE if prefill.endswith("<SpeakingTo>") else f" {PARAGRAPH}</Content>\n"
+        usage = SimpleNamespace(input_tokens=0, cache_read_input_tokens=0, cache_creation_input_tokens=0)
+        return SimpleNamespace(content=[SimpleNamespace(text=text)], usage=usage)
+
+    def _create(self, api_params: dict):
+        return self._reply(api_params)
+
+    async def _acreate(self, api_params: dict):
+        return self._reply(api_params)
+
+
+class PhaseTimer:
+    """Collects wall-clock samples per phase by wrapping bound methods of an instance."""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+
+    def wrap(self, obj, attr: str, phase: str):
+        original = getattr(obj, attr)
+        samples = self.samples[phase]
+
+        if asyncio.iscoroutinefunction(original):
+            async def timed(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await original(*args, **kwargs)
+                finally:
+                    samples.append(time.perf_counter() - start)
+        else:
+            def timed(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return original(*args, **kwargs)
+                finally:
+                    samples.append(time.perf_counter() - start)
+
+        setattr(obj, attr, timed)
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(fraction * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def summarize(samples: List[float]) -> dict:
+    return {
+        "count": len(samples),
+        "p50_us": round(percentile(samples, 0.50) * 1e6, 1),
+        "p99_us": round(percentile(samples, 0.99) * 1e6, 1),
+        "total_ms": round(sum(samples) * 1e3, 3),
+    }
+
+
+def build_debate(history: int, agents: int, watchers: int, turns: int) -> ChainOfDebate:
+    """A debate with `history` prior messages, `agents` participants and `watchers` watchers."""
+    import random
+
+    names = [f"Agent{i}" for i in range(agents)]
+    debate = ChainOfDebate(
+        llm=InstantLLM(),
+        debate_topic="Benchmark Evaluation",
+        context_content="CANDIDATE: " + PARAGRAPH * 10,
+        verdict_config=create_resume_verdict_config(),
+        goals=[Goal("benchmark_goal", "Keep talking")],
+        watchers=[ScheduledMessage("never sent", lambda speaker, api: len(list(api.messages())) < 0)
+                  for _ in range(watchers)]
+    )
+    debate.turn_delay = 0
+    debate.rng = random.Random(0)
+    debate.setup_agents([Persona(name, "Reviewer", "Hiring", "Decisive", "Brief") for name in names])
+
+    for i in range(history):
+        speaker = names[i % agents].lower()
+        whisper = i % 10 == 3
+        debate.messages.append(Message.make(
+            content=f"{i}. {PARAGRAPH * 3}" + ("\n<Verdict>GOOD_FIT</Verdict>" if i % 7 == 0 else ""),
+            speaker=speaker,
+            speaking_to=names[(i + 1) % agents].lower() if whisper else None,
+            is_whisper=whisper
+        ))
+    debate.message_count = history
+    debate.max_messages = history + turns
+    return debate
+
+
+def instrument(debate: ChainOfDebate, timer: PhaseTimer):
+    timer.wrap(debate, "add_system_message", "system_prompt")
+    timer.wrap(debate.llm, "_build_request", "prompt_assembly")
+    timer.wrap(debate.llm, "_format_messages_incremental", "filtering")
+    timer.wrap(debate.llm, "_aparse_or_recover", "response_parsing")
+    timer.wrap(debate, "parse_response_fields", "field_parsing")
+    timer.wrap(debate, "validate_message", "validation")
+    timer.wrap(debate, "notify_watchers", "watchers")
+    timer.wrap(debate, "print_message", "printing")
+    timer.wrap(debate, "generate_next_speaker", "speaker_selection")
+
+    # A turn ends when the next speaker has been chosen
+    turn_samples = timer.samples["turn"]
+    original = debate.generate_next_speaker
+    last_turn_end = [None]
+
+    def timed_next_speaker(*args, **kwargs):
+        result = original(*args, **kwargs)
+        now = time.perf_counter()
+        if last_turn_end[0] is not None:
+            turn_samples.append(now - last_turn_end[0])
+        last_turn_end[0] = now
+        return result
+
+    debate.generate_next_speaker = timed_next_speaker
+
+
+def time_scenario(history: int, agents: int, watchers: int, turns: int) -> PhaseTimer:
+    """One timing pass over a freshly built scenario."""
+    timer = PhaseTimer()
+    debate = build_debate(history, agents, watchers, turns)
+    instrument(debate, timer)
+
+    # Like timeit, keep collector pauses from earlier scenarios out of the samples
+    gc.collect()
+    gc.disable()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            debate.run_conversation()
+    finally:
+        gc.enable()
+    return timer
+
+
+def run_scenario(history: int, agents: int, watchers: int, turns: int = 30, measure_memory: bool = True,
+                 repeats: int = 3) -> dict:
+    """
+    Run one scenario and return its JSON-ready result.
+
+    The timing pass is repeated and, as with timeit.repeat, the fastest run (by turn p50)
+    is reported: slower runs measure other load on the machine, not the orchestrator.
+    """
+    timer = min((time_scenario(history, agents, watchers, turns) for _ in range(max(1, repeats))),
+                key=lambda candidate: percentile(candidate.samples["turn"], 0.50))
+
+    peak_memory_kb = None
+    if measure_memory:
+        debate = build_debate(history, agents, watchers, turns)
+        tracemalloc.start()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                debate.run_conversation()
+            peak_memory_kb = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "name": f"history={history},agents={agents},watchers={watchers}",
+        "history": history,
+        "agents": agents,
+        "watchers": watchers,
+        "turns": turns,
+        "repeats": repeats,
+        "phases": {phase: summarize(samples) for phase, samples in sorted(timer.samples.items()) if samples},
+        "peak_memory_kb": peak_memory_kb,
+    }
+
+
+def scenario_matrix(histories, agent_counts, watcher_counts, grid: bool) -> List[dict]:
+    """Full cross product with grid=True, otherwise one axis at a time around BASELINE_SCENARIO."""
+    if grid:
+        return [{"history": h, "agents": a, "watchers": w}
+                for h in histories for a in agent_counts for w in watcher_counts]
+
+    scenarios = []
+    for axis, values in (("history", histories), ("agents", agent_counts), ("watchers", watcher_counts)):
+        for value in values:
+            scenario = dict(BASELINE_SCENARIO, **{axis: value})
+            if scenario not in scenarios:
+                scenarios.append(scenario)
+    return scenarios
+
+
+def run_suite(histories=(10, 100, 1000, 10000), agent_counts=(2, 6, 50, 500), watcher_counts=(0, 2, 10),
+              grid: bool = False, turns: int = 30, measure_memory: bool = True, repeats: int = 3) -> dict:
+    """Run every scenario and return the report in the SCHEMA format."""
+    return {
+        "schema": SCHEMA,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scenarios": [run_scenario(turns=turns, measure_memory=measure_memory, repeats=repeats, **scenario)
+                      for scenario in scenario_matrix(histories, agent_counts, watcher_counts, grid)],
+    }
+
+
+def find_regressions(baseline: dict, current: dict, tolerance: float = 2.0, metric: str = "p50_us",
+                     min_us: float = 100.0) -> List[str]:
+    """
+    Compare two reports scenario by scenario.
+
+    Args:
+        baseline: Earlier report
+        current: New report
+        tolerance: Allowed slowdown factor
+        metric: Phase statistic to compare
+        min_us: Ignore phases faster than this in both reports (too noisy to gate on)
+
+    Returns:
+        Human-readable description of every phase that got slower than allowed
+    """
+    regressions = []
+    baseline_scenarios = {scenario["name"]: scenario for scenario in baseline["scenarios"]}
+    for scenario in current["scenarios"]:
+        previous = baseline_scenarios.get(scenario["name"])
+        if previous is None:
+            continue
+        for phase, stats in scenario["phases"].items():
+            before = previous["phases"].get(phase, {}).get(metric)
+            after = stats[metric]
+            if before is None or max(before, after) < min_us:
+                continue
+            if after > before * tolerance:
+                regressions.append(f"{scenario['name']} {phase}: {metric} {before:.1f} -> {after:.1f} "
+                                   f"({after / max(before, 1e-9):.2f}x)")
+    return regressions
+
+
+def print_report(report: dict):
+    phases = ["turn", "system_prompt", "prompt_assembly", "filtering", "response_parsing", "field_parsing",
+              "validation", "watchers", "printing", "speaker_selection"]
+    print(f"{'scenario':<36} " + " ".join(f"{phase[:12]:>13}" for phase in phases) + f" {'peak KiB':>9}")
+    for scenario in report["scenarios"]:
+        cells = []
+        for phase in phases:
+            stats = scenario["phases"].get(phase)
+            cells.append(f"{stats['p50_us']:>6.0f}/{stats['p99_us']:<6.0f}" if stats else f"{'-':>13}")
+        peak = scenario["peak_memory_kb"]
+        print(f"{scenario['name']:<36} " + " ".join(cells) + f" {peak if peak is not None else '-':>9}")
+    print("(p50/p99 in µs)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--history", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--agents", type=int, nargs="+", default=[2, 6, 50, 500])
+    parser.add_argument("--watchers", type=int, nargs="+", default=[0, 2, 10])
+    parser.add_argument("--grid", action="store_true", help="Run the full cross product of the sweeps")
+    parser.add_argument("--turns", type=int, default=30)
+    parser.add_argument("--repeats", type=int, default=3, help="Timing passes per scenario (fastest is kept)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass")
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    parser.add_argument("--baseline", help="Fail if a phase regressed against this JSON report")
+    parser.add_argument("--tolerance", type=float, default=2.0)
+    args = parser.parse_args()
+
+    report = run_suite(args.history, args.agents, args.watchers, args.grid, args.turns, not args.no_memory,
+                       args.repeats)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = find_regressions(json.load(f), report, args.tolerance)
+        for regression in regressions:
+            print(f"❌ {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
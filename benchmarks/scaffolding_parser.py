@@ -0,0 +1,177 @@
+"""
+Micro-benchmark: single-pass scaffolding parser vs. the previous per-field regex path.
+
+The previous path parsed a response with eight re.search calls in
+Message.parse_from_response, then re-rendered the message with to_prompt() and scanned
+it again in each validity checker, in AgentOrchestrator.parse_response_fields and in
+ChainOfDebate.parse_custom_fields (one findall per verdict option). The legacy functions
+below reproduce that path verbatim so both can be timed on the same input.
+
+Usage:
+    python benchmarks/scaffolding_parser.py [--sizes 10 100 1000] [--repeat 200]
+"""
+import argparse
+import os
+import re
+import sys
+import timeit
+
+import regex
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from agents.debate_chain import (  # noqa: E402
+    VerdictValidityChecker, VerdictReasoningChecker, WithdrawalValidityChecker, WithdrawnFormatChecker,
+    create_resume_verdict_config
+)
+from agents.agent_system import AgentState, Persona  # noqa: E402
+from models.base import Message  # noqa: E402
+from models.scaffolding import parsed_response  # noqa: E402
+
+
+def legacy_parse_from_response(response_text: str) -> dict:
+    """The eight-search parse previously done by Message.parse_from_response."""
+    id_match = re.search(r'<Message id="([^"]*)"', response_text)
+    timestamp_match = re.search(r'timestamp="([^"]*)"', response_text)
+    speaker_match = re.search(r'<Speaker>([^<]*)</Speaker>', response_text)
+    speaking_to_match = re.search(r'<SpeakingTo>([^<]*)</SpeakingTo>', response_text)
+    whisper_match = re.search(r'<Whisper>([^<]*)</Whisper>', response_text)
+    content_match = re.search(r'<Content>(.*?)</Content>', response_text, re.DOTALL)
+    thoughts_match = re.search(r'<PrivateThoughts>(.*?)</PrivateThoughts>', response_text, re.DOTALL)
+    private_predictions_match = re.search(r'<PrivatePredictions>(.*?)</PrivatePredictions>', response_text, re.DOTALL)
+    return {
+        'id': id_match.group(1) if id_match else None,
+        'timestamp': timestamp_match.group(1) if timestamp_match else None,
+        'speaker': speaker_match.group(1) if speaker_match else "unknown",
+        'speaking_to': speaking_to_match.group(1) if speaking_to_match else None,
+        'is_whisper': whisper_match.group(1).lower() == 'true' if whisper_match else False,
+        'content': content_match.group(1).strip() if content_match else "",
+        'thoughts': thoughts_match.group(1).strip() if thoughts_match else "",
+        'private_predictions': private_predictions_match.group(1).strip() if private_predictions_match else "",
+    }
+
+
+def legacy_message_fields(full_response: str, verdict_options, has_verdict: bool) -> dict:
+    """The validator and field-parser scans previously run on message.to_prompt()."""
+    result = {}
+
+    # VerdictValidityChecker
+    verdict_match = regex.search(r"<Verdict>(?:\s|\n)*(.*?)(?:\s|\n)*</Verdict>", full_response, regex.DOTALL)
+    verdict_content = verdict_match.group(1).strip() if verdict_match else None
+    result['verdict_valid'] = not verdict_content or verdict_content in verdict_options
+
+    # VerdictReasoningChecker
+    verdict_match = regex.search(r"<Verdict>(?:\s|\n)*(.*?)(?:\s|\n)*</Verdict>", full_response, regex.DOTALL)
+    reasoning_match = regex.search(r"<VerdictReasoning>(?:\s|\n)*(.*?)(?:\s|\n)*</VerdictReasoning>", full_response,
+                                   regex.DOTALL)
+    result['reasoning_valid'] = (not verdict_match or not verdict_match.group(1).strip()) or bool(
+        reasoning_match and reasoning_match.group(1).strip())
+
+    # WithdrawalValidityChecker
+    withdrawn_match = regex.search(r"<Withdrawn>(?:\s|\n)*(.*?)(?:\s|\n)*</Withdrawn>", full_response, regex.DOTALL)
+    withdrawing = bool(withdrawn_match) and withdrawn_match.group(1).strip().lower() == "true"
+    verdict_in_message = None
+    for option in verdict_options:
+        if regex.findall(rf"<Verdict>(?:\s|\n)*{regex.escape(option)}(?:\s|\n)*</Verdict>", full_response):
+            verdict_in_message = option
+            break
+    result['withdrawal_valid'] = not withdrawing or has_verdict or bool(verdict_in_message)
+
+    # WithdrawnFormatChecker
+    withdrawn_match = regex.search(r"<Withdrawn>(?:\s|\n)*(.*?)(?:\s|\n)*</Withdrawn>", full_response, regex.DOTALL)
+    result['withdrawn_format_valid'] = not withdrawn_match or withdrawn_match.group(1).strip().lower() in ["true", "false"]
+
+    # AgentOrchestrator.parse_response_fields
+    goal_matches = regex.findall(r"<GoalAchieved>(?:\s|\n)*([^<]+?)(?:\s|\n)*</GoalAchieved>", full_response)
+    result['goals_achieved'] = [goal.strip() for goal in goal_matches]
+
+    # ChainOfDebate.parse_custom_fields
+    verdict = None
+    for option in verdict_options:
+        if regex.findall(rf"<Verdict>(?:\s|\n)*{regex.escape(option)}(?:\s|\n)*</Verdict>", full_response):
+            verdict = option
+            break
+    result['verdict'] = verdict
+    reasoning_match = regex.search(r"<VerdictReasoning>(?:\s|\n)*(.*?)(?:\s|\n)*</VerdictReasoning>", full_response,
+                                   regex.DOTALL)
+    result['reasoning'] = (reasoning_match.group(1).strip() or None) if reasoning_match else None
+    withdrawn_match = regex.search(r"<Withdrawn>(?:\s|\n)*(.*?)(?:\s|\n)*</Withdrawn>", full_response, regex.DOTALL)
+    result['withdrawn'] = bool(withdrawn_match) and withdrawn_match.group(1).strip().lower() == "true"
+    return result
+
+
+def current_message_fields(message: Message, verdict_options, has_verdict: bool) -> dict:
+    """The same decisions made through the shared single-pass parse."""
+    config = create_resume_verdict_config()
+    config.verdict_options = list(verdict_options)
+    state = AgentState(persona=Persona("x", "x", "x", "x", "x"))
+    if has_verdict:
+        state.custom_data['verdict'] = verdict_options[0]
+    parsed = parsed_response(message)
+    return {
+        'verdict_valid': VerdictValidityChecker().check(message, config, state).is_valid,
+        'reasoning_valid': VerdictReasoningChecker().check(message, config, state).is_valid,
+        'withdrawal_valid': WithdrawalValidityChecker().check(message, config, state).is_valid,
+        'withdrawn_format_valid': WithdrawnFormatChecker().check(message, config, state).is_valid,
+        'goals_achieved': list(parsed.goals_achieved),
+        'verdict': parsed.verdict_option(verdict_options),
+        'reasoning': parsed.verdict_reasoning or None,
+        'withdrawn': parsed.is_withdrawing,
+    }
+
+
+def make_long_response(paragraphs: int) -> str:
+    """A realistic response whose content holds `paragraphs` paragraphs followed by verdict tags."""
+    paragraph = ("The candidate's payment-processing work shows strong systems thinking, but the "
+                 "startup tenure is short and the references are thin. ")
+    body = "\n\n".join(f"{i}. {paragraph * 3}" for i in range(paragraphs))
+    return (f'<Message id="bench-1" timestamp="2024-01-15T10:30:00">\n'
+            f'<Speaker>alice</Speaker>\n'
+            f'<SpeakingTo>bob</SpeakingTo>\n'
+            f'<Whisper>false</Whisper>\n'
+            f'<Artifacts>\n</Artifacts>\n'
+            f'<PrivateThoughts>{paragraph * paragraphs}</PrivateThoughts>\n'
+            f'<PrivatePredictions>{paragraph}</PrivatePredictions>\n'
+            f'<Content>{body}\n'
+            f'<Verdict>GOOD_FIT</Verdict>\n'
+            f'<VerdictReasoning>{paragraph}</VerdictReasoning>\n'
+            f'<Withdrawn>true</Withdrawn>\n'
+            f'<GoalAchieved>initial_impression</GoalAchieved></Content>\n'
+            f'</Message>')
+
+
+def run_legacy(response_text: str, verdict_options):
+    fields = legacy_parse_from_response(response_text)
+    message = Message(fields['id'], fields['content'], fields['speaker'], fields['timestamp'], [],
+                      fields['speaking_to'], fields['is_whisper'], fields['thoughts'], fields['private_predictions'])
+    return legacy_message_fields(message.to_prompt(), verdict_options, has_verdict=False)
+
+
+def run_current(response_text: str, verdict_options):
+    message = Message.parse_from_response(response_text)
+    return current_message_fields(message, verdict_options, has_verdict=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000],
+                        help="Number of content paragraphs per message")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    verdict_options = create_resume_verdict_config().verdict_options
+    print(f"{'paragraphs':>10} {'chars':>9} {'legacy µs':>11} {'single-pass µs':>15} {'speedup':>8}")
+    for size in args.sizes:
+        response_text = make_long_response(size)
+        assert run_legacy(response_text, verdict_options) == run_current(response_text, verdict_options)
+
+        legacy = min(timeit.repeat(lambda: run_legacy(response_text, verdict_options),
+                                   number=args.repeat, repeat=3)) / args.repeat
+        current = min(timeit.repeat(lambda: run_current(response_text, verdict_options),
+                                    number=args.repeat, repeat=3)) / args.repeat
+        print(f"{size:>10} {len(response_text):>9} {legacy * 1e6:>11.1f} {current * 1e6:>15.1f} "
+              f"{legacy / current:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Benchmark: LLM calls needed to complete each debate goal under each speaker policy.
+
+Runs seeded ChainOfDebate debates against SimulatedLLM, once per policy with the same
+seeds, and counts the model calls (including rejected responses) between the start of
+a goal and its completion. In the simulation, participants whose verdict is already on
+record restate it and withdraw with probability --decided-withdraw, so a policy that
+hands the floor to the right participant at the right time finishes goals with fewer
+calls; undecided participants give a verdict with probability --verdict.
+
+Goals still open when a debate hits --max-messages count as incomplete and are left out
+of the averages, so read calls_per_goal together with completion_rate.
+
+Usage:
+    python benchmarks/speaker_policies.py [--policies weighted round_robin verdict_pending urgency]
+                                          [--debates 20] [--agents 4] [--goals 2] [--max-messages 80]
+                                          [--verdict 0.35] [--decided-withdraw 0.6] [--output results.json]
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import random
+import statistics
+import sys
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from agents.agent_system import SpeakerPolicy, WeightedRandomPolicy  # noqa: E402
+from agents.debate_chain import ChainOfDebate, Goal, Persona, create_resume_verdict_config  # noqa: E402
+from agents.scheduling import RoundRobinPolicy, UrgencyAwarePolicy, VerdictPendingFirstPolicy  # noqa: E402
+from models.simulated import SimulatedLLM, SimulationProfile  # noqa: E402
+
+SCHEMA = "speaker-policy-benchmark/1"
+
+POLICIES: Dict[str, Callable[[], SpeakerPolicy]] = {
+    "weighted": WeightedRandomPolicy,
+    "round_robin": RoundRobinPolicy,
+    "verdict_pending": VerdictPendingFirstPolicy,
+    "urgency": UrgencyAwarePolicy,
+}
+
+NAMES = ["Alice", "Bob", "Cara", "Dan", "Erin", "Femi", "Gus", "Hana", "Ivan", "Jo", "Kai", "Lena"]
+
+
+def build_debate(llm: SimulatedLLM, policy: SpeakerPolicy, seed: int, agents: int, goals: int,
+                 max_messages: int) -> ChainOfDebate:
+    debate = ChainOfDebate(
+        llm=llm,
+        debate_topic="Simulated Evaluation",
+        context_content="CANDIDATE: Simulated",
+        verdict_config=create_resume_verdict_config(),
+        goals=[Goal(f"goal_{index + 1}", "Decide") for index in range(goals)]
+    )
+    debate.turn_delay = 0
+    debate.max_messages = max_messages
+    debate.rng = random.Random(seed)
+    debate.speaker_policy = policy
+    names = [NAMES[index % len(NAMES)] + ("" if index < len(NAMES) else str(index // len(NAMES)))
+             for index in range(agents)]
+    debate.setup_agents([Persona(name, "Reviewer", "Hiring", "Decisive", "Brief") for name in names])
+    return debate
+
+
+def run_debate(policy_name: str, seed: int, agents: int = 4, goals: int = 2, max_messages: int = 80,
+               profile: Optional[SimulationProfile] = None) -> dict:
+    """Run one seeded debate under a policy and return the LLM calls spent on each completed goal."""
+    llm = SimulatedLLM(profile, seed=seed, time_scale=0)
+    debate = build_debate(llm, POLICIES[policy_name](), seed, agents, goals, max_messages)
+
+    calls_at_completion: List[int] = []
+    record_goal_outcome = debate._record_goal_outcome
+
+    def record_with_calls(goal):
+        calls_at_completion.append(llm.stats.requests)
+        return record_goal_outcome(goal)
+
+    debate._record_goal_outcome = record_with_calls
+    with contextlib.redirect_stdout(io.StringIO()):
+        asyncio.run(debate.run_debate_async())
+
+    previous = [0] + calls_at_completion[:-1]
+    return {
+        "seed": seed,
+        "calls_per_goal": [calls - before for calls, before in zip(calls_at_completion, previous)],
+        "messages_per_goal": [outcome.message_count for outcome in debate.goal_outcomes],
+        "goals_completed": len(calls_at_completion),
+        "total_calls": llm.stats.requests,
+    }
+
+
+def run_policy(policy_name: str, debates: int = 20, agents: int = 4, goals: int = 2, max_messages: int = 80,
+               profile: Optional[SimulationProfile] = None, seed: int = 0) -> dict:
+    """Run `debates` seeded debates under one policy and average the calls per completed goal."""
+    runs = [run_debate(policy_name, seed + index, agents, goals, max_messages, profile) for index in range(debates)]
+    calls = [value for run in runs for value in run["calls_per_goal"]]
+    messages = [value for run in runs for value in run["messages_per_goal"]]
+    completed = sum(run["goals_completed"] for run in runs)
+    return {
+        "policy": policy_name,
+        "debates": debates,
+        "goals_completed": completed,
+        "completion_rate": completed / (debates * goals) if debates and goals else 0.0,
+        "calls_per_goal": statistics.mean(calls) if calls else None,
+        "calls_per_goal_stdev": statistics.stdev(calls) if len(calls) > 1 else 0.0,
+        "messages_per_goal": statistics.mean(messages) if messages else None,
+        "total_calls": sum(run["total_calls"] for run in runs),
+    }
+
+
+def run_suite(policies=tuple(POLICIES), debates: int = 20, agents: int = 4, goals: int = 2, max_messages: int = 80,
+              verdict_probability: float = 0.35, decided_withdraw_probability: float = 0.6, seed: int = 0) -> dict:
+    """Run every policy over the same seeds and return the report in the SCHEMA format."""
+    profile = SimulationProfile(verdict_probability=verdict_probability,
+                                decided_withdraw_probability=decided_withdraw_probability)
+    return {
+        "schema": SCHEMA,
+        "settings": {"debates": debates, "agents": agents, "goals": goals, "max_messages": max_messages,
+                     "verdict_probability": verdict_probability,
+                     "decided_withdraw_probability": decided_withdraw_probability, "seed": seed},
+        "policies": [run_policy(name, debates, agents, goals, max_messages, profile, seed) for name in policies],
+    }
+
+
+def print_report(report: dict):
+    settings = report["settings"]
+    print(f"{settings['debates']} debates x {settings['goals']} goals, {settings['agents']} agents, "
+          f"max {settings['max_messages']} messages")
+    print(f"{'policy':<18}{'calls/goal':>12}{'stdev':>8}{'msgs/goal':>11}{'completed':>11}{'calls':>8}")
+    for result in report["policies"]:
+        calls = f"{result['calls_per_goal']:.1f}" if result["calls_per_goal"] is not None else "-"
+        messages = f"{result['messages_per_goal']:.1f}" if result["messages_per_goal"] is not None else "-"
+        print(f"{result['policy']:<18}{calls:>12}{result['calls_per_goal_stdev']:>8.1f}{messages:>11}"
+              f"{result['completion_rate']:>10.0%}{result['total_calls']:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--policies", nargs="+", choices=list(POLICIES), default=list(POLICIES))
+    parser.add_argument("--debates", type=int, default=20)
+    parser.add_argument("--agents", type=int, default=4)
+    parser.add_argument("--goals", type=int, default=2)
+    parser.add_argument("--max-messages", type=int, default=80)
+    parser.add_argument("--verdict", type=float, default=0.35, help="Chance an undecided participant decides")
+    parser.add_argument("--decided-withdraw", type=float, default=0.6,
+                        help="Chance a decided participant restates its verdict and withdraws")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    args = parser.parse_args()
+
+    report = run_suite(args.policies, args.debates, args.agents, args.goals, args.max_messages,
+                       args.verdict, args.decided_withdraw, args.seed)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.orchestrator import SCHEMA, find_regressions, run_scenario, run_suite
+
+
+pytestmark = pytest.mark.benchmark
+
+
+class TestOrchestratorOverhead:
+    """Regression gates for per-turn orchestration cost (run with `pytest -m benchmark`)."""
+
+    def test_report_format(self):
+        report = run_suite(histories=[10], agent_counts=[2], watcher_counts=[0], grid=True, turns=5)
+
+        assert report["schema"] == SCHEMA
+        scenario = report["scenarios"][0]
+        assert scenario["name"] == "history=10,agents=2,watchers=0"
+        assert scenario["peak_memory_kb"] > 0
+        for phase in ["turn", "prompt_assembly", "filtering", "response_parsing", "validation", "printing"]:
+            assert set(scenario["phases"][phase]) == {"count", "p50_us", "p99_us", "total_ms"}
+        assert json.loads(json.dumps(report)) == report
+
+    def test_turn_overhead_budget(self):
+        """A turn over a 1,000-message history stays far below LLM latency."""
+        scenario = run_scenario(history=1000, agents=6, watchers=2, turns=40, measure_memory=False)
+        assert scenario["phases"]["turn"]["p50_us"] < 5000
+
+    def test_filtering_does_not_scale_with_history(self):
+        """Once a speaker's transcript view exists, a turn only renders new messages."""
+        short = run_scenario(history=10, agents=2, watchers=0, turns=40, measure_memory=False)
+        long = run_scenario(history=2000, agents=2, watchers=0, turns=40, measure_memory=False)
+        assert long["phases"]["filtering"]["p50_us"] < 10 * max(short["phases"]["filtering"]["p50_us"], 20)
+
+    @pytest.mark.skipif(not os.getenv("BENCHMARK_BASELINE"), reason="BENCHMARK_BASELINE report not provided")
+    def test_no_regression_against_baseline(self):
+        with open(os.environ["BENCHMARK_BASELINE"], encoding="utf-8") as f:
+            baseline = json.load(f)
+        scenarios = [(s["history"], s["agents"], s["watchers"], s["turns"]) for s in baseline["scenarios"]]
+        current = {"schema": SCHEMA, "scenarios": [run_scenario(*scenario, measure_memory=False)
+                                                   for scenario in scenarios]}
+        tolerance = float(os.getenv("BENCHMARK_TOLERANCE", "2.0"))
+        assert find_regressions(baseline, current, tolerance) == []
+
+
+class TestSpeakerPolicies:
+    """Average LLM calls per goal under each speaker policy (run with `pytest -m benchmark`)."""
+
+    def test_report_format(self):
+        from benchmarks.speaker_policies import POLICIES, SCHEMA as POLICY_SCHEMA, run_suite as run_policy_suite
+        report = run_policy_suite(debates=2, agents=3, goals=2)
+
+        assert report["schema"] == POLICY_SCHEMA
+        assert [result["policy"] for result in report["policies"]] == list(POLICIES)
+        for result in report["policies"]:
+            assert result["goals_completed"] == 4 and result["calls_per_goal"] > 0
+        assert json.loads(json.dumps(report)) == report
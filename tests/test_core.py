@@ -1,7 +1,10 @@
 import pytest
+import asyncio
 import os
 import sys
-from unittest.mock import Mock, MagicMock, patch
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
 from dotenv import load_dotenv
 
 # Load environment and setup path
@@ -14,7 +17,7 @@ from agents.debate_chain import (
     DebateTimeKeeperConfig, VerdictConfig, VerdictValidityChecker,
     VerdictReasoningChecker, WithdrawalValidityChecker
 )
-from models.base import Message
+from models.base import Message, BaseModel
 from models.anthropic import AnthropicLLM
 
 
@@ -548,6 +551,1738 @@ class TestMessageHandling:
         assert message.is_whisper == False
 
 
+class ScriptedLLM(BaseModel):
+    """Async-native test model that withdraws every speaker with a fixed verdict."""
+
+    def __init__(self, verdict="GOOD_FIT", delay=0.0):
+        self.verdict = verdict
+        self.delay = delay
+        self.calls = 0
+
+    def __call__(self, speaker, messages, stop_sequences=None):
+        raise AssertionError("async path should not use the blocking call")
+
+    async def acall(self, speaker, messages, stop_sequences=None):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return Message.make(
+            content=f"<Verdict>{self.verdict}</Verdict>\n"
+                    f"<VerdictReasoning>Scripted reasoning</VerdictReasoning>\n"
+                    f"<Withdrawn>true</Withdrawn>",
+            speaker=speaker
+        )
+
+
+def fake_anthropic_response(text):
+    return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+class TestAsyncExecution:
+    """Tests for the asyncio execution path."""
+
+    @pytest.fixture
+    def personas(self):
+        return [
+            Persona(name="Alice", title="Reviewer", expertise="Hiring",
+                    personality="Decisive", speaking_style="Brief"),
+            Persona(name="Bob", title="Reviewer", expertise="Architecture",
+                    personality="Careful", speaking_style="Brief")
+        ]
+
+    def make_debate(self, llm, personas):
+        debate = ChainOfDebate(
+            llm=llm,
+            debate_topic="Async Evaluation",
+            context_content="CANDIDATE: Test",
+            verdict_config=create_resume_verdict_config(),
+            goals=[Goal("only_goal", "Decide")],
+            timekeeper_config=DebateTimeKeeperConfig(intervention_interval=10)
+        )
+        debate.turn_delay = 0
+        debate.setup_agents(personas)
+        return debate
+
+    def test_anthropic_acall_uses_async_client(self):
+        """acall sends the same request through the async client and parses the continuation."""
+        sync_client = MagicMock()
+        async_client = MagicMock()
+        async_client.messages.create = AsyncMock(return_value=fake_anthropic_response(
+            "All</SpeakingTo>\n<Content>Async hello</Content>\n"))
+        llm = AnthropicLLM(api_key="test", client=sync_client, async_client=async_client)
+
+        message = asyncio.run(llm.acall("alice", [Message.make("Hi", "bob")], stop_sequences=["</Message>"]))
+
+        assert message.speaker == "alice"
+        assert message.content == "Async hello"
+        assert not sync_client.messages.create.called
+        api_params = async_client.messages.create.call_args.kwargs
+        assert api_params["stop_sequences"] == ["</Message>"]
+        assert api_params["messages"][-1]["role"] == "assistant"
+
+    def test_debates_multiplex_on_one_loop(self, personas):
+        """Many debates run concurrently on a single event loop."""
+        llm = ScriptedLLM(delay=0.05)
+        debates = [self.make_debate(llm, personas) for _ in range(20)]
+
+        async def run_all():
+            return await asyncio.gather(*(debate.run_debate_async() for debate in debates))
+
+        all_results = asyncio.run(run_all())
+
+        assert len(all_results) == 20
+        for results in all_results:
+            assert results['completed_goals'] == ['only_goal']
+            assert results['verdicts'] == {'alice': 'GOOD_FIT', 'bob': 'GOOD_FIT'}
+        assert llm.calls == 40
+
+    def test_sync_wrapper_inside_running_loop(self, personas):
+        """run_debate() still works when called from code already running on an event loop."""
+        debate = self.make_debate(ScriptedLLM(), personas)
+
+        async def nested():
+            return debate.run_debate()
+
+        results = asyncio.run(nested())
+        assert results['completed_goals'] == ['only_goal']
+
+
+class TestPromptCaching:
+    """Tests for cache breakpoints and cache counters in AnthropicLLM."""
+
+    @staticmethod
+    def make_llm(responses, **kwargs):
+        client = MagicMock()
+        client.messages.create.side_effect = responses
+        return AnthropicLLM(api_key="test", client=client, async_client=MagicMock(), **kwargs), client
+
+    @staticmethod
+    def response_with_usage(cache_read, cache_creation):
+        response = fake_anthropic_response("All</SpeakingTo>\n<Content>Hi</Content>\n")
+        response.usage = SimpleNamespace(input_tokens=50, cache_read_input_tokens=cache_read,
+                                         cache_creation_input_tokens=cache_creation)
+        return response
+
+    def conversation(self):
+        return [
+            Message.make("You are Alice.", "system"),
+            Message.make("Opening statement", "bob"),
+            Message.make("My reply", "alice"),
+            Message.make("Follow-up question", "bob"),
+        ]
+
+    def test_request_has_cache_breakpoints(self):
+        llm, client = self.make_llm([self.response_with_usage(0, 1200)])
+        llm("alice", self.conversation(), stop_sequences=["</Message>"])
+
+        api_params = client.messages.create.call_args.kwargs
+        system_blocks = api_params["system"]
+        assert [block["cache_control"] for block in system_blocks] == [{"type": "ephemeral"}] * 2
+        assert system_blocks[0]["text"] == "You are Alice."
+        assert "RESPONSE SCAFFOLDING EXAMPLES" in system_blocks[1]["text"]
+
+        stable, prefill = api_params["messages"][-2], api_params["messages"][-1]
+        assert stable["content"][-1]["cache_control"] == {"type": "ephemeral"}
+        assert "Follow-up question" in stable["content"][-1]["text"]
+        assert isinstance(prefill["content"], str) and prefill["role"] == "assistant"
+
+    def test_cache_counters(self):
+        llm, _ = self.make_llm([self.response_with_usage(0, 1200), self.response_with_usage(1200, 0)])
+        llm("alice", self.conversation())
+        llm("alice", self.conversation())
+
+        assert llm.cache_stats.requests == 2
+        assert llm.cache_stats.misses == 1
+        assert llm.cache_stats.hits == 1
+        assert llm.cache_stats.cache_read_input_tokens == 1200
+        assert llm.cache_stats.hit_rate == 0.5
+
+        llm.reset_cache_stats()
+        assert llm.cache_stats.requests == 0
+
+    def test_cache_can_be_disabled(self):
+        llm, client = self.make_llm([self.response_with_usage(0, 0)], enable_prompt_cache=False)
+        llm("alice", self.conversation())
+
+        api_params = client.messages.create.call_args.kwargs
+        assert isinstance(api_params["system"], str)
+        assert all(isinstance(m["content"], str) for m in api_params["messages"])
+
+
+class TestIncrementalTranscript:
+    """Tests for per-viewer incremental transcript rendering."""
+
+    @staticmethod
+    def make_llm():
+        llm = AnthropicLLM(api_key="test", client=MagicMock(), async_client=MagicMock())
+        llm._create_temp_scaffolding = lambda speaker: f"<Message><Speaker>{speaker}</Speaker>\n<SpeakingTo>"
+        return llm
+
+    @staticmethod
+    def reference_format(llm, messages, speaker):
+        visible = llm._filter_messages_for_speaker(messages, speaker)
+        return llm._ensure_alternating_roles(llm._format_messages_for_anthropic(visible, speaker))
+
+    def test_matches_reference_formatting(self):
+        """Incremental output is byte-identical to full re-rendering across appends, whispers and edits."""
+        import random
+        rng = random.Random(7)
+        speakers = ["alice", "bob", "carol", "coordinator"]
+        llm = self.make_llm()
+        messages = []
+
+        for turn in range(120):
+            speaker = rng.choice(speakers)
+            target = rng.choice(speakers)
+            messages.append(Message.make(f"turn {turn} <Verdict>GOOD_FIT</Verdict>", speaker,
+                                         speaking_to=target, is_whisper=rng.random() < 0.3,
+                                         thoughts=f"thought {turn}"))
+            if turn % 17 == 0:
+                # Simulate goal-transition cleanup mutating older messages
+                for message in messages[::3]:
+                    message.content = message.content.replace("<Verdict>GOOD_FIT</Verdict>", "")
+            if turn % 29 == 0:
+                messages.insert(rng.randrange(len(messages)), Message.make("injected", "coordinator"))
+
+            for viewer in ["alice", "bob", "carol"]:
+                assert llm._format_messages_incremental(messages, viewer) == \
+                       self.reference_format(llm, messages, viewer)
+
+    def test_only_new_messages_are_rendered(self):
+        llm = self.make_llm()
+        messages = [Message.make(f"m{i}", "bob" if i % 2 else "alice") for i in range(50)]
+        llm._format_messages_incremental(messages, "alice")
+        view = llm._transcript_views.get("alice", messages)
+        assert view.renders == 50
+
+        messages.append(Message.make("new", "bob"))
+        llm._format_messages_incremental(messages, "alice")
+        assert view.renders == 51
+
+        messages[10].content = "edited"
+        llm._format_messages_incremental(messages, "alice")
+        assert view.renders == 52
+
+    def test_message_revision_tracks_rendered_fields(self):
+        message = Message.make("hello", "alice")
+        assert message.revision == 0
+        message.content = "changed"
+        message.is_whisper = True
+        assert message.revision == 2
+
+
+class TestScaffoldingParser:
+    """Tests for the single-pass scaffolding parser shared by Message, validators and field parsers."""
+
+    TAGS = ["Speaker", "SpeakingTo", "Whisper", "Content", "PrivateThoughts", "PrivatePredictions",
+            "Verdict", "VerdictReasoning", "Withdrawn", "GoalAchieved"]
+    WORDS = ["GOOD_FIT", "REJECT", " true ", "false", "All", "bob", "x < y", "\n", "  ", "MAYBE", "<b>"]
+
+    def random_response(self, rng):
+        parts = [f'<Message id="m{rng.randrange(9)}" timestamp="t{rng.randrange(9)}">'] if rng.random() < 0.8 else []
+        for _ in range(rng.randrange(1, 25)):
+            roll = rng.random()
+            tag = rng.choice(self.TAGS)
+            if roll < 0.35:
+                parts.append(f"<{tag}>")
+            elif roll < 0.7:
+                parts.append(f"</{tag}>")
+            else:
+                parts.append(rng.choice(self.WORDS))
+        return "".join(parts)
+
+    def test_matches_legacy_regex_path(self):
+        """The single pass reproduces every field of the previous per-field regex searches."""
+        import random
+        from benchmarks.scaffolding_parser import legacy_parse_from_response, legacy_message_fields, \
+            current_message_fields
+        rng = random.Random(1234)
+        options = ["GOOD_FIT", "REJECT"]
+
+        for _ in range(3000):
+            text = self.random_response(rng)
+            message = Message.parse_from_response(text)
+            legacy = legacy_parse_from_response(text)
+            for name in ["speaker", "speaking_to", "is_whisper", "content", "thoughts", "private_predictions"]:
+                assert getattr(message, name) == legacy[name], (name, text)
+
+            has_verdict = rng.random() < 0.5
+            assert current_message_fields(message, options, has_verdict) == \
+                   legacy_message_fields(message.to_prompt(), options, has_verdict), text
+
+            # The cache seeded from the raw response equals a fresh parse of the rendered message
+            fresh = Message(message.id, message.content, message.speaker, message.timestamp, [],
+                            message.speaking_to, message.is_whisper)
+            assert current_message_fields(message, options, has_verdict) == \
+                   current_message_fields(fresh, options, has_verdict), text
+
+    def test_parsed_cache_invalidated_on_mutation(self):
+        message = Message.make("<Verdict>GOOD_FIT</Verdict>", "alice")
+        assert message.parsed.verdict == "GOOD_FIT"
+        assert message.parsed is message.parsed
+
+        message.content = "<Verdict>REJECT</Verdict><Withdrawn>true</Withdrawn>"
+        assert message.parsed.verdict == "REJECT"
+        assert message.parsed.is_withdrawing
+
+    def test_goal_achieved_and_verdict_option(self):
+        from models.scaffolding import parse_scaffolding
+        parsed = parse_scaffolding("<Verdict>MAYBE</Verdict> <Verdict> REJECT </Verdict>"
+                                   "<GoalAchieved> first </GoalAchieved><GoalAchieved>second</GoalAchieved>")
+        assert parsed.verdict == "MAYBE"
+        assert parsed.verdict_option(["GOOD_FIT", "REJECT"]) == "REJECT"
+        assert parsed.goals_achieved == ["first", "second"]
+
+
+class FakeStream:
+    """Async context manager mimicking client.messages.stream() over scripted text chunks."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.consumed = 0
+        self.closed = False
+        self.current_message_snapshot = SimpleNamespace(
+            usage=SimpleNamespace(input_tokens=10, cache_read_input_tokens=0, cache_creation_input_tokens=0))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+    @property
+    async def text_stream(self):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+
+class TestStreaming:
+    """Tests for streaming generation with incremental parsing."""
+
+    @staticmethod
+    def make_llm(chunks):
+        stream = FakeStream(chunks)
+        async_client = MagicMock()
+        async_client.messages.stream.return_value = stream
+        return AnthropicLLM(api_key="test", client=MagicMock(), async_client=async_client), stream
+
+    def test_incremental_parse_matches_single_pass(self):
+        """Feeding a response in arbitrary chunks resolves the same fields as parsing it at once."""
+        import random
+        from models.scaffolding import StreamingScaffoldingParser, parse_scaffolding
+        rng = random.Random(99)
+        generator = TestScaffoldingParser()
+
+        for _ in range(1000):
+            text = generator.random_response(rng)
+            parser = StreamingScaffoldingParser()
+            position = 0
+            while position < len(text):
+                step = rng.randrange(1, 12)
+                parser.feed(text[position:position + step])
+                position += step
+            assert parser.parsed == parse_scaffolding(text), text
+
+    def test_fields_stream_early_and_generation_stops_after_content(self):
+        llm, stream = self.make_llm(["All</Speak", "ingTo>\n<Content>Hello ", "world</Content>\n",
+                                     "<PrivateThoughts>never generated</PrivateThoughts>"])
+        events = []
+
+        message = asyncio.run(llm.astream("alice", [Message.make("Hi", "bob")], ["</Message>"],
+                                          on_event=events.append))
+
+        assert message.content == "Hello world"
+        assert message.speaking_to == "All"
+        assert stream.consumed == 3 and stream.closed
+        assert llm.cache_stats.requests == 1
+
+        kinds = [(event.kind, event.field) for event in events]
+        assert kinds.index(("field", "speaking_to")) < kinds.index(("content", None))
+        assert "".join(event.value for event in events if event.kind == "content") == "Hello world"
+        assert events[-1].kind == "complete" and events[-1].value is message
+
+    def test_violation_aborts_generation(self):
+        config = create_resume_verdict_config()
+        llm, stream = self.make_llm(["All</SpeakingTo>\n<Content>I pick <Verdict>MAYBE</Verdict>",
+                                     " and keep talking", "</Content>\n"])
+        events = []
+
+        def should_abort(parsed):
+            return not VerdictValidityChecker().check_partial(parsed, config, None).is_valid
+
+        message = asyncio.run(llm.astream("alice", [Message.make("Hi", "bob")], ["</Message>"],
+                                          on_event=events.append, should_abort=should_abort))
+
+        assert stream.consumed == 1
+        assert "abort" in [event.kind for event in events]
+        assert message.content == "I pick <Verdict>MAYBE</Verdict>"
+        assert not VerdictValidityChecker().check(message, config, None).is_valid
+
+    def test_orchestrator_streams_through_default_astream(self):
+        """Models without native streaming still deliver the event sequence to the listener."""
+        debate = TestAsyncExecution().make_debate(ScriptedLLM(), [
+            Persona(name="Alice", title="Reviewer", expertise="Hiring",
+                    personality="Decisive", speaking_style="Brief")])
+        events = []
+        debate.stream_responses = True
+        debate.stream_listener = events.append
+
+        results = debate.run_debate()
+
+        assert results['verdicts'] == {'alice': 'GOOD_FIT'}
+        assert [event.kind for event in events][-2:] == ["content", "complete"]
+        assert {event.speaker for event in events} == {"alice"}
+
+
+class TestCassette:
+    """Tests for the record/replay backends."""
+
+    @staticmethod
+    def conversation():
+        # Fresh ids and timestamps on every call, as in a new run
+        return [Message.make("You are Alice.", "system"), Message.make("Opening statement", "bob")]
+
+    def record(self, path, texts):
+        from models.cassette import RecordingLLM
+        client = MagicMock()
+        responses = [fake_anthropic_response(text) for text in texts]
+        for response in responses:
+            response.usage = SimpleNamespace(input_tokens=40, output_tokens=5, cache_read_input_tokens=0,
+                                             cache_creation_input_tokens=0)
+        client.messages.create.side_effect = responses
+        llm = RecordingLLM(path, api_key="test", client=client, async_client=MagicMock())
+        return [llm("alice", self.conversation(), ["</Message>"]) for _ in texts]
+
+    def test_replay_matches_recording(self, tmp_path):
+        from models.cassette import ReplayLLM
+        path = str(tmp_path / "run.jsonl.gz")
+        recorded = self.record(path, ["All</SpeakingTo>\n<Content>First</Content>\n",
+                                      "bob</SpeakingTo>\n<Content>Second</Content>\n"])
+
+        replay = ReplayLLM(path)
+        replayed = [replay("alice", self.conversation(), ["</Message>"]),
+                    asyncio.run(replay.acall("alice", self.conversation(), ["</Message>"]))]
+
+        assert [m.content for m in replayed] == [m.content for m in recorded] == ["First", "Second"]
+        assert replayed[1].speaking_to == "bob"
+        assert replay.cache_stats.requests == 2 and replay.cache_stats.input_tokens == 80
+
+    def test_unrecorded_request_misses(self, tmp_path):
+        from models.cassette import ReplayLLM
+        path = str(tmp_path / "run.jsonl")
+        self.record(path, ["All</SpeakingTo>\n<Content>Only once</Content>\n"])
+        replay = ReplayLLM(path)
+        replay("alice", self.conversation(), ["</Message>"])
+
+        with pytest.raises(RuntimeError, match="No recorded create response"):
+            replay("alice", self.conversation(), ["</Message>"])
+        with pytest.raises(RuntimeError, match="No recorded create response"):
+            replay("bob", self.conversation(), ["</Message>"])
+
+    def test_stream_record_and_replay(self, tmp_path):
+        from models.cassette import RecordingLLM, ReplayLLM
+        path = str(tmp_path / "stream.jsonl")
+        stream = FakeStream(["All</SpeakingTo>\n<Content>Streamed", " text</Content>\n", "<Whisper>x"])
+        async_client = MagicMock()
+        async_client.messages.stream.return_value = stream
+        recorder = RecordingLLM(path, api_key="test", client=MagicMock(), async_client=async_client)
+        recorded = asyncio.run(recorder.astream("alice", self.conversation(), ["</Message>"]))
+
+        events = []
+        replayed = asyncio.run(ReplayLLM(path).astream("alice", self.conversation(), ["</Message>"],
+                                                      on_event=events.append))
+
+        assert replayed.content == recorded.content == "Streamed text"
+        assert "".join(e.value for e in events if e.kind == "content") == "Streamed text"
+
+
+class TestSimulatedLLM:
+    """Tests for the synthetic latency-modelled backend."""
+
+    @staticmethod
+    def make_debate(llm, seed):
+        import random
+        debate = ChainOfDebate(
+            llm=llm,
+            debate_topic="Simulated Evaluation",
+            context_content="CANDIDATE: Test",
+            verdict_config=create_resume_verdict_config(),
+            goals=[Goal("first", "Decide"), Goal("second", "Decide again")]
+        )
+        debate.turn_delay = 0
+        debate.max_messages = 40
+        debate.rng = random.Random(seed)
+        debate.setup_agents([Persona(name, "Reviewer", "Hiring", "Decisive", "Brief")
+                             for name in ["Alice", "Bob", "Cara"]])
+        return debate
+
+    @staticmethod
+    def without_seconds(results):
+        """Debate results without the goals' wall-clock times, the one part seeded runs do not reproduce."""
+        return dict(results, goal_outcomes=[{key: value for key, value in outcome.items() if key != "seconds"}
+                                            for outcome in results["goal_outcomes"]])
+
+    def run_many(self, seed, profile=None):
+        from models.simulated import SimulatedLLM
+        llm = SimulatedLLM(profile, seed=seed, time_scale=0)
+        debates = [self.make_debate(llm, seed * 100 + i) for i in range(10)]
+
+        async def run_all():
+            return await asyncio.gather(*(debate.run_debate_async() for debate in debates))
+
+        results = asyncio.run(run_all())
+        transcripts = [[(m.speaker, m.speaking_to, m.is_whisper, m.content) for m in d.messages] for d in debates]
+        return llm, results, transcripts
+
+    def test_seeded_runs_are_reproducible(self):
+        first_llm, first_results, first_transcripts = self.run_many(5)
+        _, second_results, second_transcripts = self.run_many(5)
+        _, _, other_transcripts = self.run_many(6)
+
+        assert first_transcripts == second_transcripts
+        assert list(map(self.without_seconds, first_results)) == list(map(self.without_seconds, second_results))
+        assert first_transcripts != other_transcripts
+        assert first_llm.stats.requests > 0 and first_llm.stats.verdicts > 0
+
+    def test_well_formed_profile_produces_valid_messages(self):
+        from models.simulated import SimulationProfile
+        profile = SimulationProfile(malformed_probability=0.0, verdict_weights={"GOOD_FIT": 1.0})
+        _, results, _ = self.run_many(1, profile)
+
+        for result in results:
+            assert result['rejections'] == 0
+            assert set(result['verdicts'].values()) <= {"GOOD_FIT", None}
+
+    def test_malformed_output_and_rate_limits(self):
+        from models.simulated import SimulatedLLM, SimulationProfile
+        config = create_resume_verdict_config()
+        conversation = [Message.make(TestSimulatedLLM.make_debate(None, 0).get_agent_system_prompt("alice"),
+                                     "system"), Message.make("Opening statement", "bob")]
+
+        malformed = SimulatedLLM(SimulationProfile(malformed_probability=1.0,
+                                                   malformed_weights={"invalid_verdict": 1.0}), time_scale=0)
+        message = malformed("alice", conversation, ["</Message>"])
+        assert not VerdictValidityChecker().check(message, config, None).is_valid
+
+        limited = SimulatedLLM(SimulationProfile(rate_limit_probability=1.0), time_scale=0)
+        with pytest.raises(RuntimeError, match="Simulated rate limit"):
+            limited("alice", conversation, ["</Message>"])
+        # Every attempt allowed by the retry policy was throttled
+        assert limited.stats.rate_limited == limited.retry_policy.max_attempts
+
+
+class TestMetrics:
+    """Tests for per-phase tracing, counters and exporters."""
+
+    @staticmethod
+    def run_traced(tracer=None, seed=3):
+        from models.simulated import SimulatedLLM, SimulationProfile
+        llm = SimulatedLLM(SimulationProfile(malformed_probability=0.0), seed=seed, time_scale=0)
+        debate = TestSimulatedLLM.make_debate(llm, seed)
+        debate.max_messages = 12
+        debate.tracer = tracer
+        result = debate.run_debate()
+        return debate, result
+
+    def test_disabled_tracer_records_nothing(self):
+        from telemetry.tracing import NULL_TRACER, current_tracer
+        debate, _ = self.run_traced()
+        assert current_tracer() is NULL_TRACER
+        assert not NULL_TRACER.enabled
+        with NULL_TRACER.span("anything") as span:
+            span.set_attribute("ignored", 1)
+
+    def test_turn_phases_and_counters(self):
+        from telemetry.tracing import MetricsTracer
+        tracer = MetricsTracer()
+        debate, result = self.run_traced(tracer)
+
+        turns = [span for span in tracer.spans if span.name == "turn"]
+        conversation = [span for span in tracer.spans if span.name == "conversation"]
+        assert len(conversation) == 1
+        assert len(turns) == tracer.phases["turn"].count > 0
+        assert all(span.parent_id == conversation[0].span_id for span in turns)
+        assert all(span.trace_id == conversation[0].trace_id for span in tracer.spans)
+        for phase in ("system_prompt", "generate", "prompt_assembly", "api", "parse_response", "validation",
+                      "watchers", "next_speaker"):
+            assert tracer.phases[phase].count > 0, phase
+
+        spoken = sum(value for (name, _), value in tracer.counters.items() if name == "turns")
+        assert spoken == tracer.phases["print"].count == len(debate.messages)
+        assert tracer.counter("turns", speaker="coordinator") > 0
+        output_tokens = sum(value for (name, labels), value in tracer.counters.items()
+                            if name == "tokens" and ("kind", "output_tokens") in labels)
+        assert output_tokens > 0
+        assert all(message.usage is None or message.usage["output_tokens"] > 0 for message in debate.messages)
+
+    def test_nested_debate_inherits_tracer(self):
+        from agents.agent_system import run_coroutine_sync
+        from telemetry.tracing import MetricsTracer, reset_tracer, use_tracer
+        tracer = MetricsTracer()
+        token = use_tracer(tracer)
+        try:
+            async def outer():
+                with tracer.span("watcher", watcher="meta"):
+                    # A blocking nested run from inside a running loop, as watchers do
+                    return run_coroutine_sync(asyncio.sleep(0, result=self.run_traced()))
+            asyncio.run(outer())
+        finally:
+            reset_tracer(token)
+
+        watcher = next(span for span in tracer.spans if span.name == "watcher")
+        conversation = next(span for span in tracer.spans if span.name == "conversation")
+        assert conversation.parent_id == watcher.span_id
+        assert conversation.trace_id == watcher.trace_id
+
+    def test_exporters(self, tmp_path):
+        import json
+        from telemetry.exporters import otel_span_dict, prometheus_text, write_jsonl, write_prometheus
+        from telemetry.tracing import MetricsTracer
+        tracer = MetricsTracer()
+        with tracer.span("turn", speaker="alice"):
+            with tracer.span("validation"):
+                pass
+        tracer.count("rejections", speaker='al"ice')
+        tracer.count("tokens", 42, speaker="alice", kind="output_tokens")
+
+        text = prometheus_text(tracer)
+        assert 'debate_phase_seconds_count{phase="turn"} 1' in text
+        assert 'debate_rejections_total{speaker="al\\"ice"} 1' in text
+        assert 'debate_tokens_total{kind="output_tokens",speaker="alice"} 42' in text
+        write_prometheus(tracer, str(tmp_path / "debate.prom"))
+        assert (tmp_path / "debate.prom").read_text() == text
+
+        turn = next(span for span in tracer.spans if span.name == "turn")
+        exported = otel_span_dict(turn)
+        assert exported["context"]["span_id"] == f"0x{turn.span_id:016x}"
+        assert exported["parent_id"] is None and exported["attributes"] == {"speaker": "alice"}
+
+        write_jsonl(tracer, str(tmp_path / "spans.jsonl"))
+        records = [json.loads(line) for line in (tmp_path / "spans.jsonl").read_text().splitlines()]
+        assert [r["type"] for r in records].count("span") == 2
+        assert {"type": "counter", "name": "tokens", "labels": {"kind": "output_tokens", "speaker": "alice"},
+                "value": 42} in records
+
+
+class TestDebateRunner:
+    """Tests for concurrent debate scheduling and the shared rate limiter."""
+
+    def test_runs_jobs_concurrently_with_isolation(self):
+        from agents.runner import DebateRunner
+        from models.simulated import SimulatedLLM, SimulationProfile
+        fast = SimulatedLLM(SimulationProfile(malformed_probability=0.0), seed=1, time_scale=0)
+        slow = SimulatedLLM(SimulationProfile(first_token_latency=5.0, latency_sigma=0.0), time_scale=1)
+
+        def build(job):
+            if job == "broken":
+                raise ValueError("unreadable document")
+            debate = TestSimulatedLLM.make_debate(slow if job == "slow" else fast, 0)
+            debate.max_messages = 8
+            return debate
+
+        jobs = {f"doc{i}": "ok" for i in range(6)}
+        jobs.update(broken="broken", slow="slow")
+        runner = DebateRunner(build, max_concurrency=3, timeout=1.0)
+
+        async def collect():
+            return [outcome async for outcome in runner.run(jobs)]
+
+        outcomes = {outcome.job_id: outcome for outcome in asyncio.run(collect())}
+        assert set(outcomes) == set(jobs)
+        assert all(outcomes[f"doc{i}"].ok and outcomes[f"doc{i}"].result["message_count"] > 0 for i in range(6))
+        assert "unreadable document" in outcomes["broken"].error
+        assert outcomes["slow"].timed_out and not outcomes["slow"].ok
+        assert runner.stats.completed == 6 and runner.stats.failed == 1 and runner.stats.timed_out == 1
+        assert runner.stats.peak_concurrency == 3
+
+        ordered = DebateRunner(build, max_concurrency=4).run_all(["ok", "broken", "ok"])
+        assert [outcome.job_id for outcome in ordered] == [0, 1, 2]
+        assert [outcome.ok for outcome in ordered] == [True, False, True]
+
+    def test_rate_limiter_buckets(self):
+        from models.rate_limit import RateLimiter
+        limiter = RateLimiter(requests_per_minute=2, tokens_per_minute=600)
+        assert limiter.reserve(100) == 0
+        assert limiter.reserve(100) == 0
+        assert limiter.reserve(100) == pytest.approx(30, abs=0.1)
+
+        limiter = RateLimiter(tokens_per_minute=600)
+        assert limiter.reserve(900) == pytest.approx(30, abs=0.1)
+        limiter.settle(900, 300)
+        assert limiter.reserve(0) == 0
+
+    def test_model_reserves_and_settles_tokens(self):
+        from models.rate_limit import RateLimiter
+        from models.simulated import SimulatedLLM
+        limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=1_000_000)
+        limiter.tokens.rate = limiter.requests.rate = 0  # freeze refills so spending is exact
+        llm = SimulatedLLM(seed=2, time_scale=0, rate_limiter=limiter)
+        message = llm("alice", [Message.make("Opening statement", "bob")], ["</Message>"])
+
+        spent = limiter.tokens.capacity - limiter.tokens.level
+        assert spent == pytest.approx(sum(message.usage.values()), abs=1)
+        assert limiter.requests.capacity - limiter.requests.level == 1
+
+    def test_response_without_usage_settles_reservation(self):
+        from models.rate_limit import RateLimiter
+        limiter = RateLimiter(tokens_per_minute=1_000_000)
+        limiter.tokens.rate = 0
+        llm = AnthropicLLM(api_key="test", client=Mock(), async_client=Mock(), rate_limiter=limiter)
+        llm._create = Mock(return_value=fake_anthropic_response(" All</SpeakingTo><Content>Ready.</Content></Message>"))
+        for _ in range(3):
+            assert llm("alice", [Message.make("Opening statement " * 50, "bob")]).content == "Ready."
+        # Nothing was reported spent, so no reservation is left holding capacity
+        assert limiter.tokens.level == limiter.tokens.capacity
+
+
+class TestRetry:
+    """Tests for backoff, retry-after handling and 429-aware scheduling."""
+
+    @staticmethod
+    def status_error(cls, status, headers=None):
+        import httpx
+        response = httpx.Response(status, headers=headers or {},
+                                  request=httpx.Request("POST", "https://api.anthropic.com/v1/messages"))
+        return cls("error", response=response, body=None)
+
+    def test_backoff_and_retry_after(self):
+        import anthropic
+        from models.rate_limit import RetryPolicy, is_retryable, retry_after_seconds
+        policy = RetryPolicy(base_delay=1.0, max_delay=10.0)
+        assert all(0 <= policy.delay(3) <= 8.0 for _ in range(50))
+        assert all(policy.delay(10) <= 10.0 for _ in range(50))
+        assert all(2.0 <= policy.delay(0, retry_after=2.0) <= 2.2 for _ in range(50))
+
+        throttled = self.status_error(anthropic.RateLimitError, 429, {"retry-after": "3"})
+        assert retry_after_seconds(throttled) == 3.0
+        assert retry_after_seconds(self.status_error(anthropic.RateLimitError, 429, {"retry-after-ms": "250"})) == 0.25
+        assert is_retryable(throttled)
+        assert is_retryable(self.status_error(anthropic.InternalServerError, 529))
+        assert not is_retryable(self.status_error(anthropic.BadRequestError, 400))
+
+    def test_transient_errors_are_retried(self):
+        import anthropic
+        from telemetry.tracing import MetricsTracer, reset_tracer, use_tracer
+        llm = AnthropicLLM(api_key="test", client=Mock(), async_client=Mock())
+        llm._sleep = Mock()
+        failures = [self.status_error(anthropic.InternalServerError, 529),
+                    self.status_error(anthropic.RateLimitError, 429, {"retry-after": "2"})]
+
+        def create(api_params):
+            if failures:
+                raise failures.pop(0)
+            return fake_anthropic_response(" All</SpeakingTo><Content>Ready.</Content></Message>")
+
+        llm._create = create
+        tracer = MetricsTracer()
+        token = use_tracer(tracer)
+        try:
+            message = llm("alice", [Message.make("Hi", "bob")])
+        finally:
+            reset_tracer(token)
+        assert message.content == "Ready."
+        assert llm._sleep.call_count == 2
+        assert 2.0 <= llm._sleep.call_args_list[1].args[0] <= 2.2
+        assert tracer.counter("retries", model=llm.model, error="RateLimitError") == 1
+
+        llm._create = Mock(side_effect=self.status_error(anthropic.BadRequestError, 400))
+        with pytest.raises(RuntimeError):
+            llm("alice", [Message.make("Hi", "bob")])
+        assert llm._create.call_count == 1
+
+    def test_rate_limits_pause_the_shared_limiter(self):
+        from models.rate_limit import shared_rate_limiter
+        from models.simulated import SimulatedLLM, SimulationProfile
+        limiter = shared_rate_limiter("test-pause", requests_per_minute=10_000)
+        assert shared_rate_limiter("test-pause") is limiter
+        profile = SimulationProfile(rate_limit_probability=0.5, rate_limit_retry_after=0.05)
+        llms = [SimulatedLLM(profile, seed=seed, time_scale=0, rate_limiter=limiter) for seed in range(4)]
+
+        async def run_all():
+            return await asyncio.gather(*(llm.acall("alice", [Message.make(f"Topic {i}", "bob")], ["</Message>"])
+                                          for i, llm in enumerate(llms)))
+
+        messages = asyncio.run(run_all())
+        assert all(message.content for message in messages)
+        throttled = sum(llm.stats.rate_limited for llm in llms)
+        assert throttled > 0
+        assert limiter.stats.throttled == limiter.stats.retries == throttled
+        assert limiter.stats.requests == 4 + throttled
+        assert limiter.stats.max_wait > 0 and limiter.stats.wait_percentile(100) == limiter.stats.max_wait
+
+
+class SimulatedCrash(BaseException):
+    """Stands in for a process dying mid-debate (not caught by the turn loop)."""
+
+
+class TestJournal:
+    """Tests for journaled debates and resuming them."""
+
+    @staticmethod
+    def make_debate(crash_after=None):
+        from models.simulated import SimulatedLLM, SimulationProfile
+        from watchers.scheduled import ScheduledMessage
+
+        class CrashingLLM(SimulatedLLM):
+            async def _acreate(self, api_params):
+                if crash_after is not None and self.stats.requests >= crash_after:
+                    raise SimulatedCrash()
+                return await super()._acreate(api_params)
+
+        llm = CrashingLLM(SimulationProfile(malformed_probability=0.1, withdraw_probability=0.5,
+                                            verdict_probability=0.5), seed=11, time_scale=0)
+        debate = TestSimulatedLLM.make_debate(llm, 4)
+        debate.max_messages = 40
+        debate.watchers.append(ScheduledMessage("Halfway there.", lambda speaker, api: api.debate_messages_count() >= 10))
+        return debate
+
+    @staticmethod
+    def transcript(debate):
+        return [(m.speaker, m.speaking_to, m.is_whisper, m.content) for m in debate.messages]
+
+    def test_resume_continues_without_repeating_calls(self, tmp_path):
+        reference = self.make_debate()
+        reference_result = reference.run_debate()
+        total_calls = reference.llm.stats.requests
+        assert total_calls > 10 and len(reference.completed_goals) >= 1
+
+        path = str(tmp_path / "debate.journal")
+        crashed = self.make_debate(crash_after=10)
+        with pytest.raises(SimulatedCrash):
+            crashed.resume(path)
+
+        resumed = self.make_debate()
+        result = resumed.resume(path)
+        assert self.transcript(resumed) == self.transcript(reference)
+        without_seconds = TestSimulatedLLM.without_seconds
+        assert without_seconds(result) == without_seconds(reference_result)
+        assert resumed.llm.stats.requests == total_calls - 10
+        assert resumed.watchers[0]._finished
+
+        # A finished debate resumes to the same result without any new calls
+        finished = self.make_debate()
+        assert without_seconds(finished.resume(path)) == without_seconds(reference_result)
+        assert finished.llm.stats.requests == 0
+
+    def test_budget_spend_survives_resume(self, tmp_path):
+        from agents.budget import DebateBudget
+        reference = self.make_debate()
+        reference.budget = DebateBudget(max_tokens=10 ** 9)
+        reference.run_debate()
+
+        path = str(tmp_path / "debate.journal")
+        crashed = self.make_debate(crash_after=10)
+        crashed.budget = DebateBudget(max_tokens=10 ** 9)
+        with pytest.raises(SimulatedCrash):
+            crashed.resume(path)
+
+        resumed = self.make_debate()
+        resumed.budget = DebateBudget(max_tokens=10 ** 9)
+        resumed.resume(path)
+        spend = lambda budget: (budget.tokens_used, budget.input_tokens_used, budget.output_tokens_used,
+                                budget.cost, budget.calls)
+        assert spend(resumed.budget) == spend(reference.budget)
+        assert resumed.budget.calls == reference.llm.stats.requests > resumed.llm.stats.requests
+        # The clock continues from the original start rather than restarting at the resume
+        assert resumed.budget.started_at == crashed.budget.started_at
+
+        running = DebateBudget(max_seconds=60)
+        running.start()
+        running.started -= 30
+        restored = DebateBudget(max_seconds=60)
+        restored.load_state_dict(json.loads(json.dumps(running.state_dict())))
+        restored.start()  # a resumed run does not restart the clock
+        assert 30 <= restored.elapsed < 31 and restored.remaining() == pytest.approx(0.5, abs=0.02)
+
+    def test_torn_record_and_foreign_journal(self, tmp_path):
+        from agents.journal import DebateJournal
+        path = tmp_path / "debate.journal"
+        crashed = self.make_debate(crash_after=6)
+        with pytest.raises(SimulatedCrash):
+            crashed.resume(str(path))
+        complete = path.read_bytes()
+        with open(path, "ab") as f:
+            f.write(b'{"type":"checkpoint","next_sp')
+
+        resumed = self.make_debate(crash_after=8)
+        with pytest.raises(SimulatedCrash):
+            resumed.resume(str(path))
+        assert path.read_bytes().startswith(complete)
+        assert len(DebateJournal(str(path)).load()[0]) == len(resumed.messages)
+
+        fresh = self.make_debate()
+        fresh.journal = DebateJournal(str(path))
+        with pytest.raises(ValueError, match="already holds a debate"):
+            fresh.run_debate()
+
+
+class TestHistoryCompaction:
+    """Tests for rolling per-viewer summaries of old history."""
+
+    @staticmethod
+    def history(count):
+        messages = []
+        for i in range(count):
+            if i % 7 == 3:
+                messages.append(Message.make(f"Secret {i}. Only for Bob.", "cara", speaking_to="bob", is_whisper=True))
+            else:
+                messages.append(Message.make(f"Point {i}. More detail.", ["alice", "bob", "cara"][i % 3]))
+        return messages
+
+    def test_summaries_are_built_in_background_per_viewer(self):
+        from agents.compaction import ExtractiveSummarizer, HistoryCompactor
+        compactor = HistoryCompactor(ExtractiveSummarizer(), keep_recent=10, block_size=5)
+        messages = self.history(37)
+
+        async def scenario():
+            # Nothing is summarized yet: the turn gets the full history instead of waiting
+            assert compactor.compact("alice", messages) == messages
+            compactor.compact("bob", messages)
+            await compactor.wait()
+            return compactor.compact("alice", messages), compactor.compact("bob", messages)
+
+        alice, bob = asyncio.run(scenario())
+        assert alice[1:] == messages[25:] and bob[1:] == messages[25:]
+        assert "Point 0." in alice[0].content and "Point 23." in alice[0].content
+        assert "Secret 3." in bob[0].content
+        assert "Secret" not in alice[0].content
+        assert compactor.stats.summaries == 2 and compactor.stats.messages_summarized == 50
+
+    def test_edits_to_summarized_messages_reset_the_summary(self):
+        from agents.compaction import ExtractiveSummarizer, HistoryCompactor
+        compactor = HistoryCompactor(ExtractiveSummarizer(), keep_recent=4, block_size=4)
+        messages = self.history(12)
+
+        async def scenario():
+            compactor.compact("alice", messages)
+            await compactor.wait()
+            assert "Point 1." in compactor.compact("alice", messages)[0].content
+            messages[1].content = "Rewritten."
+            assert compactor.compact("alice", messages) == messages
+            await compactor.wait()
+            return compactor.compact("alice", messages)
+
+        compacted = asyncio.run(scenario())
+        assert "Rewritten." in compacted[0].content and "Point 1." not in compacted[0].content
+        assert compactor.stats.resets == 1
+
+    def test_turns_only_revisit_changed_viewers(self):
+        from agents.compaction import ExtractiveSummarizer, HistoryCompactor
+        compactor = HistoryCompactor(ExtractiveSummarizer(), keep_recent=4, block_size=4)
+        messages = self.history(12)
+        viewers = ["alice", "bob", "cara"]
+        scheduled = []
+        schedule = compactor._schedule
+        compactor._schedule = lambda viewer, *args: scheduled.append(viewer) or schedule(viewer, *args)
+
+        async def scenario():
+            for viewer in viewers:
+                compactor.compact(viewer, messages)
+            await compactor.wait()
+            assert compactor.stats.summaries == 3 and not compactor._pending
+
+            # A message that makes no new block eligible only touches the speaking viewer
+            scheduled.clear()
+            messages.append(Message.make("Point 12.", "alice"))
+            compactor.compact("bob", messages)
+            assert scheduled == ["bob"]
+
+            # Edits outside the summaries keep them; an edit inside marks every chain dirty
+            messages[10].content = "Recent edit."
+            compactor.compact("bob", messages)
+            assert compactor.stats.resets == 0
+            messages[1].content = "Rewritten."
+            compactor.compact("bob", messages)
+            await compactor.wait()
+
+        asyncio.run(scenario())
+        assert compactor.stats.resets == 3 and compactor.stats.summaries == 6
+        assert all("Rewritten." in compactor._chains[viewer].summary for viewer in viewers)
+
+    def test_debate_prompt_stays_bounded(self):
+        from agents.compaction import ExtractiveSummarizer, HistoryCompactor
+        from models.simulated import SimulatedLLM, SimulationProfile
+
+        class MeasuringLLM(SimulatedLLM):
+            largest = 0
+
+            async def _acreate(self, api_params):
+                self.largest = max(self.largest, len(api_params["messages"]))
+                return await super()._acreate(api_params)
+
+        def run(compactor):
+            llm = MeasuringLLM(SimulationProfile(verdict_probability=0.0), seed=3, time_scale=0)
+            debate = TestSimulatedLLM.make_debate(llm, 3)
+            debate.max_messages = 60
+            debate.history_compactor = compactor
+            debate.run_debate()
+            return llm.largest, debate
+
+        full, _ = run(None)
+        compactor = HistoryCompactor(ExtractiveSummarizer(), keep_recent=8, block_size=4)
+        bounded, debate = run(compactor)
+        assert full > 40
+        assert bounded <= 2 * (8 + 4 + 1) + 2
+        assert compactor.stats.summaries > 0 and not compactor._tasks
+
+    def test_llm_summaries_are_charged_to_the_budget(self):
+        from agents.budget import DebateBudget, conversation_scope
+        from agents.compaction import HistoryCompactor, LLMSummarizer
+        from models.simulated import SimulatedLLM
+        from telemetry.tracing import MetricsTracer, reset_tracer, use_tracer
+        llm = SimulatedLLM(seed=1, time_scale=0)
+        compactor = HistoryCompactor(LLMSummarizer(llm), keep_recent=4, block_size=4)
+        budget = DebateBudget()
+        tracer = MetricsTracer()
+
+        async def scenario():
+            token = use_tracer(tracer)
+            try:
+                with conversation_scope(budget):
+                    compactor.compact("alice", self.history(12))
+                    await compactor.wait()
+            finally:
+                reset_tracer(token)
+
+        asyncio.run(scenario())
+        assert compactor.stats.summaries == 1 and budget.calls == llm.stats.requests == 1
+        assert budget.tokens_used > 0
+        summarizer_tokens = sum(value for (name, labels), value in tracer.counters.items()
+                                if name == "tokens" and ("speaker", "summarizer") in labels)
+        assert summarizer_tokens == budget.tokens_used
+
+
+
+class TestGoalCompaction:
+    """Tests for collapsing completed goals into outcome records."""
+
+    @staticmethod
+    def run(compact):
+        from models.simulated import SimulatedLLM, SimulationProfile
+
+        class MeasuringLLM(SimulatedLLM):
+            sizes = None
+
+            async def _acreate(self, api_params):
+                self.sizes = (self.sizes or []) + [len(str(api_params["messages"]))]
+                return await super()._acreate(api_params)
+
+        llm = MeasuringLLM(SimulationProfile(malformed_probability=0.1, withdraw_probability=0.5,
+                                             verdict_probability=0.5), seed=11, time_scale=0)
+        debate = TestSimulatedLLM.make_debate(llm, 4)
+        debate.compact_goal_history = compact
+        return debate, debate.run_debate(), llm.sizes
+
+    def test_completed_goal_collapses_into_outcome(self):
+        full, full_result, full_sizes = self.run(False)
+        compact, result, sizes = self.run(True)
+
+        first = compact.goal_outcomes[0]
+        assert first.goal_name == "first" and sum(first.verdict_counts.values()) == 3
+        assert first.archived_messages[0].speaker == "coordinator"
+        assert len(first.archived_messages) == first.message_count
+        assert compact.messages[0].content.startswith("📌 GOAL OUTCOME: 'first'")
+        assert "GOAL COMPLETED" in compact.messages[1].content
+        assert all(f"- {name}: {first.verdicts[name]['verdict']}" in compact.messages[0].content
+                   for name in ["Alice", "Bob", "Cara"])
+        assert result['goal_outcomes'][0] == first.to_dict()
+
+        # Identical until the transition, then the prompt restarts from the outcome record
+        transition = next(i for i, (a, b) in enumerate(zip(sizes, full_sizes)) if a != b)
+        assert transition > 10
+        assert sizes[transition] < full_sizes[transition] / 3
+
+        # The default keeps the full history and archives nothing
+        without_seconds = TestSimulatedLLM.without_seconds
+        assert without_seconds(full_result)['goal_outcomes'][0] == without_seconds(result)['goal_outcomes'][0]
+        assert not full.goal_outcomes[0].archived_messages
+        assert not any(m.content.startswith("📌") for m in full.messages)
+
+    def test_outcomes_survive_resume(self, tmp_path):
+        def make_debate(crash_after=None):
+            debate = TestJournal.make_debate(crash_after)
+            debate.compact_goal_history = True
+            return debate
+
+        reference = make_debate()
+        reference.run_debate()
+        path = str(tmp_path / "debate.journal")
+        crashed = make_debate(crash_after=15)  # past the first goal's transition
+        with pytest.raises(SimulatedCrash):
+            crashed.resume(path)
+        assert len(crashed.goal_outcomes) == 1
+
+        resumed = make_debate()
+        resumed.resume(path)
+        archived = [(m.speaker, m.content) for m in resumed.goal_outcomes[0].archived_messages]
+        assert archived and archived == [(m.speaker, m.content) for m in reference.goal_outcomes[0].archived_messages]
+        assert resumed.goal_outcomes[0].seconds == crashed.goal_outcomes[0].seconds > 0
+        assert TestJournal.transcript(resumed) == TestJournal.transcript(reference)
+
+
+class TestGoalEpochs:
+    """Tests for epoch-tagged history masked at render time."""
+
+    def test_transitions_mask_views_not_messages(self):
+        debate, _, _ = TestGoalCompaction.run(False)
+        transition = next(i for i, m in enumerate(debate.messages) if "GOAL COMPLETED" in m.content)
+        assert {m.epoch for m in debate.messages[:transition]} == {0}
+        assert {m.epoch for m in debate.messages[transition:]} == {1}
+
+        # The record keeps the original verdicts and withdrawals, untouched
+        earlier = debate.messages[:transition]
+        assert any("<Withdrawn>true</Withdrawn>" in m.content for m in earlier)
+        assert any("<VerdictReasoning>" in m.content for m in earlier)
+        assert all(m.revision == 0 for m in earlier)
+
+        view = debate.history_view()
+        assert view[transition:] == debate.messages[transition:]
+        assert not any("<Verdict>" in m.content or "<Withdrawn>true" in m.content
+                       for m in view[:transition] if m.speaker != "coordinator")
+        assert [m.id for m in view] == [m.id for m in debate.messages]
+        assert all(a is b for a, b in zip(debate.history_view(), view))
+
+        # Editing an earlier message updates its cached view in place
+        edited = next(i for i, m in enumerate(earlier) if m.speaker != "coordinator")
+        masked = view[edited]
+        debate.messages[edited].content += "<Verdict>REJECT</Verdict> Addendum."
+        assert debate.history_view()[edited] is masked
+        assert masked.revision == 1 and masked.content.endswith(" Addendum.")
+        assert "<Verdict>" not in masked.content
+
+
+class TestBackgroundModeration:
+    """Tests for moderation reviews running alongside the debate."""
+
+    @staticmethod
+    def run(budget=None, review_lag=None, **watcher_kwargs):
+        """
+        Run a moderated debate. With `review_lag`, every background review takes exactly that
+        many debate messages: its result is held until the debate gets there, and the debate
+        waits there for the result, so timing does not depend on event-loop scheduling.
+        """
+        from models.simulated import SimulatedLLM, SimulationProfile
+        from watchers.moderators import ModerationWatcher
+
+        class FastModerationWatcher(ModerationWatcher):
+            _due = None
+
+            def _create_meta_debate(self, orchestrator_api, *args, **kwargs):
+                meta_debate = super()._create_meta_debate(orchestrator_api, *args, **kwargs)
+                meta_debate.turn_delay = 0
+                if review_lag is not None:
+                    reached = asyncio.Event()
+                    self._due = (orchestrator_api.debate_messages_count() + review_lag, reached)
+                    run_debate_async = meta_debate.run_debate_async
+
+                    async def lagged_run(*run_args, **run_kwargs):
+                        results = await run_debate_async(*run_args, **run_kwargs)
+                        await reached.wait()
+                        return results
+                    meta_debate.run_debate_async = lagged_run
+                return meta_debate
+
+            async def acall(self, current_speaker, orchestrator_api):
+                if self._due is not None and orchestrator_api.debate_messages_count() >= self._due[0]:
+                    self._due[1].set()
+                    self._due = None
+                    await self.wait()
+                await super().acall(current_speaker, orchestrator_api)
+
+        llm = SimulatedLLM(SimulationProfile(verdict_probability=0.0), seed=3, time_scale=0)
+        moderators = SimulatedLLM(SimulationProfile(verdict_probability=1.0, withdraw_probability=1.0,
+                                                    malformed_probability=0.0,
+                                                    verdict_weights={"FIRM_CORRECTION": 1.0}),
+                                  seed=5, time_scale=0)
+        debate = TestSimulatedLLM.make_debate(llm, 3)
+        debate.max_messages = 30
+        debate.budget = budget
+        watcher = FastModerationWatcher(moderators, check_interval=6, **watcher_kwargs)
+        debate.watchers.append(watcher)
+        debate.run_debate()
+        interventions = [i for i, m in enumerate(debate.messages) if "Moderation (FIRM_CORRECTION)" in m.content]
+        return watcher, interventions
+
+    def test_debate_continues_during_review(self):
+        inline, inline_positions = self.run(background=False)
+        assert inline_positions[:2] == [6, 12]
+
+        watcher, positions = self.run(review_lag=3)
+        assert watcher.stats.interventions == len(positions) >= 3
+        # The review started on the last message was cancelled when the debate ended
+        assert watcher.stats.reviews == watcher.stats.interventions + watcher.stats.cancelled
+        # Each review covers the first 6k messages, but the debate moved on while it ran
+        assert all(position > 6 * (k + 1) for k, position in enumerate(positions))
+        assert watcher._review is None
+
+    def test_results_past_default_staleness_are_dropped(self):
+        # max_staleness defaults to check_interval (6): a review finishing 6 messages on still applies
+        watcher, positions = self.run(review_lag=6)
+        assert positions and watcher.stats.stale == 0
+
+        # One message later its FIRM_CORRECTION is dropped rather than injected into the debate
+        watcher, positions = self.run(review_lag=7)
+        assert positions == [] and watcher.stats.interventions == 0
+        assert watcher.stats.stale == watcher.stats.reviews - watcher.stats.cancelled > 0
+
+    def test_late_results_are_dropped(self):
+        watcher, positions = self.run(review_lag=3, max_staleness=0)
+        assert positions == []
+        assert watcher.stats.stale > 0 and watcher.stats.interventions == 0
+        assert watcher.stats.reviews == watcher.stats.stale + watcher.stats.cancelled
+
+    def test_reviews_only_receive_new_messages(self):
+        from agents.agent_system import AgentOrchestratorAPI
+        from watchers.moderators import ModerationWatcher
+        debate = TestSimulatedLLM.make_debate(MagicMock(), 1)
+        api = AgentOrchestratorAPI(debate)
+        watcher = ModerationWatcher(MagicMock())
+        for i in range(6):
+            api.inject_message(f"Point {i}.", ["alice", "bob", "cara"][i % 3])
+
+        first = watcher._unreviewed(api)
+        first_log = watcher._review_log(first)
+        assert len(first) == 6 and "Point 0." in first_log
+        asyncio.run(watcher._update_summary(first))
+
+        api.inject_message("Point 6.", "alice")
+        api.inject_message("Aside.", "coordinator", insert_at=2)
+        new_messages = watcher._unreviewed(api)
+        log = watcher._review_log(new_messages)
+        assert [m.content for m in new_messages] == ["Point 6."]
+        summary, recent = log.split("MESSAGES SINCE THE LAST REVIEW:")
+        assert "Point 0." in summary and "Point 6." not in summary
+        assert "Point 6." in recent and "Point 5." not in recent
+        assert watcher.stats.tokens_saved == watcher._log_chars // 4 - len(log) // 4
+
+
+class TestModerationVote:
+    """Tests for single-shot moderator votes."""
+
+    class VotingLLM:
+        def __init__(self, verdicts):
+            self.verdicts = verdicts
+            self.active = self.peak = 0
+
+        async def acall(self, speaker, messages, stop_sequences=None):
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0)
+            self.active -= 1
+            return Message.parse_from_response(
+                f"<Message><Speaker>{speaker}</Speaker><SpeakingTo>All</SpeakingTo><Content>Reviewed.\n"
+                f"<Verdict>{self.verdicts[speaker]}</Verdict>\n"
+                f"<VerdictReasoning>{speaker} says refocus.</VerdictReasoning></Content></Message>")
+
+    def test_votes_are_cast_concurrently_and_tallied(self):
+        from watchers.moderators import ModerationWatcher
+        llm = self.VotingLLM({"Process Monitor": "FIRM_CORRECTION", "Quality Assessor": "FIRM_CORRECTION"})
+        watcher = ModerationWatcher(llm, mode="vote")
+        intervention = watcher.extract_intervention_from_meta_results(asyncio.run(watcher._vote("log")))
+        assert llm.peak == 2
+        assert intervention == "🔴 Moderation (FIRM_CORRECTION): Process Monitor says refocus. | Quality Assessor says refocus."
+
+        # An invalid vote abstains but still counts towards the majority
+        llm.verdicts["Quality Assessor"] = "MAYBE"
+        assert watcher.extract_intervention_from_meta_results(asyncio.run(watcher._vote("log"))) is None
+
+    def test_vote_mode_in_debate(self):
+        from watchers.moderators import create_quick_moderation_watcher
+        with pytest.raises(ValueError):
+            create_quick_moderation_watcher(MagicMock(), mode="poll")
+
+        watcher, positions = TestBackgroundModeration.run(background=False, mode="vote")
+        assert positions[:2] == [6, 12]
+        assert watcher.llm.stats.requests == 2 * watcher.stats.reviews
+
+
+class TestModerationPreScreen:
+    """Tests for the local pre-screen in front of moderation reviews."""
+
+    def test_heuristic_signals(self):
+        from agents.agent_system import AgentOrchestratorAPI
+        from watchers.prescreen import HeuristicPreScreen
+        debate = TestSimulatedLLM.make_debate(MagicMock(), 1)
+        api = AgentOrchestratorAPI(debate)
+        screen = HeuristicPreScreen(threshold=0.5)
+
+        def add(*contents):
+            start = len(debate.messages)
+            for i, content in enumerate(contents):
+                api.inject_message(content, ["alice", "bob", "cara"][i % 3])
+            return screen.screen(api, debate.messages[start:])
+
+        on_topic = ["The candidate shows real strength in distributed systems design.",
+                    "Testing discipline stands out; the candidate writes thorough suites.",
+                    "Leadership evidence is thin, though the candidate mentored two juniors.",
+                    "Compensation expectations fit the band for this candidate.",
+                    "References praise the candidate's ownership during incident response.",
+                    "Overall evaluation: solid hire with some growth areas in planning."]
+        calm = add(*on_topic)
+        assert not calm.run_review and calm.score < 0.5
+
+        drift = add("Football scores tonight were amazing!", "Who watched yesterday's match highlights?")
+        assert drift.run_review and drift.signals["off_topic"] == 1.0
+
+        echo = add(on_topic[0], on_topic[1])
+        assert echo.signals["repetition"] == 1.0
+
+        debate.rejection_count += 2
+        rejected = add("The candidate evaluation continues with fresh angles and careful nuance.")
+        assert rejected.signals["rejections"] == 1.0
+
+        rambling = add("The candidate " + "evaluation detail " * 200)
+        assert rambling.signals["length"] == 1.0
+        assert screen.stats.screened == 5 and screen.stats.skipped == 1
+
+    def test_skipped_checks_make_no_calls(self):
+        from watchers.prescreen import HeuristicPreScreen
+        watcher, positions = TestBackgroundModeration.run(background=False, mode="vote",
+                                                          prescreen=HeuristicPreScreen(threshold=1.01))
+        assert positions == [] and watcher.llm.stats.requests == 0
+        assert watcher.stats.skipped == watcher.prescreen.stats.skipped == watcher.prescreen.stats.screened > 0
+        assert watcher._summary
+
+        # Audited skips run anyway and measure how often skipping was right
+        watcher, positions = TestBackgroundModeration.run(background=False, mode="vote",
+                                                          prescreen=HeuristicPreScreen(threshold=1.01,
+                                                                                       audit_probability=1.0))
+        stats = watcher.prescreen.stats
+        assert stats.audited == stats.ran == watcher.stats.reviews == len(positions) > 0
+        assert stats.misses == stats.disagreed == len(positions) and stats.agreement_rate == 0.0
+
+
+
+class TestModerationBudget:
+    """Tests for the spending budget shared with nested meta-debates."""
+
+    def test_plan_degrades_as_budget_runs_out(self):
+        from agents.budget import DebateBudget, charge_usage, conversation_depth, conversation_scope, current_budget
+        budget = DebateBudget(max_tokens=100)
+        assert budget.plan(1) == "full"
+        budget.charge({"input_tokens": 40, "output_tokens": 20})
+        assert budget.plan(1) == "short"
+        budget.charge({"input_tokens": 25, "cache_read_input_tokens": 0})
+        assert budget.plan(1) == "vote"
+        budget.charge({"output_tokens": 15})
+        assert budget.plan(1) == "skip" and budget.exhausted() and budget.calls == 3
+
+        nested = DebateBudget(max_depth=2)
+        assert nested.plan(1) == "full" and nested.plan(2) == "vote"
+
+        message = Message.make("Hi", "alice")
+        message.usage = {"input_tokens": 7, "output_tokens": 3}
+        charge_usage(message)  # no current budget: nothing to charge
+        with conversation_scope(nested):
+            with conversation_scope(current_budget()):
+                assert conversation_depth() == 2
+                charge_usage(message)
+        assert conversation_depth() == 0 and nested.tokens_used == 10 and nested.started is not None
+
+    def test_nested_moderators_vote_at_max_depth(self):
+        from agents.budget import DebateBudget
+        from watchers.moderators import ModerationWatcher
+        budget = DebateBudget(max_depth=2)
+        meta_watcher = ModerationWatcher(MagicMock(), check_interval=1, background=False)
+        calls = []
+
+        async def vote(debate_log):
+            calls.append(debate_log)
+            return {'verdicts': {}}
+        meta_watcher._vote = vote
+
+        watcher, positions = TestBackgroundModeration.run(budget, background=False, meta_watchers=[meta_watcher])
+        assert positions and watcher.stats.shortened == watcher.stats.voted == 0
+        # Meta-debates run at depth 2, so their own moderators could not nest another one
+        assert meta_watcher.stats.voted == meta_watcher.stats.reviews == len(calls) > 0
+        assert budget.degraded == {"vote": len(calls)} and budget.calls > 0
+
+    def test_exhausted_budget_skips_reviews_not_the_debate(self):
+        from agents.budget import DebateBudget
+        budget = DebateBudget(max_tokens=1, stop_debate=False)
+        watcher, positions = TestBackgroundModeration.run(budget, background=False)
+        assert positions == [] and watcher.llm.stats.requests == 0
+        assert watcher.stats.over_budget == budget.degraded["skip"] > 0 and watcher.stats.reviews == 0
+        assert watcher._summary
+
+
+
+class TestSimultaneousRounds:
+    """Tests for rounds in which every active participant responds at once."""
+
+    class PanelLLM(BaseModel):
+        """Answers later agents faster, so arrival order is the reverse of agent order."""
+
+        def __init__(self, delays):
+            self.delays = delays
+            self.active = self.peak = 0
+            self.history_lengths = []
+
+        async def acall(self, speaker, messages, stop_sequences=None):
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.history_lengths.append(len(messages))
+            await asyncio.sleep(self.delays[speaker])
+            self.active -= 1
+            return Message.parse_from_response(
+                f"<Message><Speaker>{speaker}</Speaker><SpeakingTo>All</SpeakingTo>"
+                f"<Content>{speaker} weighs in.</Content></Message>")
+
+        def __call__(self, speaker, messages, stop_sequences=None):
+            return asyncio.run(self.acall(speaker, messages, stop_sequences))
+
+    def test_round_generates_concurrently_and_appends_in_agent_order(self):
+        llm = self.PanelLLM({"alice": 0.03, "bob": 0.02, "cara": 0.01})
+        debate = TestSimulatedLLM.make_debate(MagicMock(), 1)
+        debate.llm = llm
+        debate.simultaneous_rounds = True
+        debate.max_messages = 4
+        debate.run_debate()
+
+        assert [m.speaker for m in debate.messages] == ["coordinator", "alice", "bob", "cara"]
+        assert llm.peak == 3 and len(set(llm.history_lengths)) == 1
+
+    def test_round_debate_keeps_withdrawals_and_whispers(self):
+        from models.simulated import SimulatedLLM, SimulationProfile
+
+        class RecordingLLM(SimulatedLLM):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.requests = []
+
+            async def _acreate(self, api_params):
+                request = str(api_params)
+                prefill = api_params["messages"][-1]["content"]
+                speaker = prefill.rsplit("<Speaker>", 1)[1].split("</Speaker>", 1)[0]
+                self.requests.append((speaker, request, self.debate.agents[speaker].has_withdrawn))
+                return await super()._acreate(api_params)
+
+        def run():
+            llm = RecordingLLM(SimulationProfile(withdraw_probability=0.4, verdict_probability=0.6,
+                                                 whisper_probability=0.5), seed=2, time_scale=0)
+            debate = llm.debate = TestSimulatedLLM.make_debate(llm, 1)
+            debate.simultaneous_rounds = True
+            result = debate.run_debate()
+            return debate, result
+
+        debate, result = run()
+        assert debate.completed_goals and debate.goal_outcomes[0].seconds > 0
+        assert TestJournal.transcript(run()[0]) == TestJournal.transcript(debate)
+
+        # Withdrawn participants sit out the rest of the goal
+        assert not any(withdrawn for _, _, withdrawn in debate.llm.requests)
+        assert len(debate.llm.requests) < debate.message_count
+
+        # Whispers only reach the prompts of their two participants
+        whispers = [m for m in debate.messages if m.is_whisper]
+        assert whispers
+        for speaker, request, _ in debate.llm.requests:
+            for whisper in whispers:
+                if speaker not in (whisper.speaker, whisper.speaking_to.lower()):
+                    assert whisper.content not in request
+
+
+
+class TestAgentRegistry:
+    """Tests for the indexed agent registry and weighted speaker sampling."""
+
+    def test_fenwick_find_matches_bisect(self):
+        import bisect
+        import itertools
+        import random
+        from agents.registry import FenwickTree
+        rng = random.Random(0)
+        weights = [rng.choice([0, 0, 1, 2, 5, 9]) for _ in range(37)]
+        tree = FenwickTree()
+        for weight in weights:
+            tree.append(weight)
+        for _ in range(20):
+            weights[index := rng.randrange(len(weights))] = rng.randrange(10)
+            tree.set(index, weights[index])
+        cumulative = list(itertools.accumulate(weights))
+        assert tree.total == cumulative[-1] and tree.prefix_sum(10) == cumulative[9]
+        for target in [0, 0.5, 1, cumulative[-1] - 0.5] + [rng.random() * cumulative[-1] for _ in range(200)]:
+            assert tree.find(target) == bisect.bisect_right(cumulative, target)
+
+    def test_sampling_matches_random_choices(self):
+        import random
+        debate = TestSimulatedLLM.make_debate(MagicMock(), 1)
+        debate.setup_agents([Persona(f"Agent{i}", "Reviewer", "Hiring", "Decisive", "Brief") for i in range(60)])
+        rng = random.Random(5)
+        for name in debate.get_active_agents()[::7]:
+            debate.agents[name].has_withdrawn = True
+        for name in debate.get_active_agents():
+            debate.agents[name].message_count = rng.randrange(15)
+
+        active = debate.get_active_agents()
+        assert len(active) == 54 and active == sorted(active, key=list(debate.agents).index)
+        for seed in range(300):
+            excluded, boosted = rng.sample(active, 2)
+            weights = [0 if name == excluded else max(1, 10 - debate.agents[name].message_count) * (3 if name == boosted else 1)
+                       for name in active]
+            expected = random.Random(seed).choices(active, weights=weights)[0]
+            overrides = {excluded: 0, boosted: debate.agents.speaking_weight(boosted) * 3}
+            assert debate.agents.sample(random.Random(seed), overrides) == expected
+        # Overrides never bring back a withdrawn agent
+        assert debate.agents.sample(rng, {name: 0 for name in active} | {"alice": 100}) is None
+
+    def test_indexes_follow_state_changes(self):
+        debate = TestSimulatedLLM.make_debate(MagicMock(), 1)
+        alice = debate.agents["alice"]
+        alice.custom_data["verdict"] = "GOOD_FIT"
+        debate.agents["bob"].has_withdrawn = True
+        assert debate.get_participants_without_verdicts() == ["cara"]
+        assert debate.get_active_agents() == ["alice", "cara"] and debate.agents.speaking_weight("bob") == 0
+
+        alice.message_count = 4
+        assert debate.agents.speaking_weight("alice") == 6
+        import copy
+        state = copy.deepcopy(debate.state_dict())
+        alice.custom_data.pop("verdict")
+        debate.agents["cara"].has_withdrawn = True
+        debate.agents["alice"].has_withdrawn = True
+        assert debate.all_agents_withdrawn() and debate.generate_next_speaker("coordinator") is None
+
+        debate.load_state_dict(state)
+        assert debate.get_active_agents() == ["alice", "cara"]
+        assert debate.get_participants_without_verdicts() == ["cara"]
+
+
+class TestSpeakerPolicies:
+    """Tests for pluggable next-speaker policies."""
+
+    def test_round_robin_cycles_in_join_order(self):
+        import copy
+        from agents.scheduling import RoundRobinPolicy
+        debate = TestSimulatedLLM.make_debate(MagicMock(), 1)
+        debate.speaker_policy = RoundRobinPolicy()
+        assert [debate.generate_next_speaker("coordinator") for _ in range(4)] == ["alice", "bob", "cara", "alice"]
+
+        debate.agents["bob"].has_withdrawn = True
+        state = copy.deepcopy(debate.state_dict())
+        assert [debate.generate_next_speaker("alice") for _ in range(3)] == ["cara", "alice", "cara"]
+
+        # The coordinator still intervenes on schedule, and the pointer is restored with the conversation
+        debate.load_state_dict(state)
+        debate.message_count = debate.coordinator_config.intervention_interval
+        assert debate.generate_next_speaker("alice") == "coordinator"
+        assert debate.generate_next_speaker("coordinator") == "cara"
+
+    def test_verdict_pending_first(self):
+        from agents.scheduling import VerdictPendingFirstPolicy
+        debate = TestSimulatedLLM.make_debate(MagicMock(), 2)
+        debate.speaker_policy = VerdictPendingFirstPolicy()
+        debate.agents["alice"].custom_data["verdict"] = "GOOD_FIT"
+        picks = {debate.generate_next_speaker("coordinator") for _ in range(50)}
+        assert picks == {"bob", "cara"}
+        # The last speaker yields while another participant is pending
+        assert {debate.generate_next_speaker("bob") for _ in range(20)} == {"cara"}
+
+        debate.agents["bob"].custom_data["verdict"] = "GOOD_FIT"
+        debate.agents["cara"].custom_data["verdict"] = "NO_FIT"
+        assert {debate.generate_next_speaker("coordinator") for _ in range(50)} == {"alice", "bob", "cara"}
+
+    def test_urgency_aware_escalates(self):
+        import random
+        from agents.scheduling import UrgencyAwarePolicy
+        debate = TestSimulatedLLM.make_debate(MagicMock(), 3)
+        policy = UrgencyAwarePolicy()
+        debate.agents["alice"].custom_data["verdict"] = "GOOD_FIT"
+        debate.agents["bob"].custom_data["verdict"] = "GOOD_FIT"
+
+        # No urgency yet: exactly the default choice
+        assert debate.get_timekeeper_urgency_level() == "remind"
+        for seed in range(20):
+            debate.rng = random.Random(seed)
+            expected = debate.speaker_policy.choose(debate, "alice")
+            debate.rng = random.Random(seed)
+            assert policy.choose(debate, "alice") == expected
+
+        def share_of_cara(level_threshold):
+            debate.message_count = level_threshold
+            debate.rng = random.Random(0)
+            return sum(policy.choose(debate, "coordinator") == "cara" for _ in range(300)) / 300
+
+        config = debate.timekeeper_config
+        insist, demand = share_of_cara(config.insist_threshold), share_of_cara(config.demand_threshold)
+        assert 0.45 < insist < demand < 1.0
+        assert share_of_cara(config.force_verdict_threshold) == 1.0
+
+    def test_simulated_decided_participants_withdraw(self):
+        from models.simulated import SimulatedLLM, SimulationProfile
+        llm = SimulatedLLM(SimulationProfile(verdict_probability=0.3, withdraw_probability=0.0,
+                                             decided_withdraw_probability=1.0, malformed_probability=0.0),
+                           seed=4, time_scale=0)
+        debate = TestSimulatedLLM.make_debate(llm, 4)
+        debate.run_debate()
+
+        assert len(debate.completed_goals) == 2
+        for name in ["Alice", "Bob", "Cara"]:
+            decided = False
+            for message in debate.messages:
+                if message.speaker != name:
+                    continue
+                if decided:
+                    # The turn after a verdict restates it and withdraws
+                    assert "<Withdrawn>true</Withdrawn>" in message.content
+                    decided = False
+                elif "<Verdict>" in message.content and "<Withdrawn>true" not in message.content:
+                    decided = True
+
+
+class TestConsensusDetector:
+    """Tests for closing goals early on a stable agreement."""
+
+    def test_thresholds(self):
+        from agents.consensus import ConsensusDetector
+        detector = ConsensusDetector(window=2)
+        for verdict in ["GOOD_FIT", "GOOD_FIT"]:
+            detector.observe("alice", verdict)
+        detector.observe("bob", "GOOD_FIT")
+        verdicts = {"alice": "GOOD_FIT", "bob": "GOOD_FIT"}
+        assert detector.check(verdicts, set()) is None  # bob has held it for one message only
+        assert detector.check(verdicts, {"bob"}) == "GOOD_FIT"  # a withdrawn verdict is final
+
+        detector.observe("bob", None)  # a message without a verdict breaks the streak
+        detector.observe("bob", "GOOD_FIT")
+        assert detector.check(verdicts, set()) is None
+        detector.observe("bob", "GOOD_FIT")
+        assert detector.check(verdicts, set()) == "GOOD_FIT"
+
+        detector.observe("cara", "REJECT")
+        verdicts["cara"] = "REJECT"
+        assert detector.check(verdicts, set()) is None
+        lenient = ConsensusDetector(window=2, agreement=0.6, stability=0.6)
+        lenient.load_state_dict(detector.state_dict())
+        assert lenient.check(verdicts, set()) == "GOOD_FIT"
+        assert lenient.check({"alice": "GOOD_FIT", "bob": None}, set()) is None
+
+    def test_goals_close_on_consensus(self):
+        from agents.consensus import ConsensusDetector
+        from models.simulated import SimulatedLLM, SimulationProfile
+
+        def run(consensus):
+            llm = SimulatedLLM(SimulationProfile(verdict_probability=0.9, withdraw_probability=0.1,
+                                                 malformed_probability=0.0, verdict_weights={"GOOD_FIT": 1.0}),
+                               seed=3, time_scale=0)
+            debate = TestSimulatedLLM.make_debate(llm, 3)
+            debate.consensus = consensus
+            return llm, debate, debate.run_debate()
+
+        llm, debate, results = run(ConsensusDetector())
+        baseline_llm, _, _ = run(None)
+        assert results["completed_goals"] == ["first", "second"]
+        assert llm.stats.requests < baseline_llm.stats.requests
+        outcomes = results["goal_outcomes"]
+        assert all(outcome["closed_by_consensus"] for outcome in outcomes)
+        assert results["turns_saved_by_consensus"] == sum(o["turns_saved"] for o in outcomes) > 0
+        assert debate.consensus.goals_closed == 2
+        announcements = [m for m in debate.messages if m.content.startswith("⏱️ CONSENSUS REACHED")]
+        assert len(announcements) == 2 and all(m.speaker == "coordinator" for m in announcements)
+
+
+class TestTimeKeeperEscalation:
+    """Tests for TimeKeeper interventions escalating with the debate's length."""
+
+    def test_timekeeper_insists_and_demands_at_thresholds(self):
+        from models.simulated import SimulatedLLM, SimulationProfile
+        llm = SimulatedLLM(SimulationProfile(verdict_probability=0.0, malformed_probability=0.0), seed=1, time_scale=0)
+        debate = TestSimulatedLLM.make_debate(llm, 1)
+        debate.timekeeper_config = debate.coordinator_config = DebateTimeKeeperConfig(
+            intervention_interval=4, insist_threshold=8, demand_threshold=16, force_verdict_threshold=100)
+        debate.max_messages = 24
+        debate.run_debate()
+
+        openings = {"📋 Process Reminder": "remind", "🟡 Verdict Checkpoint": "insist", "🔴 URGENT": "demand"}
+        levels = {}
+        for position, message in enumerate(debate.messages):
+            for opening, level in openings.items():
+                if message.speaker == "coordinator" and message.content.startswith(opening):
+                    levels[position] = level
+        assert set(levels.values()) == {"remind", "insist", "demand"}
+        for position, level in levels.items():
+            expected = "demand" if position >= 16 else "insist" if position >= 8 else "remind"
+            assert level == expected, (position, level)
+
+
+class TestBudgetTermination:
+    """Tests for token, cost and deadline budgets ending debates and driving escalation."""
+
+    def test_limits_and_costs(self):
+        import time
+        from agents.budget import DebateBudget
+        budget = DebateBudget(max_input_tokens=1000, max_output_tokens=100, max_cost=1.0)
+        budget.charge({"input_tokens": 400, "output_tokens": 50, "cache_read_input_tokens": 100})
+        assert (budget.tokens_used, budget.input_tokens_used, budget.output_tokens_used) == (550, 500, 50)
+        assert budget.cost == pytest.approx((400 * 3.0 + 50 * 15.0 + 100 * 0.30) / 1_000_000)
+        shares = budget.remaining_shares()
+        assert shares["input_tokens"] == 0.5 and shares["output_tokens"] == 0.5 and shares["cost"] > 0.99
+        assert budget.remaining() == 0.5 and "$0.0020 of $1" in budget.summary()
+
+        late = DebateBudget(deadline=time.time() - 1)
+        late.start()
+        assert late.exhausted()
+        early = DebateBudget(deadline=time.time() + 3600)
+        early.start()
+        assert early.remaining() > 0.99
+
+    def test_budget_ends_debate_and_escalates(self):
+        from agents.budget import DebateBudget
+        from models.simulated import SimulatedLLM, SimulationProfile
+
+        def run(budget, budget_thresholds=None):
+            llm = SimulatedLLM(SimulationProfile(withdraw_probability=0.1), seed=2, time_scale=0)
+            debate = TestSimulatedLLM.make_debate(llm, 2)
+            debate.budget = budget
+            debate.timekeeper_config = debate.coordinator_config = DebateTimeKeeperConfig(
+                budget_thresholds=budget_thresholds)
+            levels = []
+            content = debate.get_coordinator_message_content
+            debate.get_coordinator_message_content = lambda level, *args: levels.append(level) or content(level, *args)
+            return debate, debate.run_debate(), levels
+
+        debate, results, levels = run(DebateBudget(max_cost=0.5), [0.5, 0.25, 0.1])
+        assert debate.stopped_on_budget and results["budget"]["stopped_debate"]
+        assert results["budget"]["cost"] >= 0.5 and results["budget"]["remaining"] == 0.0
+        order = ["remind", "insist", "demand", "force"]
+        assert [order.index(level) for level in levels] == sorted(order.index(level) for level in levels)
+        assert levels[-1] == "force" and levels[0] == "remind"
+
+        # With stop_debate=False the budget only limits moderation; without a budget, message counts escalate
+        _, unbounded, _ = run(DebateBudget(max_cost=0.5, stop_debate=False), [0.5, 0.25, 0.1])
+        assert not unbounded["budget"]["stopped_debate"] and unbounded["message_count"] > results["message_count"]
+        _, _, count_levels = run(None, [0.5, 0.25, 0.1])
+        assert "force" not in count_levels  # the message-count threshold for force is 50, past max_messages
+
+    def test_exhausted_budget_ends_primary_debate_by_default(self):
+        from agents.budget import DebateBudget
+        from models.simulated import SimulatedLLM, SimulationProfile
+        for budget in (DebateBudget(max_tokens=1), DebateBudget(max_cost=1e-6)):
+            llm = SimulatedLLM(SimulationProfile(verdict_probability=0.0), seed=1, time_scale=0)
+            debate = TestSimulatedLLM.make_debate(llm, 1)
+            debate.budget = budget
+            results = debate.run_debate()
+            # The first generated message spends the whole budget, and the next turn ends the debate
+            assert debate.stopped_on_budget and results["budget"]["stopped_debate"]
+            assert llm.stats.requests == budget.calls == 1 and results["message_count"] < 5
+
+    def test_cost_budget_includes_history_summaries(self):
+        from agents.budget import DebateBudget
+        from agents.compaction import HistoryCompactor, LLMSummarizer
+        from models.simulated import SimulatedLLM, SimulationProfile
+        llm = SimulatedLLM(SimulationProfile(verdict_probability=0.0), seed=3, time_scale=0)
+        summary_llm = SimulatedLLM(seed=4, time_scale=0)
+        debate = TestSimulatedLLM.make_debate(llm, 3)
+        debate.max_messages = 60
+        debate.history_compactor = HistoryCompactor(LLMSummarizer(summary_llm), keep_recent=8, block_size=4)
+        debate.budget = DebateBudget(max_cost=0.4)
+        results = debate.run_debate()
+
+        assert summary_llm.stats.requests > 0 and results["budget"]["stopped_debate"]
+        assert debate.budget.calls == llm.stats.requests + summary_llm.stats.requests
+        assert debate.budget.cost >= 0.4 and results["message_count"] < 60
+
+
 # Integration test that requires real API key
 @pytest.mark.integration
 @pytest.mark.skipif(not os.getenv('ANTHROPIC_API_KEY'), reason="API key not available")